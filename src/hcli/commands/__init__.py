@@ -1,37 +1,49 @@
 from __future__ import annotations
 
+import importlib
+
 import rich_click as click
 
+# command name -> "module:attribute" of its click command or group.
+COMMANDS: dict[str, str] = {
+    "login": "hcli.commands.login:login",
+    "logout": "hcli.commands.logout:logout",
+    "whoami": "hcli.commands.whoami:whoami",
+    "update": "hcli.commands.update:update",
+    "download": "hcli.commands.download:download",
+    "commands": "hcli.commands.commands:commands",
+    "plugin": "hcli.commands.plugin:plugin",
+    # groups
+    "auth": "hcli.commands.auth:auth",
+    "ida": "hcli.commands.ida:ida",
+    "share": "hcli.commands.share:share",
+    "license": "hcli.commands.license:license",
+    "extension": "hcli.commands.extension:extension",
+    "asset": "hcli.commands.asset:asset",
+}
 
-def register_commands(cli: click.Group) -> None:
-    """Register all commands to the CLI group."""
-    from .commands import commands
-    from .download import download
-    from .login import login
-    from .logout import logout
-    from .plugin import plugin
-    from .update import update
-    from .whoami import whoami
-
-    cli.add_command(login)
-    cli.add_command(logout)
-    cli.add_command(whoami)
-    cli.add_command(update)
-    cli.add_command(download)
-    cli.add_command(commands)
-    cli.add_command(plugin)
 
-    # groups
-    from .asset import asset
-    from .auth import auth
-    from .extension import extension
-    from .ida import ida
-    from .license import license
-    from .share import share
-
-    cli.add_command(auth)
-    cli.add_command(ida)
-    cli.add_command(share)
-    cli.add_command(license)
-    cli.add_command(extension)
-    cli.add_command(asset)
+class LazyGroup(click.RichGroup):
+    """A group whose registered commands are imported only when they're looked up.
+
+    Importing every command pulls in most of hcli (API clients, IDA helpers, ...),
+    while a single invocation needs just one of them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: dict[str, str] = {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, _, attribute = self.lazy_commands[cmd_name].partition(":")
+            self.add_command(getattr(importlib.import_module(module_name), attribute), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+def register_commands(cli: LazyGroup) -> None:
+    """Register all commands to the CLI group."""
+    cli.lazy_commands.update(COMMANDS)
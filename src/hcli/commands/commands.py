@@ -7,19 +7,21 @@ from hcli.env import ENV
 from hcli.lib.console import console
 
 
-def collect_all_commands(group: click.Group, parent_path: str = "") -> list[str]:
+def collect_all_commands(group: click.Group, ctx: click.Context, parent_path: str = "") -> list[str]:
     """Recursively collect all command paths from a Click group."""
     commands = []
 
-    for name, command in group.commands.items():
-        if command.hidden:
+    # list/get rather than .commands, so lazily registered commands are included
+    for name in group.list_commands(ctx):
+        command = group.get_command(ctx, name)
+        if command is None or command.hidden:
             continue
 
         current_path = f"{parent_path} {name}".strip()
 
         if isinstance(command, click.Group):
             # It's a group, recurse into it
-            commands.extend(collect_all_commands(command, current_path))
+            commands.extend(collect_all_commands(command, ctx, current_path))
         else:
             # It's a command, add it to the list
             commands.append(current_path)
@@ -35,7 +37,7 @@ def commands(ctx: click.Context):
     if not isinstance(root_group, click.Group):
         console.print("[red]Error: Root command is not a group[/red]")
         return
-    all_commands = collect_all_commands(root_group)
+    all_commands = collect_all_commands(root_group, ctx)
 
     table = Table(title="All Available Commands", show_header=True, header_style="bold blue")
     table.add_column("Command", style="green")
@@ -10,7 +10,6 @@ import hcli.lib.console
 import hcli.lib.ida.plugin.repo
 import hcli.lib.ida.plugin.repo.file
 import hcli.lib.ida.plugin.repo.fs
-import hcli.lib.ida.plugin.repo.github
 from hcli.lib.console import console
 from hcli.lib.ida import get_ida_config
 from hcli.lib.ida.plugin.repo.bundle import PluginBundleRepo, is_plugin_bundle_zip
@@ -104,6 +103,9 @@ def plugin(
             plugin_repo = hcli.lib.ida.plugin.repo.file.JSONFilePluginRepo.from_url(url)
 
         elif repo == "github":
+            # only needed here (it brings in tenacity and the GitHub client), so not imported with every command.
+            from hcli.lib.ida.plugin.repo.github import GithubPluginRepo
+
             try:
                 token = os.environ["GITHUB_TOKEN"]
             except KeyError:
@@ -128,9 +130,7 @@ def plugin(
                     console.print(f"[red]failed to read ignored repos list file[/red]: {e!s}.")
                     raise click.Abort()
 
-            plugin_repo = hcli.lib.ida.plugin.repo.github.GithubPluginRepo(
-                token, extra_repos=extra_repos, ignored_repos=ignored_repos
-            )
+            plugin_repo = GithubPluginRepo(token, extra_repos=extra_repos, ignored_repos=ignored_repos)
 
         else:
             path = Path(repo)
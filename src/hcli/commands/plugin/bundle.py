@@ -32,7 +32,7 @@ from hcli.lib.ida.plugin.repo.bundle import (
     PluginBundleRepo,
     is_plugin_bundle_zip,
 )
-from hcli.lib.ida.python import PIP_OPTIONS_DEFAULT, PipOptions, find_current_python_executable
+from hcli.lib.ida.python import PIP_OPTIONS_DEFAULT, PipOptions, find_current_python_executable, get_pip_env
 
 logger = logging.getLogger(__name__)
 
@@ -366,7 +366,7 @@ def _download_wheelhouse(
     cmd.extend(deps)
 
     logger.debug("pip download: %s", " ".join(cmd))
-    result = subprocess.run(cmd, capture_output=True, check=False)
+    result = subprocess.run(cmd, capture_output=True, check=False, env=get_pip_env())
     if result.returncode != 0:
         stderr_text = result.stderr.decode("utf-8", errors="replace")
         stdout_text = result.stdout.decode("utf-8", errors="replace")
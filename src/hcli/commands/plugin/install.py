@@ -47,7 +47,6 @@ from hcli.lib.ida.plugin.reference import (
 )
 from hcli.lib.ida.plugin.repo import BasePluginRepo, fetch_plugin_archive
 from hcli.lib.ida.plugin.repo.bundle import PluginBundleRepo
-from hcli.lib.ida.plugin.repo.github import fetch_github_release_zip_asset, parse_github_url
 from hcli.lib.ida.plugin.settings import has_plugin_setting, parse_setting_value, set_plugin_setting
 from hcli.lib.ida.python import PIP_OPTIONS_DEFAULT, PipOptions, detect_current_python_version, merge_bundle_pip_options
 
@@ -116,7 +115,8 @@ def install_plugin(ctx, plugin: str, editable: bool, config: tuple[str, ...], no
             items = list(get_metadatas_with_paths_from_plugin_archive(buf))
             if len(items) != 1:
                 raise ValueError("plugin directory must contain a single plugin")
-            plugin_name = items[0][1].plugin.name
+            _, metadata = items[0]
+            plugin_name = metadata.plugin.name
 
         elif Path(plugin_spec).exists() and plugin_spec.endswith(".zip"):
             logger.info("installing from the local file system")
@@ -124,7 +124,8 @@ def install_plugin(ctx, plugin: str, editable: bool, config: tuple[str, ...], no
             items = list(get_metadatas_with_paths_from_plugin_archive(buf))
             if len(items) != 1:
                 raise ValueError("plugin archive must contain a single plugin for local file system installation")
-            plugin_name = items[0][1].plugin.name
+            _, metadata = items[0]
+            plugin_name = metadata.plugin.name
 
         elif plugin_spec.startswith("file://"):
             logger.info("installing from the local file system")
@@ -133,9 +134,12 @@ def install_plugin(ctx, plugin: str, editable: bool, config: tuple[str, ...], no
             items = list(get_metadatas_with_paths_from_plugin_archive(buf))
             if len(items) != 1:
                 raise ValueError("plugin archive must contain a single plugin for local file system installation")
-            plugin_name = items[0][1].plugin.name
+            _, metadata = items[0]
+            plugin_name = metadata.plugin.name
 
         elif is_github_direct_install_url(plugin_spec):
+            from hcli.lib.ida.plugin.repo.github import fetch_github_release_zip_asset, parse_github_url
+
             logger.info("installing from GitHub repository")
             try:
                 owner, repo, tag = parse_github_url(plugin_spec)
@@ -151,7 +155,8 @@ def install_plugin(ctx, plugin: str, editable: bool, config: tuple[str, ...], no
             items = list(get_metadatas_with_paths_from_plugin_archive(buf))
             if len(items) != 1:
                 raise ValueError("plugin archive must contain a single plugin for GitHub installation")
-            plugin_name = items[0][1].plugin.name
+            _, metadata = items[0]
+            plugin_name = metadata.plugin.name
 
         elif plugin_spec.startswith("https://"):
             logger.info("installing from HTTP URL")
@@ -165,7 +170,8 @@ def install_plugin(ctx, plugin: str, editable: bool, config: tuple[str, ...], no
             items = list(get_metadatas_with_paths_from_plugin_archive(buf))
             if len(items) != 1:
                 raise ValueError("plugin archive must contain a single plugin for HTTP URL installation")
-            plugin_name = items[0][1].plugin.name
+            _, metadata = items[0]
+            plugin_name = metadata.plugin.name
 
         else:
             logger.info("finding plugin in repository")
@@ -191,10 +197,8 @@ def install_plugin(ctx, plugin: str, editable: bool, config: tuple[str, ...], no
                     console.print(f"  {format_qualified_plugin_reference(candidate_ref)}")
                 raise click.Abort()
 
-        if not editable:
-            assert buf is not None  # invariant: only the editable branch leaves buf as None
             _, metadata = get_metadata_from_plugin_archive(buf, plugin_name)
-        # else: `metadata` was already populated from the source directory.
+        # every other branch already has the plugin's metadata, from its source directory or from listing the archive.
 
         # Same-name install conflict: another plugin with the same bare name is already
         # installed from a different repository. The install layout is
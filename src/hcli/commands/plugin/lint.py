@@ -241,7 +241,7 @@ def _lint_plugin_archive(zip_data: bytes, source_name: str) -> int:
             logger.debug(m("found metadata path: %s", file_path))
             with zip_file.open(file_path) as f:
                 try:
-                    metadata = IDAMetadataDescriptor.model_validate_json(f.read().decode("utf-8"))
+                    metadata = IDAMetadataDescriptor.model_validate_json(f.read())
                 except ValidationError as e:
                     logger.debug(m("failed to validate metadata: %s", file_path, path=file_path, error=str(e)))
                     console.print(f"[red]Error[/red] ({source_name}): {file_path}: ida-plugin.json validation failed")
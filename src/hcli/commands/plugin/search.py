@@ -7,7 +7,6 @@ from collections.abc import Sequence
 
 import rich.table
 import rich_click as click
-import semantic_version
 
 from hcli.lib.console import console
 from hcli.lib.ida import (
@@ -25,6 +24,7 @@ from hcli.lib.ida.plugin import (
     Platform,
     parse_ida_version,
     parse_plugin_version,
+    parse_plugin_version_spec,
 )
 from hcli.lib.ida.plugin.exceptions import AmbiguousPluginReferenceError
 from hcli.lib.ida.plugin.install import InstalledPluginRecord, find_installed_plugin_in, get_installed_plugin_records
@@ -140,10 +140,11 @@ def output_plugin_versions_table(
 
         status = ""
         if installed_record is not None and existing_version is not None:
-            if parse_plugin_version(metadata.plugin.version) == existing_version:
+            metadata_version = parse_plugin_version(metadata.plugin.version)
+            if metadata_version == existing_version:
                 status = "[green]currently installed[/green]"
 
-            if parse_plugin_version(metadata.plugin.version) > existing_version and is_compatible:
+            if metadata_version > existing_version and is_compatible:
                 status = f"[yellow]upgradable[/yellow] from {existing_version}"
 
         elif not is_compatible:
@@ -156,12 +157,12 @@ def output_plugin_versions_table(
 
 
 def get_matching_versions(plugin: Plugin, version_spec: str) -> list[str]:
-    wanted_spec = semantic_version.SimpleSpec(version_spec)
-    return [
-        version
-        for version, _ in sorted(plugin.versions.items(), key=lambda p: parse_plugin_version(p[0]), reverse=True)
-        if parse_plugin_version(version) in wanted_spec
-    ]
+    wanted_spec = parse_plugin_version_spec(version_spec)
+    # parse each version once, and only sort those that satisfy the spec.
+    versions = [(parse_plugin_version(version), version) for version in plugin.versions]
+    matching = [p for p in versions if p[0] in wanted_spec]
+    matching.sort(key=lambda p: p[0], reverse=True)
+    return [version for _, version in matching]
 
 
 def handle_plugin_name_query(
@@ -175,10 +176,7 @@ def handle_plugin_name_query(
     output_plugin_metadata(get_latest_plugin_metadata(plugin))
     output_plugin_versions_table(
         plugin,
-        [
-            version
-            for version, _ in sorted(plugin.versions.items(), key=lambda p: parse_plugin_version(p[0]), reverse=True)
-        ],
+        sorted(plugin.versions, key=parse_plugin_version, reverse=True),
         current_version,
         current_platform,
         "available versions:",
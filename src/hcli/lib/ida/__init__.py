@@ -389,15 +389,7 @@ def find_standard_windows_installations() -> list[Path]:
     ret: list[Path] = list(_find_windows_installs_from_registry())
 
     base_directory = Path(os.environ.get("ProgramFiles", r"C:\Program Files"))
-    if base_directory.exists():
-        for entry in base_directory.iterdir():
-            if not entry.is_dir():
-                continue
-            if not _is_ida_install_dir_name(entry.name):
-                continue
-            if not is_ida_dir(entry):
-                continue
-            ret.append(entry)
+    ret.extend(_find_ida_installs_in_directory(base_directory))
 
     return _dedupe_paths(ret)
 
@@ -419,8 +411,7 @@ def _find_linux_installs_from_desktop_files() -> list[Path]:
     search_dirs.append(Path("/usr/share/applications"))
 
     for app_dir in search_dirs:
-        if not app_dir.exists():
-            continue
+        # glob() yields nothing for a missing directory, so no existence check is needed.
         for desktop in app_dir.glob("com.hex_rays.IDA.*.desktop"):
             try:
                 text = desktop.read_text(encoding="utf-8", errors="replace")
@@ -444,19 +435,26 @@ def _find_linux_installs_from_desktop_files() -> list[Path]:
 def _find_ida_installs_in_directory(base: Path) -> list[Path]:
     """Find direct child directories whose names match IDA installer naming."""
     ret: list[Path] = []
+    # EAFP: open the directory directly rather than stat-ing it first;
+    # a missing or unreadable base simply yields no installations.
     try:
-        entries = list(base.iterdir()) if base.exists() else []
+        it = os.scandir(base)
     except OSError:
         return ret
 
-    for entry in entries:
-        if not entry.is_dir():
-            continue
-        if not _is_ida_install_dir_name(entry.name):
-            continue
-        if not is_ida_dir(entry):
-            continue
-        ret.append(entry)
+    with it:
+        try:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                if not _is_ida_install_dir_name(entry.name):
+                    continue
+                path = Path(entry.path)
+                if not is_ida_dir(path):
+                    continue
+                ret.append(path)
+        except OSError:
+            pass
     return ret
 
 
@@ -518,20 +516,18 @@ def find_standard_mac_installations() -> list[Path]:
     ret: list[Path] = list(_find_mac_installs_from_spotlight())
 
     for base in (Path("/Applications"), get_user_home_dir() / "Applications"):
-        if not base.exists():
-            continue
-        for entry in base.iterdir():
-            if not entry.is_dir():
-                continue
-            if not _is_ida_install_dir_name(entry.name):
-                continue
-            if not is_ida_dir(entry):
-                continue
-            ret.append(entry)
+        ret.extend(_find_ida_installs_in_directory(base))
 
     return _dedupe_paths(ret)
 
 
+_STANDARD_INSTALLATION_FINDERS: dict[str, Callable[[], list[Path]]] = {
+    "windows": find_standard_windows_installations,
+    "linux": find_standard_linux_installations,
+    "mac": find_standard_mac_installations,
+}
+
+
 def find_standard_installations() -> list[Path]:
     """Find standard IDA installations."""
     ret: list[Path] = []
@@ -542,14 +538,11 @@ def find_standard_installations() -> list[Path]:
         pass
 
     os_ = get_os()
-    if os_ == "windows":
-        ret.extend(find_standard_windows_installations())
-    elif os_ == "linux":
-        ret.extend(find_standard_linux_installations())
-    elif os_ == "mac":
-        ret.extend(find_standard_mac_installations())
-    else:
-        raise ValueError(f"Unsupported operating system: {os_}")
+    try:
+        finder = _STANDARD_INSTALLATION_FINDERS[os_]
+    except KeyError:
+        raise ValueError(f"Unsupported operating system: {os_}") from None
+    ret.extend(finder())
 
     return _dedupe_paths(ret)
 
@@ -626,14 +619,11 @@ def install_ida(installer: Path, install_dir: Path):
 
     try:
         current_os = get_os()
-        if current_os == "mac":
-            _install_ida_mac(installer, install_dir)
-        elif current_os == "linux":
-            _install_ida_unix(installer, install_dir)
-        elif current_os == "windows":
-            _install_ida_windows(installer, install_dir)
-        else:
-            raise ValueError(f"unsupported OS: {current_os}")
+        try:
+            installer_func = _INSTALLERS[current_os]
+        except KeyError:
+            raise ValueError(f"unsupported OS: {current_os}") from None
+        installer_func(installer, install_dir)
     except Exception as e:
         logger.error(f"Installation failed: {e}")
         raise
@@ -744,6 +734,13 @@ def _install_ida_windows(installer: Path, prefix: Path) -> None:
         raise RuntimeError("Installer execution failed")
 
 
+_INSTALLERS: dict[str, Callable[[Path, Path], None]] = {
+    "mac": _install_ida_mac,
+    "linux": _install_ida_unix,
+    "windows": _install_ida_windows,
+}
+
+
 def _get_installer_args(prefix: Path) -> list[str]:
     """Get installer arguments."""
     args = ["--mode", "unattended", "--debugtrace", "debug.log"]
@@ -1083,11 +1080,29 @@ def _clean_env_for_idat() -> dict[str, str]:
     return env
 
 
+# (idat, IDAUSR, script) -> the script's result, for this process.
+# starting idat takes seconds, and a command may need the same answer several times
+# (e.g. explaining the environment and then finding IDA's Python).
+_idapython_results: dict[tuple[Path, Path, str], dict] = {}
+
+
 def run_py_in_current_idapython(src: str) -> dict:
+    """Run the given script in the current IDA's Python, via idat, and return the JSON object it prints.
+
+    The result is remembered for this process, so each script runs in idat at most once.
+    """
     idat_path = find_current_idat_executable()
     if not idat_path.exists():
         raise ValueError(f"can't find idat: {idat_path}")
 
+    key = (idat_path, get_ida_user_dir(), src)
+    if key not in _idapython_results:
+        _idapython_results[key] = _run_py_in_idapython(idat_path, src)
+    return dict(_idapython_results[key])
+
+
+def _run_py_in_idapython(idat_path: Path, src: str) -> dict:
+
     if get_os() == "linux" and "9.2" in str(idat_path.absolute()) and " " in str(idat_path.absolute()):
         logger.warning(
             "invoking idat on IDA 9.2/Linux with a space in the full path, you might encounter HCLI GitHub issue #99"
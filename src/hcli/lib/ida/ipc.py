@@ -137,20 +137,11 @@ class IDAIPCClient:
                     if pid == 0:
                         continue
 
-                    # Try to connect to this PID's socket
+                    # Probe for this PID's pipe. WaitNamedPipeW fails at once for a missing
+                    # pipe and, unlike CreateFileW, doesn't occupy an instance IDA is serving.
                     pipe_name = f"\\\\.\\pipe\\{IDAIPCClient.SOCKET_PREFIX}{pid}"
                     try:
-                        handle = kernel32.CreateFileW(
-                            pipe_name,
-                            0x80000000 | 0x40000000,  # GENERIC_READ | GENERIC_WRITE
-                            0,
-                            None,
-                            3,  # OPEN_EXISTING
-                            0,
-                            None,
-                        )
-                        if handle != -1:
-                            kernel32.CloseHandle(handle)
+                        if kernel32.WaitNamedPipeW(pipe_name, 1):
                             instances.append(IDAInstance(pid=pid, socket_path=pipe_name))
                     except OSError:
                         pass
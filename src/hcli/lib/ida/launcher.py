@@ -8,11 +8,17 @@ from __future__ import annotations
 
 import getpass
 import logging
+import math
 import os
+import select
+import struct
 import subprocess
 import sys
 import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -30,6 +36,10 @@ from hcli.lib.ida.resolve import _idb_names_match
 
 logger = logging.getLogger(__name__)
 
+_IS_WINDOWS = sys.platform == "win32"
+_IS_DARWIN = sys.platform == "darwin"
+_IS_LINUX = sys.platform == "linux"
+
 
 class IDALaunchError(Exception):
     """Failed to launch IDA process."""
@@ -72,6 +82,64 @@ class LaunchConfig:
     backoff_multiplier: float = 1.5
     skip_analysis_wait: bool = False
     analysis_poll_interval: float = 5.0  # seconds between analysis polls
+    idb_search_max_depth: int = 6  # directory levels below a source searched for IDBs
+
+
+class SpawnedProcess:
+    """Minimal ``subprocess.Popen`` stand-in for a child started with ``os.posix_spawnp``.
+
+    Exposes just what the launcher needs: ``pid``, ``returncode`` and ``poll()``.
+    """
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.returncode: int | None = None
+
+    def poll(self) -> int | None:
+        if self.returncode is None:
+            try:
+                pid, status = os.waitpid(self.pid, os.WNOHANG)
+            except ChildProcessError:
+                # Already reaped elsewhere; Popen reports 0 in the same situation.
+                self.returncode = 0
+            else:
+                if pid == self.pid:
+                    self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+
+IDAProcess = subprocess.Popen | SpawnedProcess
+
+
+def _spawn_detached(cmd: list[str]) -> IDAProcess:
+    """Start *cmd* in a new session with stdout/stderr discarded.
+
+    On POSIX this uses ``posix_spawnp``, which creates the child without
+    duplicating hcli's address space first; Windows (and platforms lacking
+    ``POSIX_SPAWN_SETSID``) go through ``subprocess.Popen``.
+    """
+    if not _IS_WINDOWS and hasattr(os, "posix_spawnp"):
+        try:
+            pid = os.posix_spawnp(
+                cmd[0],
+                cmd,
+                os.environ,
+                file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                    (os.POSIX_SPAWN_DUP2, 1, 2),
+                ],
+                setsid=True,
+            )
+            return SpawnedProcess(pid)
+        except NotImplementedError:
+            pass
+
+    return subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
 
 
 @dataclass
@@ -80,20 +148,250 @@ class LaunchResult:
 
     success: bool
     instance: IDAInstance | None = None
-    process: subprocess.Popen | None = None
+    process: IDAProcess | None = None
     error_message: str | None = None
+    # IPC socket/pipe predicted from the spawned IDA's PID (None for 'open -a' launches).
+    expected_socket_path: str | None = None
 
 
 MIN_IPC_VERSION = (9, 4)
 
+# Directories that never hold IDBs worth opening but can be enormous.
+_IDB_SEARCH_SKIP_DIRS = frozenset({"node_modules", "__pycache__"})
+
+
+def _find_idb_in_tree(root: str, name: str, max_depth: int) -> Path | None:
+    """Breadth-first search for a file called *name* beneath *root*.
+
+    Names are compared on the raw ``DirEntry`` before any stat, hidden
+    directories (including VCS metadata) and ``_IDB_SEARCH_SKIP_DIRS`` are
+    pruned, symlinked directories are not followed, and the walk stops
+    *max_depth* levels below *root*. Matching is case-insensitive on
+    Windows and macOS, whose default filesystems are.
+    """
+    case_insensitive = _IS_WINDOWS or _IS_DARWIN
+    wanted = name.lower() if case_insensitive else name
+
+    pending: deque[tuple[str, int]] = deque([(root, 0)])
+    while pending:
+        directory, depth = pending.popleft()
+        try:
+            it = os.scandir(directory)
+        except OSError:
+            continue
+
+        with it:
+            for entry in it:
+                try:
+                    entry_name = entry.name.lower() if case_insensitive else entry.name
+                    if entry_name == wanted and entry.is_file():
+                        return Path(entry.path)
+                    if (
+                        depth < max_depth
+                        and not entry.name.startswith(".")
+                        and entry.name not in _IDB_SEARCH_SKIP_DIRS
+                        and entry.is_dir(follow_symlinks=False)
+                    ):
+                        pending.append((entry.path, depth + 1))
+                except OSError:
+                    continue
+
+    return None
+
+
+# Launch timing history, keyed by IDA binary path: {"ema": seconds, "var": seconds**2}.
+_LAUNCH_TIMING_KEY = "ida.launch.timing"
+_LAUNCH_TIMING_ALPHA = 0.3
+_READY_LEAD_TIME = 0.5  # start probing this long before the expected ready time
+_TIGHT_POLL_INTERVAL = 0.05
+
+
+def _get_launch_timing(key: str) -> tuple[float, float] | None:
+    """Return the recorded ``(ema, var)`` seconds-to-ready for *key*, if any."""
+    timings: dict[str, dict[str, float]] = config_store.get_object(_LAUNCH_TIMING_KEY, {}) or {}
+    entry = timings.get(key)
+    try:
+        ema, var = float(entry["ema"]), float(entry.get("var", 0.0))  # type: ignore[index, union-attr]
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+    if not (math.isfinite(ema) and math.isfinite(var)):
+        return None
+    return ema, var
+
+
+def _load_ready_estimate(key: str, limit: float = math.inf) -> tuple[float, float] | None:
+    """Return ``(mean, stddev)`` seconds-to-ready for *key*, if launches have been recorded.
+
+    Both are capped at *limit* (the wait's timeout), so a skewed or corrupt
+    history can't have the poll loop sleep past the point it would give up.
+    """
+    timing = _get_launch_timing(key)
+    if timing is None:
+        return None
+    ema, var = timing
+    return min(max(ema, 0.0), limit), min(max(var, 0.0) ** 0.5, limit)
+
+
+def _record_ready_time(key: str, seconds: float, limit: float = math.inf) -> None:
+    """Fold an observed seconds-to-ready, capped at *limit*, into the exponentially weighted mean and variance."""
+    seconds = min(seconds, limit)
+    timing = _get_launch_timing(key)
+    if timing is None:
+        ema, var = seconds, 0.0
+    else:
+        ema, var = timing
+        ema = min(ema, limit)
+        delta = seconds - ema
+        ema += _LAUNCH_TIMING_ALPHA * delta
+        var = (1 - _LAUNCH_TIMING_ALPHA) * (var + _LAUNCH_TIMING_ALPHA * delta * delta)
+
+    timings: dict[str, dict[str, float]] = dict(config_store.get_object(_LAUNCH_TIMING_KEY, {}) or {})
+    timings[key] = {"ema": ema, "var": var}
+    config_store.set_object(_LAUNCH_TIMING_KEY, timings)
+
+
+def _clamp_wait(interval: float, start: float, timeout: float) -> float:
+    """*interval*, cut short so that a wait started at monotonic *start* ends by its *timeout*."""
+    return max(min(interval, timeout - (time.monotonic() - start)), 0.0)
+
+
+class _LaunchEventWatcher:
+    """Wake a poll loop as soon as an IPC socket is created or IDA exits.
+
+    On Linux this arms an inotify watch on the socket directory and, when a
+    process is given, a pidfd for it; ``wait()`` blocks in ``select()`` until
+    a socket whose name starts with the IPC prefix is created, the process
+    exits, or the interval elapses. On Windows the process handle is waited
+    on directly. Elsewhere, or when these primitives are unavailable,
+    ``wait()`` degrades to a plain sleep so callers keep their backoff
+    semantics.
+    """
+
+    _IN_MOVED_TO = 0x00000080
+    _IN_CREATE = 0x00000100
+    _IN_NONBLOCK = 0o4000
+    _IN_CLOEXEC = 0o2000000
+    _EVENT_HEADER = struct.Struct("iIII")  # struct inotify_event: wd, mask, cookie, len
+
+    def __init__(
+        self,
+        process: IDAProcess | None = None,
+        watch_sockets: bool = True,
+        directory: str = "/tmp",
+        prefix: str = "ida_ipc_",
+    ):
+        self._process = process
+        self._prefix = prefix.encode()
+        self._inotify_fd: int | None = None
+        self._pidfd: int | None = None
+
+        if not _IS_LINUX:
+            return
+
+        if watch_sockets:
+            self._inotify_fd = self._open_inotify(directory)
+
+        if process is not None and hasattr(os, "pidfd_open"):
+            try:
+                self._pidfd = os.pidfd_open(process.pid)
+            except OSError as e:
+                # ENOSYS on kernels < 5.3, ESRCH if the process is already gone;
+                # either way the caller's poll() still notices the exit.
+                logger.debug(f"pidfd_open unavailable, falling back to polling: {e}")
+
+    def _open_inotify(self, directory: str) -> int | None:
+        try:
+            import ctypes
+
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(self._IN_NONBLOCK | self._IN_CLOEXEC)
+            if fd < 0:
+                return None
+            if libc.inotify_add_watch(fd, os.fsencode(directory), self._IN_CREATE | self._IN_MOVED_TO) < 0:
+                os.close(fd)
+                return None
+            return fd
+        except (OSError, AttributeError) as e:
+            logger.debug(f"inotify unavailable, falling back to polling: {e}")
+            return None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for fd in (self._inotify_fd, self._pidfd):
+            if fd is not None:
+                os.close(fd)
+        self._inotify_fd = None
+        self._pidfd = None
+
+    def wait(self, timeout: float) -> None:
+        """Sleep for up to *timeout* seconds, returning early on a socket or process event."""
+        fds = [fd for fd in (self._inotify_fd, self._pidfd) if fd is not None]
+        if not fds:
+            if _IS_WINDOWS and self._process is not None:
+                self._wait_for_windows_process(timeout)
+            else:
+                time.sleep(timeout)
+            return
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            readable, _, _ = select.select(fds, [], [], remaining)
+            if not readable or self._pidfd in readable or self._drain_events():
+                return
+
+    def _wait_for_windows_process(self, timeout: float) -> None:
+        """Block on the process handle so an exit wakes us immediately."""
+        assert self._process is not None
+        try:
+            import _winapi  # type: ignore[import-not-found]
+
+            # Popen keeps the process handle private; it stays valid until the Popen is reaped.
+            _winapi.WaitForSingleObject(int(self._process._handle), int(timeout * 1000))  # type: ignore[attr-defined, union-attr]
+        except (ImportError, AttributeError, OSError):
+            time.sleep(timeout)
+
+    def _drain_events(self) -> bool:
+        """Consume pending inotify events; return True if any matched the socket prefix."""
+        if self._inotify_fd is None:
+            return False
+        matched = False
+        while True:
+            try:
+                data = os.read(self._inotify_fd, 4096)
+            except BlockingIOError:
+                return matched
+            if not data:
+                return matched
+
+            offset = 0
+            while offset + self._EVENT_HEADER.size <= len(data):
+                _wd, _mask, _cookie, length = self._EVENT_HEADER.unpack_from(data, offset)
+                offset += self._EVENT_HEADER.size
+                if data[offset : offset + length].startswith(self._prefix):
+                    matched = True
+                offset += length
+
 
 class IDALauncher:
     """Manages IDA process lifecycle with robust error handling."""
 
     SOCKET_PREFIX = "ida_ipc_"
+    QUERY_WORKERS = 8  # concurrent IPC queries while waiting for an instance
 
     def __init__(self, config: LaunchConfig | None = None):
         self.config = config or LaunchConfig()
+        self._sources: dict[str, str] | None = None
+        self._ida_bin: Path | None = None
+        self._launch_prefix: list[str] | None = None
+        self._migrate_legacy_sources()
 
     def find_idb_file(self, idb_filename: str, source_name: str = "") -> Path | None:
         """Search configured sources for the IDB file.
@@ -128,29 +426,38 @@ class IDALauncher:
                 continue
 
             # Search recursively for matching filename
-            for idb_path in dir_path_obj.rglob(idb_filename):
-                if idb_path.is_file():
-                    logger.debug(f"Found IDB in source '{name}': {idb_path}")
-                    return idb_path
+            idb_path = _find_idb_in_tree(dir_path, idb_filename, self.config.idb_search_max_depth)
+            if idb_path is not None:
+                logger.debug(f"Found IDB in source '{name}': {idb_path}")
+                return idb_path
 
         logger.debug(f"IDB '{idb_filename}' not found in any source")
         return None
 
     def _get_sources(self) -> dict[str, str]:
-        """Get sources from config, migrating from legacy search-paths if needed."""
-        sources: dict[str, str] = config_store.get_object("idb.sources", {}) or {}
-
-        if not sources and config_store.has("idb.search-paths"):
-            # Migrate legacy search-paths to named sources
-            search_paths: list[str] = config_store.get_object("idb.search-paths", []) or []
-            if search_paths:
-                logger.info("Migrating idb.search-paths to idb.sources")
-                for i, path in enumerate(search_paths, 1):
-                    sources[f"source-{i}"] = path
-                config_store.set_object("idb.sources", sources)
-                config_store.remove_string("idb.search-paths")
-
-        return sources
+        """Get sources from config, cached for the lifetime of the launcher."""
+        if self._sources is None:
+            self._sources = config_store.get_object("idb.sources", {}) or {}
+        return self._sources
+
+    def refresh_sources(self) -> None:
+        """Drop the cached sources and IDA binary so the next lookup re-reads the config."""
+        self._sources = None
+        self._ida_bin = None
+        self._launch_prefix = None
+
+    @staticmethod
+    def _migrate_legacy_sources() -> None:
+        """Migrate legacy idb.search-paths to named idb.sources, once."""
+        if config_store.get_object("idb.sources", {}) or not config_store.has("idb.search-paths"):
+            return
+
+        search_paths: list[str] = config_store.get_object("idb.search-paths", []) or []
+        if search_paths:
+            logger.info("Migrating idb.search-paths to idb.sources")
+            sources = {f"source-{i}": path for i, path in enumerate(search_paths, 1)}
+            config_store.set_object("idb.sources", sources)
+            config_store.remove_string("idb.search-paths")
 
     def get_ida_binary(self) -> Path:
         """Get IDA binary from ida.default/ida.instances config.
@@ -161,6 +468,11 @@ class IDALauncher:
         Raises:
             NoIDAInstallationError: If no IDA installation is configured or found.
         """
+        if self._ida_bin is None:
+            self._ida_bin = self._find_ida_binary()
+        return self._ida_bin
+
+    def _find_ida_binary(self) -> Path:
         # Try ida.instances configuration first
         default_instance = config_store.get_string("ida.default", "")
         instances: dict[str, str] = config_store.get_object("ida.instances", {}) or {}
@@ -188,16 +500,39 @@ class IDALauncher:
             f"No IDA installation configured. Use: {ENV.HCLI_BINARY_NAME} ida instance add --auto"
         )
 
+    @staticmethod
+    def _get_bundle_dir(ida_bin: Path) -> str | None:
+        """Return the macOS bundle directory containing *ida_bin*, if any."""
+        # e.g., /Applications/IDA.app/Contents/MacOS/ida -> /Applications/IDA.app
+        bundle_dir, sep, _ = str(ida_bin).partition("/Contents/MacOS/")
+        return bundle_dir if _IS_DARWIN and sep else None
+
     def _get_ida_dir_from_binary(self, ida_bin: Path) -> Path:
         """Derive the IDA installation directory from the binary path."""
-        if sys.platform == "darwin":
-            # e.g., /Applications/IDA.app/Contents/MacOS/ida -> /Applications/IDA.app
-            ida_bin_str = str(ida_bin)
-            if "/Contents/MacOS/" in ida_bin_str:
-                return Path(ida_bin_str.split("/Contents/MacOS/")[0])
+        bundle_dir = self._get_bundle_dir(ida_bin)
+        if bundle_dir is not None:
+            return Path(bundle_dir)
         # Linux/Windows: binary is directly in the install dir
         return ida_bin.parent
 
+    def _build_launch_command(self, idb_path: Path) -> list[str]:
+        """Build the command line that opens *idb_path* in the configured IDA.
+
+        On macOS, use 'open -a' to launch via LaunchServices, which escapes
+        any sandbox restrictions from protocol handlers. Only works when the
+        bundle is named *.app — otherwise fall back to invoking the binary
+        directly. The result is cached alongside the binary lookup.
+        """
+        if self._launch_prefix is None:
+            ida_bin = self.get_ida_binary()
+            bundle_dir = self._get_bundle_dir(ida_bin)
+            if bundle_dir is not None and bundle_dir.endswith(".app"):
+                # Use -n to force a new instance, --args to pass the IDB path
+                self._launch_prefix = ["open", "-n", "-a", bundle_dir, "--args"]
+            else:
+                self._launch_prefix = [str(ida_bin)]
+        return [*self._launch_prefix, str(idb_path)]
+
     def get_ida_version(self) -> str | None:
         """Get the version string of the configured IDA installation.
 
@@ -246,32 +581,14 @@ class IDALauncher:
             return LaunchResult(success=False, error_message=f"IDB path is not a file: {idb_path}")
 
         try:
-            ida_bin = self.get_ida_binary()
+            cmd = self._build_launch_command(idb_path)
         except NoIDAInstallationError as e:
             return LaunchResult(success=False, error_message=str(e))
 
-        if sys.platform == "darwin":
-            ida_bin_str = str(ida_bin)
-            if "/Contents/MacOS/" in ida_bin_str:
-                app_bundle = ida_bin_str.split("/Contents/MacOS/")[0]
-                if app_bundle.endswith(".app"):
-                    cmd = ["open", "-n", "-a", app_bundle, "--args", str(idb_path)]
-                else:
-                    cmd = [ida_bin_str, str(idb_path)]
-            else:
-                cmd = [ida_bin_str, str(idb_path)]
-        else:
-            cmd = [str(ida_bin), str(idb_path)]
-
         report(f"Command: {' '.join(cmd)}")
 
         try:
-            subprocess.Popen(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                start_new_session=True,
-            )
+            _spawn_detached(cmd)
         except OSError as e:
             return LaunchResult(success=False, error_message=f"Failed to start IDA: {e}")
 
@@ -306,239 +623,321 @@ class IDALauncher:
         if not idb_path.is_file():
             return LaunchResult(success=False, error_message=f"IDB path is not a file: {idb_path}")
 
-        # Get IDA binary
+        # Get the IDA command line
         try:
-            ida_bin = self.get_ida_binary()
+            cmd = self._build_launch_command(idb_path)
         except NoIDAInstallationError as e:
             return LaunchResult(success=False, error_message=str(e))
 
-        # Launch IDA process
-        # On macOS, use 'open -a' to launch via LaunchServices, which escapes
-        # any sandbox restrictions from protocol handlers. Only works when the
-        # bundle is named *.app — otherwise fall back to invoking the binary
-        # directly.
-        if sys.platform == "darwin":
-            # Extract .app bundle path from binary path
-            # e.g., /Applications/IDA.app/Contents/MacOS/ida -> /Applications/IDA.app
-            ida_bin_str = str(ida_bin)
-            if "/Contents/MacOS/" in ida_bin_str:
-                app_bundle = ida_bin_str.split("/Contents/MacOS/")[0]
-                if app_bundle.endswith(".app"):
-                    # Use -n to force a new instance, --args to pass the IDB path
-                    cmd = ["open", "-n", "-a", app_bundle, "--args", str(idb_path)]
-                else:
-                    cmd = [ida_bin_str, str(idb_path)]
-            else:
-                cmd = [ida_bin_str, str(idb_path)]
-        else:
-            cmd = [str(ida_bin), str(idb_path)]
-
         report(f"Command: {' '.join(cmd)}")
         report(f"User: {getpass.getuser()}, CWD: {os.getcwd()}")
 
-        try:
-            subprocess.Popen(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                start_new_session=True,
-            )
-        except OSError as e:
-            return LaunchResult(success=False, error_message=f"Failed to start IDA: {e}")
-
         # Calculate timeout
         total_timeout = (
             timeout if timeout is not None else (self.config.socket_timeout + self.config.idb_loaded_timeout)
         )
 
+        # Launch IDA process
+        timing_key = str(self.get_ida_binary())
+        ready_estimate = _load_ready_estimate(timing_key, total_timeout)
+        launch_start = time.monotonic()
+        try:
+            process = _spawn_detached(cmd)
+        except OSError as e:
+            return LaunchResult(success=False, error_message=f"Failed to start IDA: {e}")
+
+        # With 'open -a' the child is LaunchServices' helper, which exits right away;
+        # only a directly spawned IDA can be health-checked.
+        ida_process = None if cmd[0] == "open" else process
+
         # Wait for IDA instance with our IDB to appear
         # NOTE: matching is by IDB filename only. If another instance with the same
         # filename (from a different source) is already running, it may be matched
         # instead of the newly launched one. This is a known limitation of filename-based
         # matching — full path matching would require IDA IPC to expose the IDB path.
         target_idb_name = idb_path.name
+        expected_socket_path = self._get_expected_socket_path(ida_process.pid) if ida_process else None
         report(f"Waiting for IDA to open {target_idb_name}...")
+        intervals = self._poll_intervals(
+            None if ready_estimate is None else (launch_start + ready_estimate[0], ready_estimate[1])
+        )
         try:
-            instance = self._wait_for_idb_instance(target_idb_name, total_timeout)
-        except IDAStartupTimeout as e:
-            return LaunchResult(success=False, error_message=str(e))
+            if ida_process is not None:
+                instance = self._wait_for_launched_instance(ida_process, target_idb_name, total_timeout, intervals)
+            else:
+                instance = self._wait_for_idb_instance(target_idb_name, total_timeout, intervals=intervals)
+        except (IDAStartupTimeout, IDALaunchError) as e:
+            return LaunchResult(
+                success=False,
+                process=ida_process,
+                error_message=str(e),
+                expected_socket_path=expected_socket_path,
+            )
+        _record_ready_time(timing_key, time.monotonic() - launch_start, total_timeout)
 
         # Wait for auto-analysis to complete (unless skipped)
         if not self.config.skip_analysis_wait:
             report("Waiting for auto-analysis to complete (Ctrl+C to skip)...")
+            # a process that exited cleanly handed off to the IDA that was found, so it isn't watched any more.
+            analysis_process = None if ida_process is not None and ida_process.poll() == 0 else ida_process
             try:
-                self._wait_for_analysis_on_instance(instance.socket_path, report)
+                self._wait_for_analysis(instance.socket_path, analysis_process, report)
             except IDALaunchError as e:
-                return LaunchResult(success=False, error_message=str(e))
+                return LaunchResult(
+                    success=False,
+                    process=ida_process,
+                    error_message=str(e),
+                    expected_socket_path=expected_socket_path,
+                )
             except KeyboardInterrupt:
                 report("Analysis wait cancelled by user")
 
         report("IDA is ready!")
-        return LaunchResult(success=True, instance=instance)
+        return LaunchResult(
+            success=True,
+            instance=instance,
+            process=ida_process,
+            expected_socket_path=expected_socket_path,
+        )
+
+    def _poll_intervals(self, expected_ready: tuple[float, float] | None = None) -> Iterator[float]:
+        """Yield successive sleep intervals for a readiness poll loop.
+
+        Without an estimate this is the configured exponential backoff. Given
+        *expected_ready* as ``(monotonic ready time, standard deviation)`` from
+        earlier launches, it first sleeps until shortly before IDA is expected
+        to be ready, polls tightly through the expected window, and only then
+        falls back to the backoff. Each interval is computed when requested, so
+        an early wakeup re-aims the next sleep at the same target.
+        """
+        if expected_ready is not None:
+            ready_at, spread = expected_ready
+            while (remaining := ready_at - _READY_LEAD_TIME - time.monotonic()) > 0:
+                yield remaining
+            while time.monotonic() < ready_at + 2 * spread:
+                yield _TIGHT_POLL_INTERVAL
+
+        interval = self.config.initial_poll_interval
+        while True:
+            yield interval
+            interval = min(interval * self.config.backoff_multiplier, self.config.max_poll_interval)
+
+    def _wait_for_launched_instance(
+        self,
+        process: IDAProcess,
+        idb_name: str,
+        timeout: float,
+        intervals: Iterator[float] | None = None,
+    ) -> IDAInstance:
+        """Wait for the IDA we spawned to load its IDB, watching only its own socket.
+
+        IDA names its socket after its PID, so there is no need to rescan every
+        instance on each poll. If the predicted socket never answers (e.g. the
+        binary is a wrapper that re-execs), fall back to discovery for whatever
+        time is left. Likewise if the process exits cleanly, as a launcher that
+        hands off to IDA and returns does; only a non-zero exit is a failure.
+        """
+        start = time.monotonic()
+        socket_path = self._get_expected_socket_path(process.pid)
+
+        intervals = intervals or self._poll_intervals()
+
+        try:
+            try:
+                self._wait_for_socket_responsive(
+                    process, socket_path, min(self.config.socket_timeout, timeout), intervals
+                )
+            except IDAStartupTimeout:
+                logger.debug(f"Predicted socket {socket_path} never answered, discovering instances instead")
+                return self._wait_for_idb_instance(
+                    idb_name, max(timeout - (time.monotonic() - start), 0.0), process, intervals
+                )
+
+            return self._wait_for_idb_loaded(
+                process, socket_path, max(timeout - (time.monotonic() - start), 0.0), intervals
+            )
+        except IDALaunchError as e:
+            if e.exit_code != 0:
+                raise
+
+            logger.debug(f"Launched process {process.pid} exited cleanly, discovering instances instead")
+            return self._wait_for_idb_instance(
+                idb_name, max(timeout - (time.monotonic() - start), 0.0), None, intervals
+            )
 
     def _get_expected_socket_path(self, pid: int) -> str:
         """Get expected IPC socket/pipe path for a PID."""
-        if sys.platform == "win32":
+        if _IS_WINDOWS:
             return f"\\\\.\\pipe\\{self.SOCKET_PREFIX}{pid}"
         else:
             return f"/tmp/{self.SOCKET_PREFIX}{pid}"
 
     def _socket_exists(self, socket_path: str) -> bool:
         """Check if socket/pipe exists."""
-        if sys.platform == "win32":
+        if _IS_WINDOWS:
             return self._windows_pipe_exists(socket_path)
         else:
             return Path(socket_path).exists()
 
-    def _windows_pipe_exists(self, pipe_path: str) -> bool:
-        """Check if Windows named pipe exists."""
+    def _windows_pipe_exists(self, pipe_path: str, timeout: float = 0.2) -> bool:
+        """Check if a Windows named pipe exists and has an instance free.
+
+        ``WaitNamedPipeW`` fails straight away when no such pipe exists and
+        otherwise blocks in the kernel, for up to *timeout* seconds, until IDA
+        has an instance ready. Unlike probing with ``CreateFileW`` it never
+        occupies the pipe instance the following ping is about to use.
+        """
         try:
             import ctypes
 
             kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
-            handle = kernel32.CreateFileW(
-                pipe_path,
-                0x80000000 | 0x40000000,  # GENERIC_READ | GENERIC_WRITE
-                0,
-                None,
-                3,  # OPEN_EXISTING
-                0,
-                None,
-            )
-            if handle != -1:
-                kernel32.CloseHandle(handle)
-                return True
-        except OSError:
-            return False
-        else:
+            return bool(kernel32.WaitNamedPipeW(pipe_path, max(int(timeout * 1000), 1)))
+        except (OSError, AttributeError):
             return False
 
-    def _wait_for_socket_responsive(self, process: subprocess.Popen, socket_path: str, timeout: float) -> None:
+    @staticmethod
+    def _raise_if_exited(process: IDAProcess | None) -> None:
+        """Raise IDALaunchError if the launched IDA *process* (when known) has exited."""
+        if process is None:
+            return
+        exit_code = process.poll()
+        if exit_code is not None:
+            raise IDALaunchError(f"IDA exited unexpectedly with code {exit_code}", exit_code=exit_code)
+
+    def _wait_for_socket_responsive(
+        self,
+        process: IDAProcess,
+        socket_path: str,
+        timeout: float,
+        intervals: Iterator[float] | None = None,
+    ) -> None:
         """Wait for socket to exist and respond to ping."""
         start = time.monotonic()
-        interval = self.config.initial_poll_interval
+        intervals = intervals or self._poll_intervals()
 
-        while time.monotonic() - start < timeout:
-            # Check process health
-            exit_code = process.poll()
-            if exit_code is not None:
-                raise IDALaunchError(f"IDA exited unexpectedly with code {exit_code}", exit_code=exit_code)
+        with _LaunchEventWatcher(process, prefix=self.SOCKET_PREFIX) as watcher:
+            while time.monotonic() - start < timeout:
+                self._raise_if_exited(process)
 
-            # Check if socket exists and responds to ping
-            if self._socket_exists(socket_path) and IDAIPCClient.ping(socket_path):
-                return
+                # Check if socket exists and responds to ping
+                if self._socket_exists(socket_path) and IDAIPCClient.ping(socket_path):
+                    return
 
-            time.sleep(interval)
-            interval = min(interval * self.config.backoff_multiplier, self.config.max_poll_interval)
+                watcher.wait(_clamp_wait(next(intervals), start, timeout))
 
         raise IDAStartupTimeout(timeout, "socket_responsive")
 
-    def _wait_for_idb_loaded(self, process: subprocess.Popen, socket_path: str, timeout: float) -> IDAInstance:
+    def _wait_for_idb_loaded(
+        self,
+        process: IDAProcess,
+        socket_path: str,
+        timeout: float,
+        intervals: Iterator[float] | None = None,
+    ) -> IDAInstance:
         """Wait for IDB to be loaded and return instance info."""
         start = time.monotonic()
-        interval = self.config.initial_poll_interval
+        intervals = intervals or self._poll_intervals()
 
-        while time.monotonic() - start < timeout:
-            # Check process health
-            exit_code = process.poll()
-            if exit_code is not None:
-                raise IDALaunchError(f"IDA exited unexpectedly with code {exit_code}", exit_code=exit_code)
+        with _LaunchEventWatcher(process, watch_sockets=False) as watcher:
+            while time.monotonic() - start < timeout:
+                self._raise_if_exited(process)
 
-            # Query instance for IDB info
-            info = IDAIPCClient.query_instance(socket_path)
-            if info and info.has_idb:
-                return info
+                # Query instance for IDB info
+                info = IDAIPCClient.query_instance(socket_path)
+                if info and info.has_idb:
+                    return info
 
-            time.sleep(interval)
-            interval = min(interval * self.config.backoff_multiplier, self.config.max_poll_interval)
+                watcher.wait(_clamp_wait(next(intervals), start, timeout))
 
         raise IDAStartupTimeout(timeout, "idb_loaded")
 
     def _wait_for_analysis(
         self,
-        process: subprocess.Popen,
         socket_path: str,
+        process: IDAProcess | None = None,
         progress_callback: Callable[[str], None] | None = None,
     ) -> None:
         """Wait for auto-analysis to complete by polling.
 
-        Polls is_analysis_complete at regular intervals with process health
-        checks. User can cancel with Ctrl+C.
+        Polls is_analysis_complete at regular intervals. When the launched IDA
+        *process* is known (it isn't after 'open -a'), a crash ends the wait
+        immediately instead of at the next poll. User can cancel with Ctrl+C.
         """
         start = time.monotonic()
 
-        while True:
-            # Check process health
-            exit_code = process.poll()
-            if exit_code is not None:
-                raise IDALaunchError(f"IDA exited unexpectedly with code {exit_code}", exit_code=exit_code)
+        with _LaunchEventWatcher(process, watch_sockets=False) as watcher:
+            while True:
+                self._raise_if_exited(process)
 
-            result = IDAIPCClient.is_analysis_complete(socket_path)
+                result = IDAIPCClient.is_analysis_complete(socket_path)
 
-            if result.success:
-                elapsed = time.monotonic() - start
-                if progress_callback:
-                    progress_callback(f"Analysis complete ({elapsed:.1f}s)")
-                return
+                if result.success:
+                    elapsed = time.monotonic() - start
+                    if progress_callback:
+                        progress_callback(f"Analysis complete ({elapsed:.1f}s)")
+                    return
 
-            if result.status == "error":
-                raise IDALaunchError(f"Analysis check error: {result.message}")
+                if result.status == "error":
+                    raise IDALaunchError(f"Analysis check error: {result.message}")
 
-            # Not complete yet, sleep and retry
-            elapsed = time.monotonic() - start
-            if progress_callback:
-                progress_callback(f"Waiting for analysis... ({elapsed:.0f}s)")
+                # Not complete yet, sleep and retry
+                elapsed = time.monotonic() - start
+                if progress_callback:
+                    progress_callback(f"Waiting for analysis... ({elapsed:.0f}s)")
 
-            time.sleep(self.config.analysis_poll_interval)
+                watcher.wait(self.config.analysis_poll_interval)
 
-    def _wait_for_idb_instance(self, idb_name: str, timeout: float) -> IDAInstance:
+    def _wait_for_idb_instance(
+        self,
+        idb_name: str,
+        timeout: float,
+        process: IDAProcess | None = None,
+        intervals: Iterator[float] | None = None,
+    ) -> IDAInstance:
         """Wait for an IDA instance with the specified IDB to appear.
 
-        Polls all IDA IPC sockets looking for one with the matching IDB.
+        Polls all IDA IPC sockets looking for one with the matching IDB,
+        querying them concurrently so a poll costs one round trip rather
+        than one per running instance. If the launched IDA *process* is
+        known, fail fast when it exits.
         """
         start = time.monotonic()
-        interval = self.config.initial_poll_interval
-
-        while time.monotonic() - start < timeout:
-            # Discover all IDA instances
-            instances = IDAIPCClient.discover_instances()
-            for instance in instances:
-                info = IDAIPCClient.query_instance(instance.socket_path)
-                if info and info.has_idb and info.idb_name and _idb_names_match(info.idb_name, idb_name):
-                    return info
+        intervals = intervals or self._poll_intervals()
+        # Instances that already have a different IDB open are unlikely to switch
+        # to ours, so they sit out one poll interval before being asked again.
+        skip_until: dict[str, float] = {}
 
-            time.sleep(interval)
-            interval = min(interval * self.config.backoff_multiplier, self.config.max_poll_interval)
+        pool = ThreadPoolExecutor(max_workers=self.QUERY_WORKERS, thread_name_prefix="ida-ipc-query")
+        try:
+            with _LaunchEventWatcher(process, prefix=self.SOCKET_PREFIX) as watcher:
+                while time.monotonic() - start < timeout:
+                    self._raise_if_exited(process)
+
+                    # Discover all IDA instances and query them in parallel
+                    interval = next(intervals)
+                    now = time.monotonic()
+                    futures = [
+                        pool.submit(IDAIPCClient.query_instance, instance.socket_path)
+                        for instance in IDAIPCClient.discover_instances()
+                        if skip_until.get(instance.socket_path, 0.0) <= now
+                    ]
+                    try:
+                        for future in as_completed(futures, timeout=max(timeout - (now - start), 0.0)):
+                            info = future.result()
+                            if not (info and info.has_idb and info.idb_name):
+                                continue
+                            if _idb_names_match(info.idb_name, idb_name):
+                                return info
+                            skip_until[info.socket_path] = now + interval
+                    except FuturesTimeoutError:
+                        break
+                    finally:
+                        for future in futures:
+                            future.cancel()
+
+                    watcher.wait(_clamp_wait(interval, start, timeout))
+        finally:
+            # Don't block on stragglers; each query is bounded by the IPC client timeouts.
+            pool.shutdown(wait=False, cancel_futures=True)
 
         raise IDAStartupTimeout(timeout, "waiting for IDB instance")
-
-    def _wait_for_analysis_on_instance(
-        self,
-        socket_path: str,
-        progress_callback: Callable[[str], None] | None = None,
-    ) -> None:
-        """Wait for auto-analysis to complete by polling.
-
-        Similar to _wait_for_analysis but without process health checks
-        (used when we launched via 'open -a' and don't have a process handle).
-        """
-        start = time.monotonic()
-
-        while True:
-            result = IDAIPCClient.is_analysis_complete(socket_path)
-
-            if result.success:
-                elapsed = time.monotonic() - start
-                if progress_callback:
-                    progress_callback(f"Analysis complete ({elapsed:.1f}s)")
-                return
-
-            if result.status == "error":
-                raise IDALaunchError(f"Analysis check error: {result.message}")
-
-            # Not complete yet, sleep and retry
-            elapsed = time.monotonic() - start
-            if progress_callback:
-                progress_callback(f"Waiting for analysis... ({elapsed:.0f}s)")
-
-            time.sleep(self.config.analysis_poll_interval)
@@ -1,11 +1,16 @@
+import contextlib
+import functools
 import io
 import logging
-import pathlib
+import mmap
 import re
+import string
 import sys
 import typing
 import zipfile
-from collections.abc import Iterable, Iterator
+import zlib
+from collections.abc import Generator, Iterable, Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
 
@@ -135,7 +140,17 @@ IdaVersion = Literal[
 
 ALL_IDA_VERSIONS: frozenset[IdaVersion] = frozenset(typing.get_args(IdaVersion))
 
+_THREE_COMPONENT_VERSION_RE = re.compile(r"\d+\.\d+\.\d+")
+_VERSION_SPEC_OPERATOR_RE = re.compile("[=><!~]")
+_GITHUB_REPOSITORY_URL_RE = re.compile(r"^https://github\.com/[a-zA-Z0-9._-]+/[a-zA-Z0-9._-]+/?$")
+_PLUGIN_NAME_CHARACTERS = frozenset(string.ascii_letters + string.digits + "_-")
+_PEP723_BLOCK_RE = re.compile(r"#\s*///\s*script\s*\n(.*?)#\s*///\s*\n", re.DOTALL | re.MULTILINE)
+_PEP723_COMMENT_PREFIX_RE = re.compile(r"^[ \t]*#[ \t]?", re.MULTILINE)
 
+
+# called for every metadata validation and every version sort in the plugin repository,
+# where the same version strings recur many times.
+@functools.lru_cache(maxsize=1024)
 def parse_plugin_version(version: str) -> semantic_version.Version:
     # Use Version.coerce() which automatically normalizes partial versions
     # (e.g., "1.2" -> "1.2.0", "1" -> "1.0.0") and handles leading zeros
@@ -143,26 +158,56 @@ def parse_plugin_version(version: str) -> semantic_version.Version:
     return semantic_version.Version.coerce(version)
 
 
+# resolving several plugin references in one session re-parses the same specs,
+# such as the ">=0" used for bare plugin names.
+@functools.lru_cache(maxsize=256)
+def parse_plugin_version_spec(spec: str) -> semantic_version.SimpleSpec:
+    return semantic_version.SimpleSpec(spec)
+
+
+def _normalize_ida_version(version: str) -> str:
+    # service packs become the patch component: 9.0sp1 -> 9.0.1
+    return version.replace("sp", ".")
+
+
+# the same handful of IDA versions and specs are parsed over and over
+# when validating and filtering plugin metadata, so cache them.
+@functools.lru_cache(maxsize=256)
 def parse_ida_version(version: str) -> semantic_version.Version:
-    normalized_version = version.replace("sp", ".")
+    normalized_version = _normalize_ida_version(version)
 
-    if re.match(r"\d+\.\d+\.\d+", normalized_version):
+    if _THREE_COMPONENT_VERSION_RE.match(normalized_version):
         return semantic_version.Version(normalized_version)
 
     # now we're guaranteed to only have one (X) or two (X.Y) component versions
     # X -> X.0.0
     # X.Y -> X.Y.0
     if "." not in normalized_version:
-        normalized_version = version + ".0.0"
+        normalized_version += ".0.0"
     else:
-        normalized_version = version + ".0"
+        normalized_version += ".0"
 
     return semantic_version.Version(normalized_version)
 
 
+@functools.lru_cache(maxsize=256)
 def parse_ida_version_spec(version: str) -> semantic_version.SimpleSpec:
-    normalized_version = version.replace("sp", ".")
-    return semantic_version.SimpleSpec(normalized_version)
+    return semantic_version.SimpleSpec(_normalize_ida_version(version))
+
+
+# every known IDA version alongside its parsed form,
+# so that expanding an `idaVersions` spec doesn't re-parse the whole table for each plugin.
+_PARSED_IDA_VERSIONS: tuple[tuple[IdaVersion, semantic_version.Version], ...] = tuple(
+    (version, parse_ida_version(version)) for version in ALL_IDA_VERSIONS
+)
+
+
+# semantic_version evaluates spec membership in pure Python, which adds up across the version table,
+# and the same few `idaVersions` specs appear in plugin after plugin.
+@functools.lru_cache(maxsize=256)
+def _expand_ida_version_spec(spec: str) -> tuple[IdaVersion, ...]:
+    parsed_spec = parse_ida_version_spec(spec)
+    return tuple(version for version, parsed in _PARSED_IDA_VERSIONS if parsed in parsed_spec)
 
 
 def split_plugin_version_spec(version_spec: str) -> tuple[str, str]:
@@ -177,14 +222,13 @@ def split_plugin_version_spec(version_spec: str) -> tuple[str, str]:
     Raises:
         ValueError: If the version spec format is invalid
     """
-    plugin_name = re.split("[=><!~]", version_spec)[0]
-    if plugin_name == version_spec:
-        return plugin_name, ""
-
-    op_chars = version_spec[len(plugin_name) : len(plugin_name) + 2]
-    if not op_chars or op_chars[0] not in "=><!~":
-        raise ValueError(f"invalid plugin version spec: {version_spec}")
+    # only the first operator matters, so search rather than split the whole spec.
+    match = _VERSION_SPEC_OPERATOR_RE.search(version_spec)
+    if match is None:
+        return version_spec, ""
 
+    plugin_name = version_spec[: match.start()]
+    op_chars = version_spec[match.start() : match.start() + 2]
     if len(op_chars) < 2 or op_chars[1] != "=":
         raise ValueError(f"invalid plugin version spec: {version_spec}")
 
@@ -213,8 +257,7 @@ class URLs(BaseModel):
     @field_validator("repository", mode="after")
     @classmethod
     def validate_github_url(cls, v: str) -> str:
-        github_pattern = r"^https://github\.com/[a-zA-Z0-9._-]+/[a-zA-Z0-9._-]+/?$"
-        if not re.match(github_pattern, v):
+        if not _GITHUB_REPOSITORY_URL_RE.match(v):
             raise ValueError("Repository must be a valid GitHub URL in the format: https://github.com/org/project")
         return v
 
@@ -457,7 +500,7 @@ class PluginMetadata(BaseModel):
     @field_validator("name", mode="after")
     @classmethod
     def is_ok_name(cls, v: str) -> str:
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v):
+        if not v or not _PLUGIN_NAME_CHARACTERS.issuperset(v):
             raise ValueError("Name must consist of ASCII letters, digits, underscores, and hyphens only")
 
         if v.startswith(("_", "-")) or v.endswith(("_", "-")):
@@ -478,10 +521,8 @@ class PluginMetadata(BaseModel):
     @classmethod
     def transform_ida_version_spec_to_versions(cls, raw: str | list[IdaVersion]) -> list[IdaVersion]:
         if isinstance(raw, str):
-            spec = parse_ida_version_spec(raw)
-
-            versions: list[IdaVersion] = [version for version in ALL_IDA_VERSIONS if parse_ida_version(version) in spec]
-            return versions
+            # a fresh list for each model, since the cached expansion is shared.
+            return list(_expand_ida_version_spec(raw))
         else:
             return raw
 
@@ -600,6 +641,111 @@ class MinimalIDAPluginMetadata(BaseModel):
     plugin: "MinimalIDAPluginMetadata.MinimalPluginMetadata"
 
 
+class MappedPluginArchive(mmap.mmap):
+    """A read-only memory map of a plugin archive on disk.
+
+    It's bytes-like (so it can be hashed and measured like the raw zip bytes)
+    and also file-like, so zipfile reads just the parts it needs straight from the page cache,
+    rather than the whole archive being copied into memory first.
+    """
+
+    def seekable(self) -> bool:
+        # zipfile requires this of file objects, but mmap doesn't provide it.
+        return True
+
+    @classmethod
+    def open(cls, path: Path) -> "MappedPluginArchive":
+        with path.open("rb") as f:
+            # the map holds its own handle to the file, so this one can be closed.
+            return cls(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+@dataclass
+class _PluginArchive:
+    """A plugin archive opened once.
+
+    The archive queries below accept either raw zip bytes or one of these,
+    so that callers asking several questions about the same archive
+    don't re-parse its central directory, nor re-validate its metadata, for each one.
+    Open one with `_open_plugin_archive` and close it when done, e.g. via `with`.
+    """
+
+    data: bytes | MappedPluginArchive
+    zip_file: zipfile.ZipFile
+    # (path, metadata) for each valid `ida-plugin.json` parsed so far, in archive order.
+    # parsing is lazy, so a lookup that finds its plugin early doesn't validate the rest.
+    metadatas: list[tuple[Path, IDAMetadataDescriptor]] = field(default_factory=list)
+    # plugin name -> first (path, metadata) parsed with that name.
+    metadatas_by_name: dict[str, tuple[Path, IDAMetadataDescriptor]] = field(default_factory=dict)
+    # plugin name -> whether is_plugin_archive() accepted it.
+    plugin_archive_verdicts: dict[str, bool] = field(default_factory=dict)
+    unparsed_metadatas: Iterator[tuple[Path, IDAMetadataDescriptor]] | None = None
+    parsed_all_metadatas: bool = False
+
+    def iter_metadatas(self, context: dict[str, str], start: int = 0) -> Iterator[tuple[Path, IDAMetadataDescriptor]]:
+        i = start
+        while True:
+            if i < len(self.metadatas):
+                yield self.metadatas[i]
+                i += 1
+                continue
+
+            if self.parsed_all_metadatas:
+                return
+
+            if self.unparsed_metadatas is None:
+                self.unparsed_metadatas = _parse_metadatas_in_plugin_archive(self.zip_file, context)
+
+            item = next(self.unparsed_metadatas, None)
+            if item is None:
+                self.parsed_all_metadatas = True
+                self.unparsed_metadatas = None
+                return
+
+            self.metadatas.append(item)
+            self.metadatas_by_name.setdefault(item[1].plugin.name, item)
+
+    def find_metadata(self, name: str) -> tuple[Path, IDAMetadataDescriptor] | None:
+        found = self.metadatas_by_name.get(name)
+        if found is not None:
+            return found
+
+        # not parsed yet, so continue parsing only until it turns up.
+        for path, metadata in self.iter_metadatas({}, start=len(self.metadatas)):
+            if metadata.plugin.name == name:
+                return path, metadata
+        return None
+
+    def close(self) -> None:
+        # this doesn't close the data: a mapped archive belongs to whoever mapped it.
+        self.zip_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _open_plugin_archive(zip_data: bytes | MappedPluginArchive) -> _PluginArchive:
+    # a mapped archive is already file-like, so it's read in place rather than copied.
+    fileobj = (
+        typing.cast(typing.IO[bytes], zip_data) if isinstance(zip_data, MappedPluginArchive) else io.BytesIO(zip_data)
+    )
+    return _PluginArchive(zip_data, zipfile.ZipFile(fileobj, "r"))
+
+
+@contextlib.contextmanager
+def _using_plugin_archive(zip_data: bytes | _PluginArchive) -> Generator[_PluginArchive, None, None]:
+    """the given archive as-is, or the given bytes opened for the duration of the block."""
+    if isinstance(zip_data, _PluginArchive):
+        yield zip_data
+        return
+
+    with _open_plugin_archive(zip_data) as archive:
+        yield archive
+
+
 def parse_pep723_metadata(python_file_content: str) -> list[str]:
     """Parse PEP 723 inline script metadata from Python file content.
 
@@ -609,23 +755,18 @@ def parse_pep723_metadata(python_file_content: str) -> list[str]:
     Raises:
         ValueError: If metadata block is found but contains invalid TOML or unexpected data format
     """
-    pattern = r"#\s*///\s*script\s*\n(.*?)#\s*///\s*\n"
-    match = re.search(pattern, python_file_content, re.DOTALL | re.MULTILINE)
+    # most entry points have no metadata block at all,
+    # and a substring scan rules that out far faster than the regex can.
+    if "///" not in python_file_content:
+        return []
+
+    match = _PEP723_BLOCK_RE.search(python_file_content)
 
     if not match:
         return []
 
     metadata_block = match.group(1)
-
-    lines = []
-    for line in metadata_block.split("\n"):
-        line = line.strip()
-        if line.startswith("#"):
-            line = line[1:].strip()
-        if line:
-            lines.append(line)
-
-    toml_content = "\n".join(lines)
+    toml_content = _PEP723_COMMENT_PREFIX_RE.sub("", metadata_block)
 
     try:
         metadata = tomllib.loads(toml_content)
@@ -638,7 +779,9 @@ def parse_pep723_metadata(python_file_content: str) -> list[str]:
         raise ValueError(f"Failed to parse PEP 723 TOML metadata: {e}") from e
 
 
-def get_file_content_from_plugin_archive(zip_data: bytes, plugin_name: str, relative_path: str) -> bytes:
+def get_file_content_from_plugin_archive(
+    zip_data: bytes | _PluginArchive, plugin_name: str, relative_path: str
+) -> bytes:
     """Get file content from a plugin archive relative to the plugin's metadata file.
 
     Args:
@@ -649,18 +792,15 @@ def get_file_content_from_plugin_archive(zip_data: bytes, plugin_name: str, rela
     Returns:
         The file content as bytes
     """
-    metadata_path = get_metadata_path_from_plugin_archive(zip_data, plugin_name)
-    plugin_dir = metadata_path.parent
-    file_path = plugin_dir / relative_path
-
-    with zipfile.ZipFile(io.BytesIO(zip_data), "r") as zip_file:
-        # zip files always use forward slashes
-        zip_path = file_path.as_posix()
-        with zip_file.open(zip_path) as f:
-            return f.read()
+    with _using_plugin_archive(zip_data) as archive:
+        metadata_path = get_metadata_path_from_plugin_archive(archive, plugin_name)
+        plugin_root = _archive_directory(metadata_path.parent)
+        return archive.zip_file.read(_plugin_archive_member(plugin_root, relative_path))
 
 
-def get_python_dependencies_from_plugin_archive(zip_data: bytes, metadata: IDAMetadataDescriptor) -> list[str]:
+def get_python_dependencies_from_plugin_archive(
+    zip_data: bytes | _PluginArchive, metadata: IDAMetadataDescriptor
+) -> list[str]:
     """Get Python dependencies from a plugin archive.
 
     If pythonDependencies is "inline", parse PEP 723 metadata from the entry point.
@@ -715,71 +855,113 @@ def get_python_dependencies_from_plugin_directory(plugin_path: Path, metadata: I
             )
 
 
+def _parse_metadatas_in_plugin_archive(
+    zip_file: zipfile.ZipFile, context: dict[str, str]
+) -> Iterator[tuple[Path, IDAMetadataDescriptor]]:
+    # read in the order the members are laid out in the archive, rather than central directory order,
+    # so that the reads walk forward through the buffer.
+    infos = [info for info in zip_file.infolist() if info.filename.endswith("ida-plugin.json")]
+    infos.sort(key=lambda info: info.header_offset)
+
+    for info in infos:
+        file_path = info.filename
+        logger.debug(m("found metadata path: %s", file_path, **context))
+        content = zip_file.read(info)
+        try:
+            metadata = IDAMetadataDescriptor.model_validate_json(content)
+        except (ValueError, ValidationError) as e:
+            logger.debug(
+                m("failed to validate metadata: %s", file_path, **(dict(context, path=file_path, error=str(e))))
+            )
+            continue
+        else:
+            logger.debug(m("found valid metadata: %s", file_path, **context))
+            yield Path(file_path), metadata
+
+
 def get_metadatas_with_paths_from_plugin_archive(
-    zip_data: bytes,
+    zip_data: bytes | _PluginArchive,
     context: dict[str, str] | None = None,
 ) -> Iterator[tuple[Path, IDAMetadataDescriptor]]:
     if context is None:
         context = {}
     logger.debug(m("finding plugin metadata", **context))
-    with zipfile.ZipFile(io.BytesIO(zip_data), "r") as zip_file:
-        for file_path in zip_file.namelist():
-            if not file_path.endswith("ida-plugin.json"):
-                continue
+    with _using_plugin_archive(zip_data) as archive:
+        yield from archive.iter_metadatas(context)
 
-            logger.debug(m("found metadata path: %s", file_path, **context))
-            with zip_file.open(file_path) as f:
-                try:
-                    metadata = IDAMetadataDescriptor.model_validate_json(f.read().decode("utf-8"))
-                except (ValueError, ValidationError) as e:
-                    logger.debug(
-                        m("failed to validate metadata: %s", file_path, **(dict(context, path=file_path, error=str(e))))
-                    )
-                    continue
-                else:
-                    logger.debug(m("found valid metadata: %s", file_path, **context))
-                    yield Path(file_path), metadata
 
+def _find_metadata_in_plugin_archive(
+    zip_data: bytes | _PluginArchive, name: str
+) -> tuple[Path, IDAMetadataDescriptor] | None:
+    with _using_plugin_archive(zip_data) as archive:
+        return archive.find_metadata(name)
 
-def get_metadata_path_from_plugin_archive(zip_data: bytes, name: str) -> Path:
-    for path, metadata in get_metadatas_with_paths_from_plugin_archive(zip_data):
-        if metadata.plugin.name == name:
-            return path
 
-    raise ValueError(f"plugin '{name}' not found in zip archive")
+def get_metadata_path_from_plugin_archive(zip_data: bytes | _PluginArchive, name: str) -> Path:
+    return get_metadata_from_plugin_archive(zip_data, name)[0]
 
 
-def get_version_from_plugin_archive(zip_data: bytes, name: str) -> str:
-    for _, metadata in get_metadatas_with_paths_from_plugin_archive(zip_data):
-        if metadata.plugin.name == name:
-            return metadata.plugin.version
-    raise ValueError(f"plugin '{name}' not found in archive")
+def get_version_from_plugin_archive(zip_data: bytes | _PluginArchive, name: str) -> str:
+    found = _find_metadata_in_plugin_archive(zip_data, name)
+    if found is None:
+        raise ValueError(f"plugin '{name}' not found in archive")
+    return found[1].plugin.version
 
 
-def get_metadata_from_plugin_archive(zip_data: bytes, name: str) -> tuple[Path, IDAMetadataDescriptor]:
+def get_metadata_from_plugin_archive(zip_data: bytes | _PluginArchive, name: str) -> tuple[Path, IDAMetadataDescriptor]:
     """Extract ida-plugin.json metadata for plugin with the given name from zip archive without extracting"""
+    found = _find_metadata_in_plugin_archive(zip_data, name)
+    if found is None:
+        raise ValueError(f"plugin '{name}' not found in zip archive")
+    return found
+
+
+def _archive_directory(path: Path) -> str:
+    """the given directory as a zip member prefix: "" for the archive root, otherwise no trailing slash."""
+    # zip files always use forward slashes
+    directory = path.as_posix()
+    return "" if directory == "." else directory
 
-    for path, metadata in get_metadatas_with_paths_from_plugin_archive(zip_data):
-        if metadata.plugin.name == name:
-            return path, metadata
 
-    raise ValueError(f"plugin '{name}' not found in zip archive")
+def _plugin_archive_member(plugin_root: str, relative_path: str) -> str:
+    """the zip member name of a path relative to a plugin's directory within the archive."""
+    # most paths are already plain member names, so only build a Path when there's something to normalize.
+    if (
+        "\\" in relative_path
+        or "//" in relative_path
+        or "/./" in relative_path
+        or relative_path.startswith("./")
+        or relative_path.endswith(("/", "/."))
+        or relative_path == "."
+    ):
+        return (Path(plugin_root) / relative_path).as_posix()
 
+    return f"{plugin_root}/{relative_path}" if plugin_root else relative_path
 
-def does_path_exist_in_zip_archive(zip_data: bytes, path: str) -> bool:
-    with zipfile.ZipFile(io.BytesIO(zip_data), "r") as zip_file:
-        return path in zip_file.namelist()
 
+def does_path_exist_in_zip_archive(zip_data: bytes | _PluginArchive, path: str) -> bool:
+    # NameToInfo is the dict ZipFile builds from the central directory,
+    # so this is a hashed lookup rather than a scan over namelist().
+    with _using_plugin_archive(zip_data) as archive:
+        return path in archive.zip_file.NameToInfo
 
-def does_plugin_path_exist_in_plugin_archive(zip_data: bytes, plugin_root: Path, relative_path: str) -> bool:
+
+def does_plugin_path_exist_in_plugin_archive(
+    zip_data: bytes | _PluginArchive, plugin_root: Path, relative_path: str
+) -> bool:
     """does the given path exist relative to the metadata file of the given plugin?"""
-    candidate_path = plugin_root / Path(relative_path)
-    # zip files always use forward slashes
-    return does_path_exist_in_zip_archive(zip_data, candidate_path.as_posix())
+    return does_path_exist_in_zip_archive(
+        zip_data, _plugin_archive_member(_archive_directory(plugin_root), relative_path)
+    )
 
 
 def is_ida_version_compatible(current_version: str, compatible_versions: Iterable[str]) -> bool:
-    """Check if current IDA version is compatible with the given versions."""
+    """Check if current IDA version is compatible with the given versions.
+
+    `compatible_versions` is the already-expanded `idaVersions` list (see
+    `PluginMetadata.transform_ida_version_spec_to_versions`), so this is a plain
+    membership test: there's no spec to parse, and nothing worth caching.
+    """
     return current_version in compatible_versions
 
 
@@ -787,124 +969,167 @@ def is_ida_version_compatible(current_version: str, compatible_versions: Iterabl
 # - relative
 # - contain only ASCII
 # - not contain traversals up
-def validate_path(path: str, field_name: str) -> None:
+def _check_path(path: str, field_name: str) -> str | None:
+    """return why the given path is invalid, or None if it's fine."""
     if not path:
-        return
+        return None
 
-    try:
-        _ = path.encode("ascii")
-    except UnicodeEncodeError:
-        logger.debug(f"Invalid {field_name} path: '{path}'")
-        raise ValueError(f"Invalid {field_name} path: '{path}'")
+    # plain string checks, since this runs for every path of every plugin:
+    # no encoded copy for the ASCII check, and no Path for the traversal check.
+    if not path.isascii():
+        return f"Invalid {field_name} path: '{path}'"
 
-    # Use PurePosixPath for consistent path handling in zip archives
-    try:
-        path_obj = pathlib.PurePosixPath(path)
-    except Exception:
-        logger.debug(f"Invalid {field_name} path: '{path}'")
-        raise ValueError(f"Invalid {field_name} path: '{path}'")
+    if path.startswith(("/", "\\")):
+        return f"Invalid {field_name} path: '{path}'"
 
-    # Check if path is absolute or contains parent directory references
-    if path_obj.is_absolute() or ".." in path_obj.parts:
-        logger.debug(f"Invalid {field_name} path: '{path}'")
-        raise ValueError(f"Invalid {field_name} path: '{path}'")
+    # treat backslashes as separators too, since the path may end up on Windows.
+    if ".." in path and ".." in path.replace("\\", "/").split("/"):
+        return f"Invalid {field_name} path: '{path}'"
 
+    return None
 
-def validate_metadata_in_plugin_archive(zip_data: bytes, metadata_path: Path, metadata: IDAMetadataDescriptor):
-    """validate the `ida-plugin.json` metadata within the given plugin archive.
 
-    The following things must be checked:
-    - the following paths must contain relative paths, no paths like ".." or similar escapes:
-      - entry point
-      - logo path
-    - the file paths must exist in the archive:
-      - entry point
-      - logo path
+def validate_path(path: str, field_name: str) -> None:
+    error = _check_path(path, field_name)
+    if error is not None:
+        logger.debug(error)
+        raise ValueError(error)
+
+
+_NATIVE_ENTRY_POINT_EXTENSIONS: dict[str, str] = {
+    PLATFORM_LINUX: ".so",
+    PLATFORM_WINDOWS: ".dll",
+    PLATFORM_MACOS_ARM: ".dylib",
+    PLATFORM_MACOS_INTEL: ".dylib",
+}
+
+
+def _check_metadata_in_plugin_archive(
+    archive: _PluginArchive, metadata_path: Path, metadata: IDAMetadataDescriptor
+) -> str | None:
+    """return why the metadata doesn't validate within the archive, or None if it does.
+
+    This doesn't raise, so that predicates like `is_plugin_archive` don't pay
+    for building exceptions on archives that aren't plugins.
     """
-    plugin_root = metadata_path.parent
+    plugin_root = _archive_directory(metadata_path.parent)
 
-    validate_path(metadata.plugin.entry_point, "entry point")
-    if metadata.plugin.logo_path:
-        validate_path(metadata.plugin.logo_path, "logo path")
+    def exists(relative_path: str) -> bool:
+        return does_path_exist_in_zip_archive(archive, _plugin_archive_member(plugin_root, relative_path))
+
+    error = _check_path(metadata.plugin.entry_point, "entry point")
+    if error is None and metadata.plugin.logo_path:
+        error = _check_path(metadata.plugin.logo_path, "logo path")
+    if error is not None:
+        return error
 
     if metadata.plugin.entry_point.endswith(".py"):
-        if not does_plugin_path_exist_in_plugin_archive(zip_data, plugin_root, metadata.plugin.entry_point):
-            logger.debug("Missing python entry point file: %s", metadata.plugin.entry_point)
-            raise ValueError(f"Entry point file not found in archive: '{metadata.plugin.entry_point}'")
+        if not exists(metadata.plugin.entry_point):
+            return f"Entry point file not found in archive: '{metadata.plugin.entry_point}'"
     else:
         # binary plugin
-        has_bare_name = False
-        for ext in (".so", ".dll", ".dylib"):
-            if does_plugin_path_exist_in_plugin_archive(zip_data, plugin_root, metadata.plugin.entry_point + ext):
-                has_bare_name = True
-
-        if has_bare_name:
-            extensions = [
-                (".so", PLATFORM_LINUX),
-                (".dll", PLATFORM_WINDOWS),
-                (".dylib", PLATFORM_MACOS_ARM),
-                (".dylib", PLATFORM_MACOS_INTEL),
-            ]
-            for ext, platform in extensions:
-                if platform in metadata.plugin.platforms:  # noqa: SIM102
-                    if not does_plugin_path_exist_in_plugin_archive(
-                        zip_data, plugin_root, metadata.plugin.entry_point + ext
-                    ):
-                        raise ValueError("missing native entry point: %s", metadata.plugin.entry_point + ext)
+        # probe each native extension once, then check the declared platforms against what was found.
+        present_extensions = {ext for ext in (".so", ".dll", ".dylib") if exists(metadata.plugin.entry_point + ext)}
 
-        else:
-            if (
+        if not present_extensions:
+            if not (
                 set(metadata.plugin.platforms) == {PLATFORM_MACOS_ARM, PLATFORM_MACOS_INTEL}
                 or len(set(metadata.plugin.platforms)) == 1
             ):
-                if not does_plugin_path_exist_in_plugin_archive(zip_data, plugin_root, metadata.plugin.entry_point):
-                    raise ValueError("missing native entry point: %s", metadata.plugin.entry_point)
-            else:
-                raise ValueError("plugin declares multiple platforms for single native entry point")
+                return "plugin declares multiple platforms for single native entry point"
+            if not exists(metadata.plugin.entry_point):
+                return f"missing native entry point: {metadata.plugin.entry_point}"
+            return f"Binary plugin file not found in archive: '{metadata.plugin.entry_point}'"
 
-        if not has_bare_name:
-            logger.debug("Missing native entry point file: %s", metadata.plugin.entry_point)
-            raise ValueError(f"Binary plugin file not found in archive: '{metadata.plugin.entry_point}'")
+        for platform, ext in _NATIVE_ENTRY_POINT_EXTENSIONS.items():
+            if platform in metadata.plugin.platforms and ext not in present_extensions:
+                return f"missing native entry point: {metadata.plugin.entry_point + ext}"
 
     if metadata.plugin.logo_path:  # noqa: SIM102
-        if not does_plugin_path_exist_in_plugin_archive(zip_data, plugin_root, metadata.plugin.logo_path):
-            logger.debug("Missing logo file: %s", metadata.plugin.logo_path)
-            raise ValueError(f"Logo file not found in archive: '{metadata.plugin.logo_path}'")
+        if not exists(metadata.plugin.logo_path):
+            return f"Logo file not found in archive: '{metadata.plugin.logo_path}'"
+
+    return None
+
+
+def validate_metadata_in_plugin_archive(
+    zip_data: bytes | _PluginArchive, metadata_path: Path, metadata: IDAMetadataDescriptor
+):
+    """validate the `ida-plugin.json` metadata within the given plugin archive.
+
+    The following things must be checked:
+    - the following paths must contain relative paths, no paths like ".." or similar escapes:
+      - entry point
+      - logo path
+    - the file paths must exist in the archive:
+      - entry point
+      - logo path
+    """
+    with _using_plugin_archive(zip_data) as archive:
+        error = _check_metadata_in_plugin_archive(archive, metadata_path, metadata)
+    if error is not None:
+        logger.debug(error)
+        raise ValueError(error)
+
+
+# what zipfile raises reading a damaged archive,
+# so that the predicates below can answer "no" for it without also hiding bugs.
+_UNREADABLE_ARCHIVE_ERRORS = (
+    zipfile.BadZipFile,
+    NotImplementedError,
+    UnicodeDecodeError,
+    ValueError,
+    KeyError,
+    OSError,
+    EOFError,
+    zlib.error,
+)
 
 
-def is_plugin_archive(zip_data: bytes, name: str) -> bool:
+def is_plugin_archive(zip_data: bytes | _PluginArchive, name: str) -> bool:
     """is the given archive an IDA plugin archive for the given plugin name?"""
     try:
-        path, metadata = get_metadata_from_plugin_archive(zip_data, name)
-        validate_metadata_in_plugin_archive(zip_data, path, metadata)
-        return True
-    except (ValueError, Exception):
+        with _using_plugin_archive(zip_data) as archive:
+            # is_source_plugin_archive/is_binary_plugin_archive both ask this first,
+            # so remember the answer rather than validating the archive again.
+            verdict = archive.plugin_archive_verdicts.get(name)
+            if verdict is None:
+                found = _find_metadata_in_plugin_archive(archive, name)
+                verdict = found is not None and _check_metadata_in_plugin_archive(archive, *found) is None
+                archive.plugin_archive_verdicts[name] = verdict
+    except _UNREADABLE_ARCHIVE_ERRORS:
+        # a corrupt archive isn't a plugin archive.
         return False
 
+    return verdict
+
 
-def is_source_plugin_archive(zip_data: bytes, name: str) -> bool:
+def is_source_plugin_archive(zip_data: bytes | _PluginArchive, name: str) -> bool:
     # the following should be true:
     # - the entry point is a filename ending with .py
     try:
-        if not is_plugin_archive(zip_data, name):
-            return False
+        with _using_plugin_archive(zip_data) as archive:
+            if not is_plugin_archive(archive, name):
+                return False
 
-        _, metadata = get_metadata_from_plugin_archive(zip_data, name)
+            _, metadata = get_metadata_from_plugin_archive(archive, name)
 
         return metadata.plugin.entry_point.endswith(".py")
-    except (ValueError, Exception):
+    except _UNREADABLE_ARCHIVE_ERRORS:
         return False
 
 
-def is_binary_plugin_archive(zip_data: bytes, name: str) -> bool:
+def is_binary_plugin_archive(zip_data: bytes | _PluginArchive, name: str) -> bool:
     # the following should be true:
     # - the entry point is in the root of the archive
     # - the entry point ends with: .so, .dll, .dylib, or there is no extension
     try:
-        if not is_plugin_archive(zip_data, name):
-            return False
+        with _using_plugin_archive(zip_data) as archive:
+            if not is_plugin_archive(archive, name):
+                return False
+
+            _, metadata = get_metadata_from_plugin_archive(archive, name)
 
-        _, metadata = get_metadata_from_plugin_archive(zip_data, name)
         entry_point = metadata.plugin.entry_point
 
         if "/" in entry_point or "\\" in entry_point:
@@ -920,6 +1145,5 @@ def is_binary_plugin_archive(zip_data: bytes, name: str) -> bool:
             # like `foo.bar.so`
             # TODO: also add check for the entry point file's existence
             return True
-
-    except (ValueError, Exception):
+    except _UNREADABLE_ARCHIVE_ERRORS:
         return False
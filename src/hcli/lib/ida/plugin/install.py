@@ -21,8 +21,8 @@ from hcli.lib.ida import (
 from hcli.lib.ida.plugin import (
     IDAMetadataDescriptor,
     MinimalIDAPluginMetadata,
+    _open_plugin_archive,
     get_metadata_from_plugin_archive,
-    get_metadata_path_from_plugin_archive,
     get_python_dependencies_from_plugin_archive,
     get_python_dependencies_from_plugin_directory,
     is_binary_plugin_archive,
@@ -54,6 +54,7 @@ from hcli.lib.ida.python import (
     pip_install_packages,
     verify_pip_can_install_packages,
 )
+from hcli.lib.util.cache import validate_path_component
 from hcli.lib.util.io import NoSpaceError
 
 logger = logging.getLogger(__name__)
@@ -72,22 +73,6 @@ def get_plugins_directory() -> Path:
     return plugins_dir
 
 
-def validate_path_component(name: str):
-    if not name or name in {".", ".."}:
-        raise ValueError(f"Invalid path component: '{name}'.")
-
-    try:
-        name.encode("ascii")
-    except UnicodeEncodeError:
-        raise ValueError(f"Invalid path component: '{name}'. Must contain only ASCII characters")
-
-    if "\t" in name or "\n" in name or "\r" in name:
-        raise ValueError(f"Invalid path component: '{name}'. Cannot contain tabs or newlines")
-
-    if "/" in name or "\\" in name:
-        raise ValueError(f"Invalid path component: '{name}'. Cannot contain slashes")
-
-
 def get_plugin_directory(name: str) -> Path:
     """$IDAUSR/plugins/<name>"""
     plugins_dir = get_plugins_directory()
@@ -203,8 +188,7 @@ def get_metadata_from_plugin_directory(plugin_path: Path) -> IDAMetadataDescript
         raise ValueError(f"ida-plugin.json not found in {plugin_path}")
 
     try:
-        content = metadata_file.read_text(encoding="utf-8")
-        return IDAMetadataDescriptor.model_validate_json(content)
+        return IDAMetadataDescriptor.model_validate_json(metadata_file.read_bytes())
     except Exception as e:
         logger.debug("failed to validate ida-plugin.json: %s", e)
         raise ValueError(f"Failed to parse ida-plugin.json in {plugin_path}: {e}")
@@ -679,8 +663,9 @@ def _install_plugin_archive(
     no_build_isolation: bool = False,
     pip_options: PipOptions = PIP_OPTIONS_DEFAULT,
 ):
-    path, metadata = get_metadata_from_plugin_archive(zip_data, name)
-    validate_metadata_in_plugin_archive(zip_data, path, metadata)
+    with _open_plugin_archive(zip_data) as archive:
+        path, metadata = get_metadata_from_plugin_archive(archive, name)
+        validate_metadata_in_plugin_archive(archive, path, metadata)
 
     logger.info("installing plugin: %s (%s)", metadata.plugin.name, metadata.plugin.version)
 
@@ -699,8 +684,7 @@ def _install_plugin_archive(
 
     destination_path = get_plugin_directory(metadata.plugin.name)
 
-    metadata_path = get_metadata_path_from_plugin_archive(zip_data, name)
-    plugin_subdirectory = metadata_path.parent
+    plugin_subdirectory = path.parent
 
     # TODO: install idaPluginDependencies
 
@@ -751,9 +735,13 @@ def install_binary_plugin_archive(
 def install_plugin_archive(
     zip_data: bytes, name: str, no_build_isolation: bool = False, pip_options: PipOptions = PIP_OPTIONS_DEFAULT
 ):
-    if is_source_plugin_archive(zip_data, name):
+    with _open_plugin_archive(zip_data) as archive:
+        is_source = is_source_plugin_archive(archive, name)
+        is_binary = not is_source and is_binary_plugin_archive(archive, name)
+
+    if is_source:
         install_source_plugin_archive(zip_data, name, no_build_isolation=no_build_isolation, pip_options=pip_options)
-    elif is_binary_plugin_archive(zip_data, name):
+    elif is_binary:
         install_binary_plugin_archive(zip_data, name, no_build_isolation=no_build_isolation, pip_options=pip_options)
     else:
         raise ValueError("Invalid plugin archive")
@@ -1073,8 +1061,9 @@ def validate_can_upgrade_plugin(
 def upgrade_plugin_archive(
     zip_data: bytes, name: str, no_build_isolation: bool = False, pip_options: PipOptions = PIP_OPTIONS_DEFAULT
 ):
-    path, metadata = get_metadata_from_plugin_archive(zip_data, name)
-    validate_metadata_in_plugin_archive(zip_data, path, metadata)
+    with _open_plugin_archive(zip_data) as archive:
+        path, metadata = get_metadata_from_plugin_archive(archive, name)
+        validate_metadata_in_plugin_archive(archive, path, metadata)
 
     if not is_plugin_installed(metadata.plugin.name):
         raise PluginNotInstalledError(metadata.plugin.name)
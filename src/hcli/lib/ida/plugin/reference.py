@@ -18,6 +18,9 @@ import re
 from dataclasses import dataclass
 from urllib.parse import urlparse
 
+# first character of a version spec operator (``==``, ``>=``, ``~=``, ...).
+_VERSION_OPERATOR_RE = re.compile(r"[=><!~]")
+
 # whole-string match for a GitHub repository URL in the shape allowed by
 # ``ida-plugin.json`` (see ``URLs.validate_github_url`` in
 # ``src/hcli/lib/ida/plugin/__init__.py``). Trailing slash optional.
@@ -115,7 +118,7 @@ def _split_name_and_version(value: str) -> tuple[str, str]:
             without another character).
     """
     # look for the first operator char
-    match = re.search(r"[=><!~]", value)
+    match = _VERSION_OPERATOR_RE.search(value)
     if not match:
         return value, ""
 
@@ -1,8 +1,14 @@
+import bisect
+import functools
 import hashlib
+import json
 import logging
+import os
+import tempfile
 import urllib.request
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -13,40 +19,170 @@ from pydantic import BaseModel, ConfigDict
 from hcli.lib.ida.plugin import (
     IDAMetadataDescriptor,
     IdaVersion,
+    MappedPluginArchive,
     Platform,
+    _open_plugin_archive,
     get_metadatas_with_paths_from_plugin_archive,
     is_ida_version_compatible,
     parse_plugin_version,
+    parse_plugin_version_spec,
     split_plugin_version_spec,
     validate_metadata_in_plugin_archive,
 )
 from hcli.lib.ida.plugin.exceptions import AmbiguousPluginReferenceError
 from hcli.lib.ida.plugin.reference import normalize_plugin_host
+from hcli.lib.util.cache import get_cache_directory
 from hcli.lib.util.logging import m
 
 logger = logging.getLogger(__name__)
 
+_FETCH_WORKERS = 8  # concurrent downloads in fetch_plugin_archives
 
-def fetch_plugin_archive(url: str) -> bytes:
+
+def fetch_plugin_archive(url: str, hasher: "hashlib._Hash | None" = None) -> bytes:
+    """Fetch the plugin archive at the given file:// or http(s) URL.
+
+    When a hasher is given, it is fed the archive contents;
+    downloads are hashed chunk by chunk as they arrive rather than in a second pass.
+    """
     parsed_url = urlparse(url)
 
     if parsed_url.scheme == "file":
         file_path = Path(urllib.request.url2pathname(parsed_url.path))
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
-        return file_path.read_bytes()
+        buf = file_path.read_bytes()
+        if hasher is not None:
+            hasher.update(buf)
+        return buf
 
     elif parsed_url.scheme in ("http", "https"):
-        response = httpx.get(url, timeout=30.0, follow_redirects=True)
-        response.raise_for_status()
-        if parsed_url.scheme == "https" and response.url.scheme != "https":
-            raise ValueError(f"HTTPS request was redirected to insecure HTTP URL: {response.url}")
-        return response.content
+        return http_get(url, hasher)
 
     else:
         raise ValueError(f"Unsupported URL scheme: {parsed_url.scheme}")
 
 
+def fetch_plugin_archives(urls: Iterable[str]) -> dict[str, bytes]:
+    """Fetch several plugin archives concurrently, by URL.
+
+    Downloads share the pooled HTTP client, so requests to the same host reuse its connections.
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS, thread_name_prefix="plugin-fetch") as pool:
+        return dict(zip(unique_urls, pool.map(fetch_plugin_archive, unique_urls)))
+
+
+@functools.cache
+def _get_http_client() -> httpx.Client:
+    # one client for the whole process, so that repeated downloads reuse TLS sessions and keep-alive connections.
+    return httpx.Client(
+        timeout=30.0,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=_FETCH_WORKERS * 2, max_keepalive_connections=_FETCH_WORKERS * 2),
+    )
+
+
+def _check_not_downgraded(url: str, response: httpx.Response) -> None:
+    if urlparse(url).scheme == "https" and response.url.scheme != "https":
+        raise ValueError(f"HTTPS request was redirected to insecure HTTP URL: {response.url}")
+
+
+def http_get(url: str, hasher: "hashlib._Hash | None" = None) -> bytes:
+    """Fetch the given http(s) URL, streaming the body.
+
+    When a hasher is given, it is fed the body as it streams in.
+    """
+    with _get_http_client().stream("GET", url) as response:
+        _check_not_downgraded(url, response)
+        response.raise_for_status()
+        chunks = []
+        for chunk in response.iter_bytes(65536):
+            if hasher is not None:
+                hasher.update(chunk)
+            chunks.append(chunk)
+
+    return b"".join(chunks)
+
+
+def _get_http_cache_paths(url: str) -> tuple[Path, Path]:
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    directory = get_cache_directory("http-cache")
+    return directory / f"{key}.body", directory / f"{key}.json"
+
+
+def _write_http_cache_file(path: Path, buf: bytes) -> None:
+    # write to a sibling temporary file and then rename it into place,
+    # so that concurrent processes (or readers) never see a partially written file.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(buf)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def http_get_with_cache(url: str) -> bytes:
+    """Fetch the given http(s) URL, revalidating any earlier download of it.
+
+    This is meant for plugin index documents, which are small and few, so the cache stays small too;
+    plugin archives are fetched with `http_get` instead, and checked against their hashes.
+
+    Responses that carry an ETag or Last-Modified validator are kept in the cache directory,
+    and the next request for the same URL is made conditional on them,
+    so an unchanged index comes back as a body-less 304 and is read from disk.
+    The validators record the sha256 of the body they describe, and a cached body that doesn't match
+    (say, because another process replaced it in between) is ignored, and the URL fetched in full.
+    """
+    body_path, validators_path = _get_http_cache_paths(url)
+
+    headers: dict[str, str] = {}
+    cached_body: bytes | None = None
+    try:
+        validators = json.loads(validators_path.read_text(encoding="utf-8"))
+        if validators.get("url") == url:
+            body = body_path.read_bytes()
+            if hashlib.sha256(body).hexdigest() == validators.get("sha256"):
+                cached_body = body
+                if validators.get("etag"):
+                    headers["If-None-Match"] = validators["etag"]
+                if validators.get("last_modified"):
+                    headers["If-Modified-Since"] = validators["last_modified"]
+    except (OSError, ValueError):
+        pass
+
+    response = _get_http_client().get(url, headers=headers)
+    _check_not_downgraded(url, response)
+    if response.status_code == 304 and cached_body is not None:
+        logger.debug("using cached response for %s", url)
+        return cached_body
+
+    response.raise_for_status()
+    body = response.content
+    etag = response.headers.get("etag")
+    last_modified = response.headers.get("last-modified")
+    if etag or last_modified:
+        try:
+            _write_http_cache_file(body_path, body)
+            _write_http_cache_file(
+                validators_path,
+                json.dumps(
+                    {
+                        "url": url,
+                        "etag": etag,
+                        "last_modified": last_modified,
+                        "sha256": hashlib.sha256(body).hexdigest(),
+                    }
+                ).encode("utf-8"),
+            )
+        except OSError as e:
+            logger.debug("failed to cache response for %s: %s", url, e)
+
+    return body
+
+
 class PluginArchiveLocation(BaseModel):
     model_config = ConfigDict(serialize_by_alias=True, frozen=True)  # type: ignore
 
@@ -67,10 +203,11 @@ class Plugin(BaseModel):
 def is_compatible_plugin_version_location(
     plugin: Plugin, version: str, location: PluginArchiveLocation, current_platform: str, current_version: str
 ) -> bool:
-    if not is_ida_version_compatible(current_version, location.metadata.plugin.ida_versions):
+    # the platform list is a handful of entries, the IDA version list can be dozens: check the short one first.
+    if current_platform not in location.metadata.plugin.platforms:
         return False
 
-    return current_platform in location.metadata.plugin.platforms
+    return is_ida_version_compatible(current_version, location.metadata.plugin.ida_versions)
 
 
 def is_compatible_plugin_version(
@@ -98,13 +235,22 @@ def get_latest_plugin_metadata(plugin: Plugin) -> IDAMetadataDescriptor:
 def get_latest_compatible_plugin_metadata(
     plugin: Plugin, current_platform: str, current_version: str
 ) -> IDAMetadataDescriptor:
-    for version, locations in sorted(plugin.versions.items(), key=lambda p: parse_plugin_version(p[0]), reverse=True):
+    for version in sorted(plugin.versions, key=parse_plugin_version, reverse=True):
+        locations = plugin.versions[version]
         if is_compatible_plugin_version(plugin, version, locations, current_platform, current_version):
-            return plugin.versions[version][0].metadata
+            return locations[0].metadata
 
     raise ValueError("no versions of plugin are compatible")
 
 
+def get_plugins_by_name(plugins: list[Plugin]) -> dict[str, list[Plugin]]:
+    """Group plugins by lowercased name, preserving their order."""
+    plugins_by_name: dict[str, list[Plugin]] = {}
+    for plugin in plugins:
+        plugins_by_name.setdefault(plugin.name.lower(), []).append(plugin)
+    return plugins_by_name
+
+
 def get_plugin_by_name(plugins: list[Plugin], name: str, host: str | None = None) -> Plugin:
     """Find a plugin by name and, optionally, host.
 
@@ -118,15 +264,16 @@ def get_plugin_by_name(plugins: list[Plugin], name: str, host: str | None = None
             plugins and no host was provided to disambiguate.
     """
     wanted_name = name.lower()
+    return _select_plugin_by_host([plugin for plugin in plugins if plugin.name.lower() == wanted_name], name, host)
+
+
+def _select_plugin_by_host(plugins: list[Plugin], name: str, host: str | None) -> Plugin:
+    """Pick the single plugin among same-named plugins, optionally filtered by host."""
     if host:
         normalized_host = normalize_plugin_host(host)
-        matches = [
-            plugin
-            for plugin in plugins
-            if plugin.name.lower() == wanted_name and normalize_plugin_host(plugin.host) == normalized_host
-        ]
+        matches = [plugin for plugin in plugins if normalize_plugin_host(plugin.host) == normalized_host]
     else:
-        matches = [plugin for plugin in plugins if plugin.name.lower() == wanted_name]
+        matches = plugins
 
     if not matches:
         raise KeyError(f"plugin not found: {name}")
@@ -142,12 +289,59 @@ def get_plugin_by_name(plugins: list[Plugin], name: str, host: str | None = None
     return matches[0]
 
 
+def _get_version_precedence(version: semantic_version.Version) -> tuple:
+    # the key that Version's own comparisons use: precedence without build metadata.
+    # as a plain tuple it sorts and bisects without calling back into Version.__lt__.
+    return version.precedence_key[:4]
+
+
+def _get_version_spec_bounds(
+    spec: semantic_version.SimpleSpec,
+) -> tuple[semantic_version.Version | None, semantic_version.Version | None]:
+    """Inclusive precedence bounds that every version matching the spec falls within.
+
+    Either bound is None when the spec doesn't constrain that side, or is too complex to bound (like `!=`).
+    Versions within the bounds may still not match, for example prereleases, so callers must still check the spec.
+    """
+    clause = spec.clause
+    ranges = clause.clauses if isinstance(clause, semantic_version.base.AllOf) else (clause,)
+
+    lower: semantic_version.Version | None = None
+    upper: semantic_version.Version | None = None
+    for range_ in ranges:
+        if not isinstance(range_, semantic_version.base.Range):
+            return None, None
+
+        target = range_.target
+        if range_.operator in (range_.OP_EQ, range_.OP_GT, range_.OP_GTE) and (lower is None or lower < target):
+            lower = target
+        if range_.operator in (range_.OP_EQ, range_.OP_LT, range_.OP_LTE) and (upper is None or target < upper):
+            upper = target
+
+    return lower, upper
+
+
 class BasePluginRepo(ABC):
+    def __init__(self):
+        # the plugin list the name index was built from, and the index itself.
+        self._plugins_by_name: tuple[list[Plugin], dict[str, list[Plugin]]] | None = None
+
     @abstractmethod
     def get_plugins(self) -> list[Plugin]: ...
 
+    def get_plugins_by_name(self) -> dict[str, list[Plugin]]:
+        """Plugins grouped by lowercased name.
+
+        The grouping is reused for as long as ``get_plugins`` keeps returning the same list,
+        as it does for repositories that cache their plugins.
+        """
+        plugins = self.get_plugins()
+        if self._plugins_by_name is None or self._plugins_by_name[0] is not plugins:
+            self._plugins_by_name = (plugins, get_plugins_by_name(plugins))
+        return self._plugins_by_name[1]
+
     def get_plugin_by_name(self, name: str, host: str | None = None) -> Plugin:
-        return get_plugin_by_name(self.get_plugins(), name, host=host)
+        return _select_plugin_by_host(self.get_plugins_by_name().get(name.lower(), []), name, host)
 
     def find_plugin_from_spec(
         self,
@@ -167,12 +361,27 @@ class BasePluginRepo(ABC):
         IDA version, preventing accidental omission.
         """
         plugin_name, _ = split_plugin_version_spec(plugin_spec)
-        wanted_spec = semantic_version.SimpleSpec(plugin_spec[len(plugin_name) :] or ">=0")
+        wanted_spec = parse_plugin_version_spec(plugin_spec[len(plugin_name) :] or ">=0")
 
         plugin = self.get_plugin_by_name(plugin_name, host=host)
 
-        versions = sorted(plugin.versions.keys(), key=parse_plugin_version, reverse=True)
-        for version in versions:
+        # sort by precedence, then bisect to the spec's bounds (when it has any),
+        # so that the comparatively slow spec check only runs on versions that could match.
+        # versions of equal precedence (differing only in build metadata) are tried in the order they were added,
+        # so they're sorted by descending position here, and come out in ascending position when walked in reverse.
+        versions = sorted(
+            (
+                (_get_version_precedence(parse_plugin_version(version)), -i, version)
+                for i, version in enumerate(plugin.versions)
+            ),
+            key=lambda p: p[:2],
+        )
+        keys = [key for key, _, _ in versions]
+        lower, upper = _get_version_spec_bounds(wanted_spec)
+        start = bisect.bisect_left(keys, _get_version_precedence(lower)) if lower is not None else 0
+        stop = bisect.bisect_right(keys, _get_version_precedence(upper)) if upper is not None else len(keys)
+
+        for _, _, version in reversed(versions[start:stop]):
             version_spec = parse_plugin_version(version)
             if version_spec not in wanted_spec:
                 logger.debug("skipping: %s not in %s", version_spec, wanted_spec)
@@ -254,10 +463,8 @@ class BasePluginRepo(ABC):
     def _fetch_and_verify(self, location: PluginArchiveLocation) -> tuple[str, bytes]:
         plugin_name = location.metadata.plugin.name
         logger.debug("plugin name: %s", plugin_name)
-        buf = fetch_plugin_archive(location.url)
-
         h = hashlib.sha256()
-        h.update(buf)
+        buf = fetch_plugin_archive(location.url, h)
         sha256 = h.hexdigest()
 
         if sha256 != location.sha256:
@@ -277,48 +484,81 @@ class PluginArchiveIndex:
     """
 
     def __init__(self):
-        # tuple[name, host] -> version -> tuple[set[IdaVersion], set[Platform]] -> list[tuple[url, sha256, metadata]]
+        # tuple[name, host] -> tuple[version, set[IdaVersion], set[Platform]] -> list[tuple[url, sha256, metadata]]
+        #
+        # the plugin level is kept separate so that a single plugin can be built without scanning every location,
+        # but version and spec share one key: one lookup per indexed archive rather than two.
         self.index: dict[
             tuple[str, str],
-            dict[
-                str,
-                dict[tuple[frozenset[IdaVersion], frozenset[Platform]], list[tuple[str, str, IDAMetadataDescriptor]]],
-            ],
-        ] = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+            dict[tuple[str, frozenset[IdaVersion], frozenset[Platform]], list[tuple[str, str, IDAMetadataDescriptor]]],
+        ] = {}
+        # tuple[name, host] -> Plugin, built on first access and dropped when the plugin gains a location.
+        self._plugins: dict[tuple[str, str], Plugin] = {}
+        # the sorted result of get_plugins, dropped whenever any plugin gains a location.
+        self._all_plugins: list[Plugin] | None = None
+        # most archives share the same IDA versions and platforms,
+        # so keep one copy of each distinct spec rather than one per archive.
+        self._specs: dict[
+            tuple[frozenset[IdaVersion], frozenset[Platform]], tuple[frozenset[IdaVersion], frozenset[Platform]]
+        ] = {}
+        # archive sha256 -> the (path, metadata) of its valid plugins, so identical archives are parsed once.
+        self._archive_metadatas: dict[str, list[tuple[Path, IDAMetadataDescriptor]]] = {}
 
     def index_plugin_archive(
-        self, buf: bytes, url: str, expected_host: str | None = None, context: dict[str, str] | None = None
+        self,
+        buf: bytes | MappedPluginArchive,
+        url: str,
+        expected_host: str | None = None,
+        context: dict[str, str] | None = None,
+        sha256: str | None = None,
     ):
         """Parse the given plugin archive and index the encountered plugins.
 
         Optionally filter out plugins whose host does not match the expected host.
+        Callers that already hashed the archive may pass its sha256 hex digest.
         """
         if context is None:
             context = {}
         logging.debug(m("indexing plugin archive: %s", url, **context))
-        for path, metadata in get_metadatas_with_paths_from_plugin_archive(buf, context=context):
-            try:
-                validate_metadata_in_plugin_archive(buf, path, metadata)
-            except ValueError as e:
-                logger.debug(
-                    m(
-                        "failed to validate plugin metadata: %s",
-                        path,
-                        **dict(
-                            context,
-                            path=str(path),
-                            plugin_name=metadata.plugin.name,
-                            plugin_version=metadata.plugin.version,
-                            error=str(e),
-                        ),
-                    )
-                )
-                return
+        sha256, metadatas = self.get_archive_metadatas(buf, context=context, sha256=sha256)
+        self.index_plugin_metadatas(metadatas, url, sha256, expected_host=expected_host, context=context)
+
+    def get_archive_metadatas(
+        self,
+        buf: bytes | MappedPluginArchive,
+        context: dict[str, str] | None = None,
+        sha256: str | None = None,
+    ) -> tuple[str, list[tuple[Path, IDAMetadataDescriptor]]]:
+        """Hash and parse the given plugin archive, returning its sha256 and the (path, metadata) of its valid plugins.
 
-            h = hashlib.sha256()
-            h.update(buf)
-            sha256 = h.hexdigest()
+        Callers that already hashed the archive may pass its sha256 hex digest.
+        """
+        # every plugin found in the archive shares the archive's hash.
+        if sha256 is None:
+            sha256 = hashlib.sha256(buf).hexdigest()
+
+        # the same archive is often published at several URLs (like a release's and its tag's source archive),
+        # so only parse and validate each distinct archive once.
+        metadatas = self._archive_metadatas.get(sha256)
+        if metadatas is None:
+            metadatas = self._archive_metadatas[sha256] = list(self._iter_valid_metadatas(buf, context or {}))
+        return sha256, metadatas
+
+    def index_plugin_metadatas(
+        self,
+        metadatas: list[tuple[Path, IDAMetadataDescriptor]],
+        url: str,
+        sha256: str,
+        expected_host: str | None = None,
+        context: dict[str, str] | None = None,
+    ):
+        """Index the plugins already found in the archive at the given URL, such as by get_archive_metadatas.
 
+        Optionally filter out plugins whose host does not match the expected host.
+        """
+        if context is None:
+            context = {}
+        for path, metadata in metadatas:
             name = metadata.plugin.name
             host = metadata.plugin.host
             normalized_host = normalize_plugin_host(host)
@@ -326,6 +566,7 @@ class PluginArchiveIndex:
             ida_versions = frozenset(metadata.plugin.ida_versions)
             platforms = frozenset(metadata.plugin.platforms)
             spec = (ida_versions, platforms)
+            spec = self._specs.setdefault(spec, spec)
 
             if expected_host and normalize_plugin_host(expected_host) != normalized_host:
                 logger.debug(m("host mismatch: %s: %s versus expected %s", name, host, expected_host, **context))
@@ -344,37 +585,97 @@ class PluginArchiveIndex:
                 )
             )
 
-            versions = self.index[(name.lower(), normalized_host)]
-            specs = versions[version]
-            specs[spec].append((url, sha256, metadata))
+            id_ = (name.lower(), normalized_host)
+            # plain dicts with setdefault: no Python-level default factory called per missing key.
+            self.index.setdefault(id_, {}).setdefault((version, *spec), []).append((url, sha256, metadata))
+            self._plugins.pop(id_, None)
+            self._all_plugins = None
+
+    @staticmethod
+    def _iter_valid_metadatas(
+        buf: bytes | MappedPluginArchive, context: dict[str, str]
+    ) -> Iterator[tuple[Path, IDAMetadataDescriptor]]:
+        """The archive's plugins, up to (and not including) the first whose metadata fails validation."""
+        with _open_plugin_archive(buf) as archive:
+            for path, metadata in get_metadatas_with_paths_from_plugin_archive(archive, context=context):
+                try:
+                    validate_metadata_in_plugin_archive(archive, path, metadata)
+                except ValueError as e:
+                    logger.debug(
+                        m(
+                            "failed to validate plugin metadata: %s",
+                            path,
+                            **dict(
+                                context,
+                                path=str(path),
+                                plugin_name=metadata.plugin.name,
+                                plugin_version=metadata.plugin.version,
+                                error=str(e),
+                            ),
+                        )
+                    )
+                    return
+
+                yield path, metadata
 
     def get_plugins(self) -> list[Plugin]:
         """
         Fetch all plugins and their locations, indexed by name/version/ida version/platforms.
         The results are stably sorted.
         """
-        ret = []
+        if self._all_plugins is None:
+            # sort alphabetically by name
+            self._all_plugins = [self._get_plugin(id_) for id_ in sorted(self.index)]
+        return self._all_plugins
 
-        # sort alphabetically by name
-        for id_, versions in sorted(self.index.items(), key=lambda p: p[0]):
-            display_name, display_host = id_
-            locations_by_version = defaultdict(list)
+    def get_plugins_named(self, name: str) -> list[Plugin]:
+        """Fetch the plugins with the given name (case-insensitive), one per host, without building the others."""
+        wanted_name = name.lower()
+        return [self._get_plugin(id_) for id_ in sorted(self.index) if id_[0] == wanted_name]
 
-            # sort by version
-            for version, specs in sorted(versions.items(), key=lambda p: parse_plugin_version(p[0])):
-                # sorted arbitrarily (but stably)
-                for spec, urls in sorted(specs.items()):
-                    # sorted arbitrarily (but stably)
-                    for url, sha256, metadata in sorted(urls):
-                        location = PluginArchiveLocation(
-                            url=url,
-                            sha256=sha256,
-                            metadata=metadata,
-                        )
-                        locations_by_version[version].append(location)
-                        display_name = metadata.plugin.name
+    def get_plugin_by_name(self, name: str, host: str | None = None) -> Plugin:
+        """Find a plugin by name and, optionally, host, building only the plugins that are looked at.
 
-            plugin = Plugin(name=display_name, host=display_host, versions=locations_by_version)
-            ret.append(plugin)
+        With a host this is a direct index lookup. Raises like the module-level ``get_plugin_by_name``.
+        """
+        if not host:
+            return _select_plugin_by_host(self.get_plugins_named(name), name, None)
+
+        id_ = (name.lower(), normalize_plugin_host(host))
+        if id_ not in self.index:
+            raise KeyError(f"plugin not found: {name}")
+        return self._get_plugin(id_)
+
+    def _get_plugin(self, id_: tuple[str, str]) -> Plugin:
+        plugin = self._plugins.get(id_)
+        if plugin is None:
+            plugin = self._plugins[id_] = self._build_plugin(id_)
+        return plugin
+
+    def _build_plugin(self, id_: tuple[str, str]) -> Plugin:
+        display_name, display_host = id_
+        locations_by_version: dict[str, list[PluginArchiveLocation]] = {}
+
+        locations = self.index[id_]
+        specs_by_version: dict[str, list[tuple[frozenset[IdaVersion], frozenset[Platform]]]] = {}
+        for version, ida_versions, platforms in locations:
+            specs_by_version.setdefault(version, []).append((ida_versions, platforms))
+
+        # sort by version
+        for version in sorted(specs_by_version, key=parse_plugin_version):
+            # every indexed version has at least one location, so its list is created once, up front.
+            version_locations = locations_by_version[version] = []
+            # sorted arbitrarily (but stably)
+            for spec in sorted(specs_by_version[version]):
+                # sorted arbitrarily (but stably)
+                for url, sha256, metadata in sorted(locations[(version, *spec)]):
+                    # the metadata was validated when the archive was indexed, so skip re-validating it here.
+                    location = PluginArchiveLocation.model_construct(
+                        url=url,
+                        sha256=sha256,
+                        metadata=metadata,
+                    )
+                    version_locations.append(location)
+                    display_name = metadata.plugin.name
 
-        return ret
+        return Plugin.model_construct(name=display_name, host=display_host, versions=locations_by_version)
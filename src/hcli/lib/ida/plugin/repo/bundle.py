@@ -97,6 +97,7 @@ def load_manifest_from_zip(zf: zipfile.ZipFile) -> PluginBundleManifest:
 
 class PluginBundleRepo(BasePluginRepo):
     def __init__(self, path: Path):
+        super().__init__()
         self._path = path
         self._zf = zipfile.ZipFile(path, "r")
         try:
@@ -125,9 +126,13 @@ class PluginBundleRepo(BasePluginRepo):
         self._zf.close()
 
     def get_plugins(self) -> list[Plugin]:
-        return self._load_plugins_by_walking()
+        return self._index_plugins_by_walking().get_plugins()
 
-    def _load_plugins_by_walking(self) -> list[Plugin]:
+    def get_plugin_by_name(self, name: str, host: str | None = None) -> Plugin:
+        # only materialize the requested plugin.
+        return self._index_plugins_by_walking().get_plugin_by_name(name, host=host)
+
+    def _index_plugins_by_walking(self) -> PluginArchiveIndex:
         index = PluginArchiveIndex()
         for name in self._zf.namelist():
             if not name.startswith("plugins/"):
@@ -145,22 +150,22 @@ class PluginBundleRepo(BasePluginRepo):
             bundle_url = f"hcli-bundle:{name}"
             index.index_plugin_archive(plugin_zip_data, bundle_url, context={"bundle_member": name})
 
-        return index.get_plugins()
+        return index
 
     def _fetch_and_verify(self, location: PluginArchiveLocation) -> tuple[str, bytes]:
         plugin_name = location.metadata.plugin.name
         url = location.url
 
+        h = hashlib.sha256()
         if url.startswith("hcli-bundle:"):
             member_path = url[len("hcli-bundle:") :]
             buf = self._zf.read(member_path)
+            h.update(buf)
         else:
             from hcli.lib.ida.plugin.repo import fetch_plugin_archive
 
-            buf = fetch_plugin_archive(url)
+            buf = fetch_plugin_archive(url, h)
 
-        h = hashlib.sha256()
-        h.update(buf)
         sha256 = h.hexdigest()
 
         if sha256 != location.sha256:
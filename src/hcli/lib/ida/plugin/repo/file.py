@@ -4,10 +4,9 @@ from pathlib import Path
 from typing import Literal
 from urllib.parse import urlparse
 
-import httpx
 from pydantic import BaseModel
 
-from hcli.lib.ida.plugin.repo import BasePluginRepo, Plugin
+from hcli.lib.ida.plugin.repo import BasePluginRepo, Plugin, http_get_with_cache
 
 
 class StaticPluginRepo(BaseModel):
@@ -24,11 +23,11 @@ class JSONFilePluginRepo(BasePluginRepo):
         return self.plugins
 
     def to_json(self):
-        doc = StaticPluginRepo(plugins=self.get_plugins()).model_dump_json()
+        doc = StaticPluginRepo(plugins=self.get_plugins()).model_dump(mode="json")
         # pydantic doesn't have a way to emit json with sorted keys
         # and we want a deterministic file,
-        # so we re-encode here.
-        return json.dumps(json.loads(doc), sort_keys=True, indent=4)
+        # so we encode the JSON-compatible dump here.
+        return json.dumps(doc, sort_keys=True, indent=4)
 
     def to_bytes(self) -> bytes:
         return self.to_json().encode("utf-8")
@@ -39,7 +38,8 @@ class JSONFilePluginRepo(BasePluginRepo):
 
     @classmethod
     def from_bytes(cls, buf: bytes):
-        return cls.from_json(buf.decode("utf-8"))
+        # pydantic parses (and UTF-8 validates) the raw bytes itself; no need to decode to str first.
+        return cls(StaticPluginRepo.model_validate_json(buf).plugins)
 
     @classmethod
     def from_file(cls, path: Path):
@@ -56,11 +56,7 @@ class JSONFilePluginRepo(BasePluginRepo):
             return cls.from_bytes(file_path.read_bytes())
 
         elif parsed_url.scheme == "https":
-            response = httpx.get(url, timeout=30.0, follow_redirects=True)
-            response.raise_for_status()
-            if parsed_url.scheme == "https" and response.url.scheme != "https":
-                raise ValueError(f"HTTPS request was redirected to insecure HTTP URL: {response.url}")
-            return cls.from_bytes(response.content)
+            return cls.from_bytes(http_get_with_cache(url))
 
         else:
             raise ValueError(f"Unsupported URL scheme: {parsed_url.scheme}")
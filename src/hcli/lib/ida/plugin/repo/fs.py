@@ -1,28 +1,59 @@
+import hashlib
+import itertools
 import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from hcli.lib.ida.plugin.repo import BasePluginRepo, Plugin, PluginArchiveIndex
 
 
+def _read_plugin_archive(path: Path) -> tuple[bytes, str]:
+    buf = path.read_bytes()
+    return buf, hashlib.sha256(buf).hexdigest()
+
+
 class FileSystemPluginRepo(BasePluginRepo):
+    READ_WORKERS = 8  # concurrent archive reads while indexing
+
     def __init__(self, path: Path):
         super().__init__()
         self.path = path
 
     def get_plugins(self) -> list[Plugin]:
+        return self._build_index().get_plugins()
+
+    def get_plugin_by_name(self, name: str, host: str | None = None) -> Plugin:
+        # only materialize the requested plugin.
+        return self._build_index().get_plugin_by_name(name, host=host)
+
+    def _build_index(self) -> PluginArchiveIndex:
         index = PluginArchiveIndex()
 
+        paths = []
         for root, dirs, files in os.walk(self.path):
             for file in files:
                 if not file.endswith(".zip"):
                     continue
 
-                path = Path(os.path.join(root, file))
-                url = path.absolute().as_uri()
-
-                with open(path, "rb") as f:
-                    buf = f.read()
-
-                index.index_plugin_archive(buf, url)
-
-        return index.get_plugins()
+                paths.append(Path(os.path.join(root, file)))
+
+        # reading and hashing release the GIL, so they overlap across threads;
+        # parsing and indexing stay on this thread, in walk order.
+        # reads run only READ_WORKERS archives ahead of the indexing, so only that many are held in memory at once.
+        with ThreadPoolExecutor(max_workers=self.READ_WORKERS, thread_name_prefix="plugin-repo-read") as pool:
+            remaining_paths = iter(paths)
+            pending: deque[tuple[Path, Future[tuple[bytes, str]]]] = deque(
+                (path, pool.submit(_read_plugin_archive, path))
+                for path in itertools.islice(remaining_paths, self.READ_WORKERS)
+            )
+            while pending:
+                path, future = pending.popleft()
+                next_path = next(remaining_paths, None)
+                if next_path is not None:
+                    pending.append((next_path, pool.submit(_read_plugin_archive, next_path)))
+
+                buf, sha256 = future.result()
+                index.index_plugin_archive(buf, path.absolute().as_uri(), sha256=sha256)
+
+        return index
@@ -1,21 +1,28 @@
+import contextlib
 import functools
 import json
 import logging
+import multiprocessing
+import os
 import socket
+import sys
+import tempfile
 import time
-import urllib.error
 import urllib.parse
-import urllib.request
+from collections.abc import Callable, Generator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import httpx
+import pydantic_core
 import rich.progress
 from pydantic import BaseModel, ConfigDict, Field
 from tenacity import RetryCallState, retry, retry_if_exception, stop_after_attempt, wait_exponential
 from tenacity.wait import wait_base
 
 from hcli.lib.console import stderr_console
+from hcli.lib.ida.plugin import IDAMetadataDescriptor, MappedPluginArchive
 from hcli.lib.ida.plugin.repo import BasePluginRepo, Plugin, PluginArchiveIndex
 from hcli.lib.util.cache import get_cache_directory
 from hcli.lib.util.logging import m
@@ -27,6 +34,20 @@ MAX_DOWNLOAD_SIZE = 100 * 1024 * 1024
 
 GITHUB_API_URL = "https://api.github.com"
 
+# concurrent release asset and source archive downloads while collecting plugins.
+# the work is network-bound, so threads suffice.
+DOWNLOAD_WORKERS = 16
+# downloads are streamed to the cache in chunks of this size.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# releases metadata is revalidated once it's older than this.
+RELEASES_METADATA_MAX_AGE = 24 * 60 * 60
+# the REST listings whose ETags are used to revalidate releases metadata, and their query parameters.
+# they cover the releases (with their assets) and tags that plugins are collected from, but not everything
+# the GraphQL query returns (the default branch, tag ordering), so revalidation is only trusted for so long.
+RELEASES_METADATA_LISTINGS = {"releases": {"per_page": "10"}, "tags": {"per_page": "100"}}
+RELEASES_METADATA_MAX_REVALIDATED_AGE = 7 * 24 * 60 * 60
+
 
 def parse_github_url(url: str) -> tuple[str, str, str | None]:
     """Parse a direct-install GitHub URL into ``(owner, repo, tag)``.
@@ -126,6 +147,17 @@ def fetch_github_release_zip_asset(owner: str, repo: str, tag: str | None = None
     return asset_response.content
 
 
+@functools.cache
+def _get_github_http_client() -> httpx.Client:
+    # one client for all GitHub requests, so that they reuse keep-alive connections and TLS sessions
+    # rather than paying for a handshake each. sized for the concurrent downloads in GithubPluginRepo.
+    return httpx.Client(
+        timeout=60.0,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=DOWNLOAD_WORKERS * 2, max_keepalive_connections=DOWNLOAD_WORKERS),
+    )
+
+
 class WaitGitHubRateLimit(wait_base):
     """Custom wait strategy that respects GitHub's rate limit headers.
 
@@ -146,21 +178,18 @@ class WaitGitHubRateLimit(wait_base):
     def __call__(self, retry_state: RetryCallState) -> float:
         if retry_state.outcome and retry_state.outcome.failed:
             exception = retry_state.outcome.exception()
-            if isinstance(exception, urllib.error.HTTPError):
-                logger.debug(f"Rate limit headers received: {dict(exception.headers)}")
+            if isinstance(exception, httpx.HTTPStatusError):
+                headers = exception.response.headers
+                logger.debug(f"Rate limit headers received: {dict(headers)}")
 
-                retry_after = exception.headers.get("retry-after") or exception.headers.get("Retry-After")
+                retry_after = headers.get("retry-after") or headers.get("Retry-After")
                 if retry_after:
                     retry_after_seconds = max(int(retry_after), self.min_wait)
                     logger.info(f"GitHub rate limit hit, respecting retry-after: {retry_after_seconds}s")
                     return min(retry_after_seconds, self.max_wait)
 
-                remaining_str = exception.headers.get("x-ratelimit-remaining") or exception.headers.get(
-                    "X-RateLimit-Remaining"
-                )
-                reset_time_str = exception.headers.get("x-ratelimit-reset") or exception.headers.get(
-                    "X-RateLimit-Reset"
-                )
+                remaining_str = headers.get("x-ratelimit-remaining") or headers.get("X-RateLimit-Remaining")
+                reset_time_str = headers.get("x-ratelimit-reset") or headers.get("X-RateLimit-Reset")
 
                 if reset_time_str:
                     reset_time = int(reset_time_str)
@@ -198,7 +227,7 @@ class WaitGitHubRateLimit(wait_base):
 
 def _is_rate_limit_error(exception: BaseException) -> bool:
     """Check if exception is a GitHub rate limit error (403 or 429)."""
-    return isinstance(exception, urllib.error.HTTPError) and exception.code in (403, 429)
+    return isinstance(exception, httpx.HTTPStatusError) and exception.response.status_code in (403, 429)
 
 
 def _is_transient_error(exception: BaseException) -> bool:
@@ -209,11 +238,10 @@ def _is_transient_error(exception: BaseException) -> bool:
     errors (403/429) are intentionally excluded — they're handled by a separate
     retry layer with rate-limit-aware backoff.
     """
-    if isinstance(exception, urllib.error.HTTPError):
-        return exception.code in (500, 502, 503, 504)
-    # urllib.error.HTTPError is a subclass of URLError, so reaching this branch
-    # means the error is a non-HTTP URLError (e.g. connection refused, DNS).
-    if isinstance(exception, urllib.error.URLError):
+    if isinstance(exception, httpx.HTTPStatusError):
+        return exception.response.status_code in (500, 502, 503, 504)
+    # connection-level errors: connection refused, DNS, timeouts, and the like.
+    if isinstance(exception, httpx.TransportError):
         return True
     return isinstance(exception, (TimeoutError, socket.timeout))
 
@@ -258,18 +286,35 @@ def _check_and_handle_proactive_rate_limit(response) -> None:
     stop=stop_after_attempt(5),
     reraise=True,
 )
-def _urlopen_with_retry(req: urllib.request.Request):
-    """Wrapper around urllib.request.urlopen with GitHub rate-limit and transient-error retry logic.
+def _send_with_retry(request: httpx.Request) -> httpx.Response:
+    """Send the request on the shared GitHub client, with rate-limit and transient-error retry logic.
+
+    The response is streamed, so the caller must close it; prefer `_open_with_retry`.
 
     The inner retry handles 403/429 rate limits with rate-limit-aware backoff.
     The outer retry handles 5xx server errors and connection-level errors with
     short exponential backoff.
     """
-    response = urllib.request.urlopen(req)
+    response = _get_github_http_client().send(request, stream=True)
+    if response.is_error:
+        # read the body, for the error message, before giving up the connection.
+        response.read()
+        response.close()
+        response.raise_for_status()
     _check_and_handle_proactive_rate_limit(response)
     return response
 
 
+@contextlib.contextmanager
+def _open_with_retry(method: str, url: str, **kwargs: Any) -> Generator[httpx.Response, None, None]:
+    """Send a request to GitHub (with retries) and stream its response, which is closed on exit."""
+    response = _send_with_retry(_get_github_http_client().build_request(method, url, **kwargs))
+    try:
+        yield response
+    finally:
+        response.close()
+
+
 class GitHubReleaseAsset(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
@@ -378,16 +423,19 @@ class GitHubGraphQLClient:
         self.token = token
         self.api_url = "https://api.github.com/graphql"
         self.headers = {"Authorization": f"Bearer {self.token}", "Content-Type": "application/json"}
+        # number of repositories -> query text for get_many_releases
+        self._many_releases_queries: dict[int, str] = {}
 
     def query(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
         """Execute a GraphQL query"""
         data = {"query": query, "variables": variables or {}}
 
-        req = urllib.request.Request(self.api_url, data=json.dumps(data).encode("utf-8"), headers=self.headers)
-
+        # pydantic-core's JSON codec (already a dependency) encodes straight to bytes and parses bytes directly.
         try:
-            with _urlopen_with_retry(req) as response:
-                result = json.loads(response.read().decode("utf-8"))
+            with _open_with_retry(
+                "POST", self.api_url, content=pydantic_core.to_json(data), headers=self.headers
+            ) as response:
+                result = pydantic_core.from_json(response.read())
                 errors = result.get("errors", [])
                 if any(e.get("type") != "NOT_FOUND" for e in errors):
                     raise RuntimeError(f"GraphQL errors: {[e for e in errors if e.get('type') != 'NOT_FOUND']}")
@@ -395,28 +443,18 @@ class GitHubGraphQLClient:
                 for e in errors:
                     logger.warning("GitHub GraphQL NOT_FOUND (repo deleted/renamed): %s", e.get("message"))
                 return result["data"]
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode("utf-8")
-            raise RuntimeError(f"HTTP {e.code}: {error_body}")
+        except httpx.HTTPStatusError as e:
+            raise RuntimeError(f"HTTP {e.response.status_code}: {e.response.text}")
 
-    def get_many_releases(self, repos: list[tuple[str, str]], count: int = 10) -> dict[tuple[str, str], GitHubReleases]:
-        """Fetch releases for multiple repositories in a single query
-
-        Returns: mapping from (owner, repo) -> GitHubReleases
-        """
-        if not repos:
-            return {}
+    def _get_many_releases_query(self, repo_count: int) -> str:
+        query = self._many_releases_queries.get(repo_count)
+        if query is not None:
+            return query
 
-        logger.info(f"fetching releases from GitHub API for {len(repos)} repositories")
-
-        # Build query with aliases
         query_parts = []
-        variables = {"first": count}
-
-        for i, (owner, repo) in enumerate(repos):
-            alias = f"repo{i}"
+        for i in range(repo_count):
             query_parts.append(f"""
-                {alias}: repository(owner: "{owner}", name: "{repo}") {{
+                repo{i}: repository(owner: $owner{i}, name: $name{i}) {{
                     defaultBranchRef {{
                         target {{
                             ... on Commit {{
@@ -487,17 +525,40 @@ class GitHubGraphQLClient:
                 }}
             """)
 
+        declarations = "".join(f", $owner{i}: String!, $name{i}: String!" for i in range(repo_count))
         query = f"""
-        query($first: Int!) {{
+        query($first: Int!{declarations}) {{
             {"".join(query_parts)}
         }}
         """
+        self._many_releases_queries[repo_count] = query
+        return query
+
+    def get_many_releases(self, repos: list[tuple[str, str]], count: int = 10) -> dict[tuple[str, str], GitHubReleases]:
+        """Fetch releases for multiple repositories in a single query
+
+        Returns: mapping from (owner, repo) -> GitHubReleases
+        """
+        if not repos:
+            return {}
+
+        logger.info(f"fetching releases from GitHub API for {len(repos)} repositories")
+
+        # the query text only depends on the number of repositories, which are passed as variables,
+        # so the same few query texts are reused from batch to batch.
+        query = self._get_many_releases_query(len(repos))
+        variables: dict[str, Any] = {"first": count}
+        for i, (owner, repo) in enumerate(repos):
+            variables[f"owner{i}"] = owner
+            variables[f"name{i}"] = repo
 
         data = self.query(query, variables)
 
         result = {}
         for i, (owner, repo) in enumerate(repos):
-            repo_data = data.get(f"repo{i}")
+            # taken out of the response as it's converted, so that each repository's raw data can be freed
+            # as soon as its models are built, rather than the whole response staying alive alongside them.
+            repo_data = data.pop(f"repo{i}", None)
 
             if not repo_data or not repo_data.get("defaultBranchRef"):
                 logger.warning(f"Repository {owner}/{repo} not found")
@@ -523,14 +584,11 @@ class GitHubGraphQLClient:
 
 def parse_repository(repo_string: str) -> tuple[str, str]:
     """Parse repository string into owner and repo name"""
-    if "/" not in repo_string:
-        raise ValueError(f"invalid repository format: {repo_string}. Expected format: owner/repo")
-
-    parts = repo_string.split("/")
-    if len(parts) != 2:
+    owner, sep, repo = repo_string.partition("/")
+    if not sep or "/" in repo:
         raise ValueError(f"invalid repository format: {repo_string}. Expected format: owner/repo")
 
-    return parts[0], parts[1]
+    return owner, repo
 
 
 def get_source_archive_cache_directory(owner: str, repo: str, commit_hash: str) -> Path:
@@ -541,45 +599,187 @@ def get_release_asset_cache_directory(owner: str, repo: str, release_id: str) ->
     return get_cache_directory(owner, repo, "release-assets", release_id)
 
 
+# bump when the layout of the cached releases metadata changes.
+RELEASES_METADATA_CACHE_VERSION = "1"
+
+
 def get_releases_metadata_cache_path(owner: str, repo: str) -> Path:
     return get_cache_directory(owner, repo) / "releases.json"
 
 
+def get_releases_metadata_cache_version_path(owner: str, repo: str) -> Path:
+    return get_cache_directory(owner, repo) / "releases.version"
+
+
+def get_releases_metadata_etags_path(owner: str, repo: str) -> Path:
+    return get_cache_directory(owner, repo) / "releases.etag"
+
+
 def set_releases_metadata_cache(owner: str, repo: str, releases: GitHubReleases) -> None:
     cache_path = get_releases_metadata_cache_path(owner, repo)
-    releases_data = releases.model_dump()
-    cache_path.write_text(json.dumps(releases_data, indent=2, sort_keys=True), encoding="utf-8")
+    # serialize in one pass; fields are written in declaration order, which is just as stable as sorted keys.
+    # written compactly: the file is only read back by this module, and unindented JSON is a third smaller
+    # and correspondingly quicker to encode and parse.
+    cache_path.write_text(releases.model_dump_json(), encoding="utf-8")
+    # written after the data, so the sentinel never vouches for a file this version didn't write.
+    get_releases_metadata_cache_version_path(owner, repo).write_text(RELEASES_METADATA_CACHE_VERSION, encoding="utf-8")
     logger.debug(f"saved releases cache to: {cache_path}")
 
 
+def _construct_releases(data: dict[str, Any]) -> GitHubReleases:
+    """Build GitHubReleases from trusted, already-validated data (as dumped by model_dump), without re-validating it."""
+    return GitHubReleases.model_construct(
+        default_branch=GitHubCommit.model_construct(**data["default_branch"]),
+        releases=[
+            GitHubRelease.model_construct(
+                **dict(release, assets=[GitHubReleaseAsset.model_construct(**asset) for asset in release["assets"]])
+            )
+            for release in data["releases"]
+        ],
+        tags=[GitHubTag.model_construct(**tag) for tag in data["tags"]],
+    )
+
+
 def get_releases_metadata_cache(owner: str, repo: str) -> GitHubReleases:
     cache_path = get_releases_metadata_cache_path(owner, repo)
     if not cache_path.exists():
         raise KeyError(f"no releases cache found for {owner}/{repo}")
 
-    file_age = time.time() - cache_path.stat().st_mtime
+    stat = cache_path.stat()
+    file_age = time.time() - stat.st_mtime
 
     # release metadata cache expires after 24 hours
-    # based on file modification time
-    if file_age > 24 * 60 * 60:  # 24 hours
-        logger.info(f"cache expired for {owner}/{repo} releases metadata, removing file")
-        cache_path.unlink()
-        raise KeyError(f"expired releases cache removed for {owner}/{repo}")
+    # based on file modification time.
+    # the expired file is kept, so that it can be revalidated (see revalidate_releases_metadata_cache).
+    if file_age > RELEASES_METADATA_MAX_AGE:
+        logger.info(f"cache expired for {owner}/{repo} releases metadata")
+        raise KeyError(f"expired releases cache for {owner}/{repo}")
+
+    # each repository's metadata is read several times per session (warming the cache, then collecting plugins),
+    # so keep the parsed models around for as long as the file is unchanged.
+    return _load_releases_metadata_cache(owner, repo, cache_path, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_releases_metadata_cache(owner: str, repo: str, cache_path: Path, mtime_ns: int, size: int) -> GitHubReleases:
+    # the modification time and size are only part of the cache key, so a rewritten file is read afresh.
+    buf = cache_path.read_bytes()
+
+    # the data was validated before this version wrote it, so skip validating it again.
+    version_path = get_releases_metadata_cache_version_path(owner, repo)
+    if version_path.exists() and version_path.read_text(encoding="utf-8") == RELEASES_METADATA_CACHE_VERSION:
+        try:
+            return _construct_releases(pydantic_core.from_json(buf))
+        except (KeyError, TypeError) as e:
+            logger.debug(f"unexpected releases cache layout for {owner}/{repo}, validating it: {e}")
+
+    # otherwise, parse and validate in one pass, straight from the raw bytes.
+    return GitHubReleases.model_validate_json(buf)
+
+
+def get_releases_metadata_etags(owner: str, repo: str) -> dict[str, str]:
+    """The ETags of the listings the cached releases metadata was fetched alongside, if still usable."""
+    etags_path = get_releases_metadata_etags_path(owner, repo)
+    try:
+        stat = etags_path.stat()
+    except FileNotFoundError:
+        return {}
+
+    # the ETags are written with freshly fetched metadata, so their age is the age of the metadata itself.
+    if time.time() - stat.st_mtime > RELEASES_METADATA_MAX_REVALIDATED_AGE:
+        logger.debug(f"releases metadata for {owner}/{repo} revalidated for too long, fetching it afresh")
+        return {}
+
+    try:
+        return json.loads(etags_path.read_text(encoding="utf-8"))
+    except ValueError:
+        return {}
+
+
+def set_releases_metadata_etags(owner: str, repo: str, etags: dict[str, str]) -> None:
+    get_releases_metadata_etags_path(owner, repo).write_text(json.dumps(etags), encoding="utf-8")
+
+
+def fetch_releases_metadata_etags(
+    token: str, owner: str, repo: str, etags: dict[str, str]
+) -> tuple[bool, dict[str, str]]:
+    """Conditionally request the repository's release and tag listings.
+
+    Returns whether either listing changed since the given ETags, and the listings' current ETags.
+    Unchanged listings come back as 304s without a body, which don't count against GitHub's rate limit.
+    """
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "ida-hcli",
+    }
+
+    changed = False
+    current_etags = {}
+    for name, params in RELEASES_METADATA_LISTINGS.items():
+        request_headers = dict(headers)
+        if etag := etags.get(name):
+            request_headers["If-None-Match"] = etag
+
+        url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/{name}"
+        with _open_with_retry("GET", url, params=params, headers=request_headers) as response:
+            if response.status_code != 304:
+                changed = True
+            current_etags[name] = response.headers.get("ETag") or etag or ""
+
+    return changed, current_etags
 
-    releases_data = json.loads(cache_path.read_text())
-    return GitHubReleases.model_validate(releases_data)
 
+def revalidate_releases_metadata_cache(client: GitHubGraphQLClient, owner: str, repo: str) -> dict[str, str] | None:
+    """Check an expired releases metadata cache with conditional requests, renewing it if the repository is unchanged.
 
-def warm_releases_metadata_cache(client: GitHubGraphQLClient, repos: list[tuple[str, str]]) -> None:
+    Returns None when the cache was renewed, otherwise the listings' current ETags,
+    to be stored (see set_releases_metadata_etags) once the metadata has been fetched afresh.
+    """
+    cache_path = get_releases_metadata_cache_path(owner, repo)
+    if not cache_path.exists():
+        # nothing to revalidate: the metadata will be fetched anyway, and its ETags collected when it next expires.
+        return {}
+
+    etags = get_releases_metadata_etags(owner, repo)
+    try:
+        changed, current_etags = fetch_releases_metadata_etags(client.token, owner, repo, etags)
+    except httpx.HTTPError as e:
+        logger.debug(f"failed to revalidate releases metadata for {owner}/{repo}: {e}")
+        return {}
+
+    if etags and not changed:
+        logger.debug(f"releases metadata unchanged for {owner}/{repo}, renewing cache")
+        os.utime(cache_path)
+        return None
+
+    return current_etags
+
+
+def warm_releases_metadata_cache(client: GitHubGraphQLClient, repos: Sequence[tuple[str, str]]) -> None:
     """Warm the releases metadata cache for multiple repositories"""
 
-    repos_to_fetch = []
+    expired_repos = []
 
     for owner, repo in repos:
         try:
             get_releases_metadata_cache(owner, repo)
         except KeyError:
-            repos_to_fetch.append((owner, repo))
+            expired_repos.append((owner, repo))
+
+    # expired entries are usually unchanged, so check them with (concurrent) conditional requests first,
+    # and only fetch the metadata of the repositories that did change.
+    repos_to_fetch = []
+    fetched_etags = {}
+    if expired_repos:
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS, thread_name_prefix="github-revalidate") as pool:
+            results = list(
+                pool.map(lambda owner_repo: revalidate_releases_metadata_cache(client, *owner_repo), expired_repos)
+            )
+        for (owner, repo), etags in zip(expired_repos, results):
+            if etags is not None:
+                repos_to_fetch.append((owner, repo))
+                fetched_etags[(owner, repo)] = etags
 
     if not repos_to_fetch:
         logger.debug("all repositories already cached")
@@ -587,7 +787,7 @@ def warm_releases_metadata_cache(client: GitHubGraphQLClient, repos: list[tuple[
 
     logger.debug(f"warming cache for {len(repos_to_fetch)} repositories")
 
-    BATCH_SIZE = 10
+    BATCH_SIZE = 50
     for i in rich.progress.track(
         range(0, len(repos_to_fetch), BATCH_SIZE), description="Warming cache", transient=True, console=stderr_console
     ):
@@ -596,6 +796,9 @@ def warm_releases_metadata_cache(client: GitHubGraphQLClient, repos: list[tuple[
 
         for (owner, repo), releases in releases_batch.items():
             set_releases_metadata_cache(owner, repo, releases)
+            # written after the metadata, so the ETags never vouch for older metadata.
+            if etags := fetched_etags.get((owner, repo)):
+                set_releases_metadata_etags(owner, repo, etags)
 
 
 def get_releases_metadata(client: GitHubGraphQLClient, owner: str, repo: str) -> GitHubReleases:
@@ -607,42 +810,79 @@ def get_releases_metadata(client: GitHubGraphQLClient, owner: str, repo: str) ->
         return releases
 
 
+@contextlib.contextmanager
+def _open_cache_file_for_writing(path: Path) -> Generator[BinaryIO, None, None]:
+    # write to a sibling temporary file and then rename it into place,
+    # so that concurrent downloads (or readers) never see a partially written file.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _write_cache_file(path: Path, buf: bytes) -> None:
+    with _open_cache_file_for_writing(path) as f:
+        f.write(buf)
+
+
+def _download_to_cache_file(url: str, path: Path) -> int:
+    """Stream the resource at the URL into the cache file, chunk by chunk, returning its size.
+
+    The size limit is enforced while streaming, since source archives don't report their size up front;
+    an oversized download is abandoned and leaves nothing in the cache.
+    """
+    with _open_with_retry("GET", url) as response, _open_cache_file_for_writing(path) as f:
+        for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+            if f.tell() > MAX_DOWNLOAD_SIZE:
+                raise ValueError(f"download from {url} exceeds {MAX_DOWNLOAD_SIZE} limit")
+        return f.tell()
+
+
 def set_release_asset_cache(owner: str, repo: str, release_id: str, asset: GitHubReleaseAsset, buf: bytes):
     cache_path = get_release_asset_cache_directory(owner, repo, release_id)
-    (cache_path / asset.name).write_bytes(buf)
+    _write_cache_file(cache_path / asset.name, buf)
     logger.debug(f"asset {asset.name} cached for {owner}/{repo} release {release_id}")
 
 
-def get_release_asset_cache(owner: str, repo: str, release_id: str, asset: GitHubReleaseAsset) -> bytes:
+def get_release_asset_cache(owner: str, repo: str, release_id: str, asset: GitHubReleaseAsset) -> MappedPluginArchive:
     cache_path = get_release_asset_cache_directory(owner, repo, release_id)
     asset_path = cache_path / asset.name
     if not asset_path.exists():
         raise KeyError(f"asset {asset.name} not found in cache for {owner}/{repo} release {release_id}")
 
     logger.debug(f"asset {asset.name} found in cache for {owner}/{repo} release {release_id}")
-    return asset_path.read_bytes()
+    return MappedPluginArchive.open(asset_path)
 
 
-def download_release_asset(owner: str, repo: str, release_id: str, asset: GitHubReleaseAsset) -> bytes:
+def download_release_asset(owner: str, repo: str, release_id: str, asset: GitHubReleaseAsset, path: Path) -> None:
+    """Download the release asset into the given file, without holding the whole asset in memory."""
     if asset.size > MAX_DOWNLOAD_SIZE:
         raise ValueError(f"asset {asset.name} exceeds {MAX_DOWNLOAD_SIZE} limit")
 
     logger.info(f"downloading asset: {asset.name} ({asset.size}) from {asset.download_url}")
-    req = urllib.request.Request(asset.download_url)
-    with _urlopen_with_retry(req) as response:
-        asset_data = response.read()
+    size = _download_to_cache_file(asset.download_url, path)
+    logger.debug(f"downloaded {size} bytes for asset {asset.name}")
 
-    logger.debug(f"downloaded {len(asset_data)} bytes for asset {asset.name}")
-    return asset_data
 
+def get_release_asset_path(owner: str, repo: str, release_id: str, asset: GitHubReleaseAsset) -> Path:
+    """The path of the release asset in the cache, downloading it first if it isn't there yet."""
+    asset_path = get_release_asset_cache_directory(owner, repo, release_id) / asset.name
+    if asset_path.exists():
+        logger.debug(f"asset {asset.name} found in cache for {owner}/{repo} release {release_id}")
+        return asset_path
+
+    download_release_asset(owner, repo, release_id, asset, asset_path)
+    logger.debug(f"asset {asset.name} cached for {owner}/{repo} release {release_id}")
+    return asset_path
 
-def get_release_asset(owner: str, repo: str, release_id: str, asset: GitHubReleaseAsset) -> bytes:
-    try:
-        return get_release_asset_cache(owner, repo, release_id, asset)
-    except KeyError:
-        buf = download_release_asset(owner, repo, release_id, asset)
-        set_release_asset_cache(owner, repo, release_id, asset, buf)
-        return buf
+
+def get_release_asset(owner: str, repo: str, release_id: str, asset: GitHubReleaseAsset) -> MappedPluginArchive:
+    return MappedPluginArchive.open(get_release_asset_path(owner, repo, release_id, asset))
 
 
 SOURCE_ARCHIVE_FILENAME = "source.zip"
@@ -650,37 +890,41 @@ SOURCE_ARCHIVE_FILENAME = "source.zip"
 
 def set_source_archive_cache(owner: str, repo: str, commit_hash: str, buf: bytes):
     cache_path = get_source_archive_cache_directory(owner, repo, commit_hash)
-    (cache_path / SOURCE_ARCHIVE_FILENAME).write_bytes(buf)
+    _write_cache_file(cache_path / SOURCE_ARCHIVE_FILENAME, buf)
     logger.debug(f"Source archive cached for {owner}/{repo}@{commit_hash[:8]}")
 
 
-def get_source_archive_cache(owner: str, repo: str, commit_hash: str) -> bytes:
+def get_source_archive_cache(owner: str, repo: str, commit_hash: str) -> MappedPluginArchive:
     cache_path = get_source_archive_cache_directory(owner, repo, commit_hash)
     archive_path = cache_path / SOURCE_ARCHIVE_FILENAME
     if not archive_path.exists():
         raise KeyError(f"source archive not found in cache for {owner}/{repo}@{commit_hash[:8]}")
 
     logger.debug(f"source archive found in cache for {owner}/{repo}@{commit_hash[:8]}")
-    return archive_path.read_bytes()
+    return MappedPluginArchive.open(archive_path)
 
 
-def download_source_archive(zip_url: str) -> bytes:
+def download_source_archive(zip_url: str, path: Path) -> None:
+    """Download the source archive into the given file, without holding the whole archive in memory."""
     logger.info(f"downloading source archive from {zip_url}")
-    req = urllib.request.Request(zip_url)
-    with _urlopen_with_retry(req) as response:
-        buf = response.read()
+    size = _download_to_cache_file(zip_url, path)
+    logger.debug(f"downloaded {size} bytes from {zip_url}")
 
-    logger.debug(f"downloaded {len(buf)} bytes from {zip_url}")
-    return buf
 
+def get_source_archive_path(owner: str, repo: str, commit_hash: str, zip_url: str) -> Path:
+    """The path of the source archive in the cache, downloading it first if it isn't there yet."""
+    archive_path = get_source_archive_cache_directory(owner, repo, commit_hash) / SOURCE_ARCHIVE_FILENAME
+    if archive_path.exists():
+        logger.debug(f"source archive found in cache for {owner}/{repo}@{commit_hash[:8]}")
+        return archive_path
+
+    download_source_archive(zip_url, archive_path)
+    logger.debug(f"Source archive cached for {owner}/{repo}@{commit_hash[:8]}")
+    return archive_path
 
-def get_source_archive(owner: str, repo: str, commit_hash: str, zip_url: str) -> bytes:
-    try:
-        return get_source_archive_cache(owner, repo, commit_hash)
-    except KeyError:
-        buf = download_source_archive(zip_url)
-        set_source_archive_cache(owner, repo, commit_hash, buf)
-        return buf
+
+def get_source_archive(owner: str, repo: str, commit_hash: str, zip_url: str) -> MappedPluginArchive:
+    return MappedPluginArchive.open(get_source_archive_path(owner, repo, commit_hash, zip_url))
 
 
 def get_release_metadata(client: GitHubGraphQLClient, owner: str, repo: str, release_id: str) -> GitHubRelease:
@@ -692,6 +936,159 @@ def get_release_metadata(client: GitHubGraphQLClient, owner: str, repo: str, rel
     raise KeyError(f"release {release_id} not found for {owner}/{repo}")
 
 
+def _try_get_release_asset(owner: str, repo: str, release_id: str, asset: GitHubReleaseAsset) -> Path | None:
+    logger.debug(m("fetching release asset: %s", asset.download_url, owner=owner, repo=repo, tag=release_id))
+    try:
+        return get_release_asset_path(owner, repo, release_id, asset)
+    except ValueError:
+        return None
+
+
+def _try_get_source_archive(owner: str, repo: str, commit_hash: str, zip_url: str) -> Path | None:
+    logger.debug(m("fetching source archive: %s", zip_url, owner=owner, repo=repo, commit=commit_hash))
+    try:
+        return get_source_archive_path(owner, repo, commit_hash, zip_url)
+    except ValueError:
+        return None
+
+
+def _read_archive_metadatas(path: Path) -> tuple[str, list[tuple[Path, IDAMetadataDescriptor]]]:
+    """Hash and parse the plugin archive at the given path; runs in a parse worker."""
+    with MappedPluginArchive.open(path) as buf:
+        return PluginArchiveIndex().get_archive_metadatas(buf)
+
+
+def _fetch_archive_metadatas(
+    parse_pool: Executor, fetch: Callable[..., Path | None], *args: Any
+) -> tuple[str, list[tuple[Path, IDAMetadataDescriptor]]] | None:
+    """Fetch an archive into the cache (on a download thread), then parse it in the pool: its sha256 and plugins."""
+    path = fetch(*args)
+    if path is None:
+        return None
+
+    # the worker maps the cached file itself, rather than being sent a copy of the archive.
+    return parse_pool.submit(_read_archive_metadatas, path).result()
+
+
+def _get_archive_parse_pool() -> Executor:
+    # unzipping and validating metadata is CPU-bound, so archives are parsed in worker processes, one per core.
+    # workers are spawned, not forked, as the download threads are running by then.
+    # frozen builds can't re-launch themselves as workers, so they parse on threads instead.
+    if getattr(sys, "frozen", False):
+        return ThreadPoolExecutor(thread_name_prefix="github-parse")
+    return ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+
+
+# bump when the layout of the persisted plugin index changes.
+PLUGIN_INDEX_CACHE_VERSION = "1"
+
+
+def get_plugin_index_cache_path(owner: str, repo: str) -> Path:
+    return get_cache_directory(owner, repo) / "plugin-index.json"
+
+
+def set_plugin_index_cache(owner: str, repo: str, archives: dict[str, Any]) -> None:
+    cache_path = get_plugin_index_cache_path(owner, repo)
+    doc = {"version": PLUGIN_INDEX_CACHE_VERSION, "archives": archives}
+    _write_cache_file(cache_path, json.dumps(doc, indent=2, sort_keys=True).encode("utf-8"))
+    logger.debug(f"saved plugin index cache to: {cache_path}")
+
+
+def get_plugin_index_cache(owner: str, repo: str) -> dict[str, Any]:
+    cache_path = get_plugin_index_cache_path(owner, repo)
+    if not cache_path.exists():
+        raise KeyError(f"no plugin index cache found for {owner}/{repo}")
+
+    doc = json.loads(cache_path.read_bytes())
+    if doc.get("version") != PLUGIN_INDEX_CACHE_VERSION:
+        raise KeyError(f"outdated plugin index cache for {owner}/{repo}")
+
+    return doc["archives"]
+
+
+class _ArchiveMetadataCache:
+    """The plugins found in each cached archive, persisted per repository so that later runs skip parsing them.
+
+    Entries are keyed by the archive's path within the repository's cache directory,
+    and only trusted while the archive's size and modification time are unchanged.
+    """
+
+    def __init__(self):
+        # (owner, repo) -> archive key -> entry
+        self._archives: dict[tuple[str, str], dict[str, Any]] = {}
+        self._dirty: set[tuple[str, str]] = set()
+
+    def _get_archives(self, owner: str, repo: str) -> dict[str, Any]:
+        archives = self._archives.get((owner, repo))
+        if archives is None:
+            try:
+                archives = get_plugin_index_cache(owner, repo)
+            except (KeyError, ValueError) as e:
+                logger.debug(f"not using plugin index cache for {owner}/{repo}: {e}")
+                archives = {}
+            self._archives[(owner, repo)] = archives
+        return archives
+
+    @staticmethod
+    def _get_key(owner: str, repo: str, archive_path: Path) -> str:
+        return archive_path.relative_to(get_cache_directory(owner, repo)).as_posix()
+
+    def get(
+        self, owner: str, repo: str, archive_path: Path
+    ) -> tuple[str, list[tuple[Path, IDAMetadataDescriptor]]] | None:
+        """The sha256 and the (path, metadata) of the valid plugins of the cached archive, if it was already parsed."""
+        entry = self._get_archives(owner, repo).get(self._get_key(owner, repo, archive_path))
+        if entry is None:
+            return None
+
+        try:
+            stat = archive_path.stat()
+        except FileNotFoundError:
+            return None
+
+        if (stat.st_size, stat.st_mtime_ns) != (entry["size"], entry["mtime_ns"]):
+            return None
+
+        try:
+            metadatas = [
+                (Path(plugin["path"]), IDAMetadataDescriptor.model_validate(plugin["metadata"]))
+                for plugin in entry["plugins"]
+            ]
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"invalid plugin index entry for {archive_path}: {e}")
+            return None
+
+        return entry["sha256"], metadatas
+
+    def set(
+        self,
+        owner: str,
+        repo: str,
+        archive_path: Path,
+        sha256: str,
+        metadatas: list[tuple[Path, IDAMetadataDescriptor]],
+    ) -> None:
+        try:
+            stat = archive_path.stat()
+        except FileNotFoundError:
+            return
+
+        self._get_archives(owner, repo)[self._get_key(owner, repo, archive_path)] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": sha256,
+            "plugins": [
+                {"path": path.as_posix(), "metadata": metadata.model_dump(mode="json")} for path, metadata in metadatas
+            ],
+        }
+        self._dirty.add((owner, repo))
+
+    def save(self) -> None:
+        for owner, repo in sorted(self._dirty):
+            set_plugin_index_cache(owner, repo, self._archives[(owner, repo)])
+        self._dirty.clear()
+
+
 def get_candidate_github_repos_cache_path() -> Path:
     return get_cache_directory() / "candidate_repos.json"
 
@@ -748,9 +1145,8 @@ def find_github_repos_with_plugins(token: str) -> list[str]:
             params = f"q={urllib.parse.quote(query)}&per_page={BATCH_SIZE}&page={page}"
             url = f"{search_url}?{params}"
 
-            req = urllib.request.Request(url, headers=headers)
-            with _urlopen_with_retry(req) as response:
-                result = json.loads(response.read().decode("utf-8"))
+            with _open_with_retry("GET", url, headers=headers) as response:
+                result = json.loads(response.read())
 
                 items = result.get("items", [])
                 if not items:
@@ -790,7 +1186,7 @@ class GithubPluginRepo(BasePluginRepo):
 
         warm_releases_metadata_cache(self.client, self._repos)
 
-    def _get_repos(self):
+    def _get_repos(self) -> tuple[tuple[str, str], ...]:
         try:
             repos = set(get_candidate_github_repos_cache())
         except KeyError:
@@ -815,7 +1211,8 @@ class GithubPluginRepo(BasePluginRepo):
             logger.debug("ignoring found repo: %s", repo)
         repos -= ignored
 
-        return [parse_repository(repo) for repo in sorted(repos)]
+        # parsed and sorted once, up front; get_plugins and the cache warm-up consume it as is.
+        return tuple(parse_repository(repo) for repo in sorted(repos))
 
     @functools.cache  # noqa: B019 - instance method caching is intentional; repo is long-lived
     def get_plugins(self) -> list[Plugin]:
@@ -826,7 +1223,7 @@ class GithubPluginRepo(BasePluginRepo):
         # then fetch them in a second loop
         # so that we can have a meaningful progress bar.
 
-        for owner, repo in sorted(self._repos):
+        for owner, repo in self._repos:
             logger.debug("finding plugins in repo: %s/%s", owner, repo)
 
             try:
@@ -930,53 +1327,119 @@ class GithubPluginRepo(BasePluginRepo):
                     logger.debug(m("found zipball URL: %s", tag.zipball_url, **context))
 
         index = PluginArchiveIndex()
-
-        for owner, repo, tag_name, asset, date in rich.progress.track(
-            assets, description="Fetching plugin assests", transient=True, console=stderr_console
-        ):
-            logger.debug(m("fetching release asset: %s", asset.download_url, owner=owner, repo=repo, tag=tag_name))
-            try:
-                buf = get_release_asset(owner, repo, tag_name, asset)
-            except ValueError:
-                continue
-
-            host_url = f"https://github.com/{owner}/{repo}"
-            index.index_plugin_archive(
-                buf,
-                asset.download_url,
-                expected_host=host_url,
-                context={
+        # archives parsed by earlier runs don't need to be read (nor downloaded) again.
+        archive_metadatas = _ArchiveMetadataCache()
+
+        # download and parse everything concurrently, but index the results in order, on this thread,
+        # so that the index is built deterministically. all the downloads are submitted up front,
+        # so source archives are fetched while the release assets are still being indexed.
+        pool = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS, thread_name_prefix="github-fetch")
+        parse_pool = _get_archive_parse_pool()
+        try:
+            # archives that share a cache path (like the zipballs of a release and a tag for the same commit)
+            # are the same file, so they're fetched once and indexed under each of their URLs.
+            futures_by_path: dict[Path, Future] = {}
+
+            asset_jobs = []
+            for owner, repo, tag_name, asset, _ in assets:
+                path = get_release_asset_cache_directory(owner, repo, tag_name) / asset.name
+                found = archive_metadatas.get(owner, repo, path)
+                future = None
+                if found is None:
+                    future = futures_by_path.get(path)
+                    if future is None:
+                        future = futures_by_path[path] = pool.submit(
+                            _fetch_archive_metadatas,
+                            parse_pool,
+                            _try_get_release_asset,
+                            owner,
+                            repo,
+                            tag_name,
+                            asset,
+                        )
+                asset_jobs.append((path, found, future))
+
+            source_archive_jobs = []
+            for owner, repo, commit_hash, url, _ in source_archives:
+                path = get_source_archive_cache_directory(owner, repo, commit_hash) / SOURCE_ARCHIVE_FILENAME
+                found = archive_metadatas.get(owner, repo, path)
+                future = None
+                if found is None:
+                    future = futures_by_path.get(path)
+                    if future is None:
+                        future = futures_by_path[path] = pool.submit(
+                            _fetch_archive_metadatas,
+                            parse_pool,
+                            _try_get_source_archive,
+                            owner,
+                            repo,
+                            commit_hash,
+                            url,
+                        )
+                source_archive_jobs.append((path, found, future))
+
+            for (owner, repo, tag_name, asset, date), (path, found, future) in rich.progress.track(
+                zip(assets, asset_jobs),
+                total=len(assets),
+                description="Fetching plugin assests",
+                transient=True,
+                console=stderr_console,
+            ):
+                context = {
                     "owner": owner,
                     "repo": repo,
                     "type": "release asset",
                     "tag": tag_name,
                     "url": asset.download_url,
                     "date": date,
-                },
-            )
+                }
+                if found is None:
+                    assert future is not None
+                    found = future.result()
+                    if found is None:
+                        continue
+                    archive_metadatas.set(owner, repo, path, *found)
 
-        for owner, repo, commit_hash, url, date in rich.progress.track(
-            source_archives, description="Fetching plugin source archives", transient=True, console=stderr_console
-        ):
-            logger.debug(m("fetching source archive: %s", url, owner=owner, repo=repo, commit=commit_hash))
-            try:
-                buf = get_source_archive(owner, repo, commit_hash, url)
-            except ValueError:
-                continue
+                sha256, metadatas = found
+                host_url = f"https://github.com/{owner}/{repo}"
+                index.index_plugin_metadatas(
+                    metadatas, asset.download_url, sha256, expected_host=host_url, context=context
+                )
 
-            host_url = f"https://github.com/{owner}/{repo}"
-            index.index_plugin_archive(
-                buf,
-                url,
-                expected_host=host_url,
-                context={
+            for (owner, repo, commit_hash, url, date), (path, found, future) in rich.progress.track(
+                zip(source_archives, source_archive_jobs),
+                total=len(source_archives),
+                description="Fetching plugin source archives",
+                transient=True,
+                console=stderr_console,
+            ):
+                context = {
                     "owner": owner,
                     "repo": repo,
                     "type": "source archive",
                     "commit": commit_hash,
                     "url": url,
                     "date": date,
-                },
-            )
+                }
+                if found is None:
+                    assert future is not None
+                    found = future.result()
+                    if found is None:
+                        continue
+                    archive_metadatas.set(owner, repo, path, *found)
+
+                sha256, metadatas = found
+                host_url = f"https://github.com/{owner}/{repo}"
+                index.index_plugin_metadatas(metadatas, url, sha256, expected_host=host_url, context=context)
+        except BaseException:
+            # on an error or Ctrl-C, don't wait for the outstanding downloads and parses.
+            pool.shutdown(wait=False, cancel_futures=True)
+            parse_pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        else:
+            pool.shutdown()
+            parse_pool.shutdown()
+
+        archive_metadatas.save()
 
         return index.get_plugins()
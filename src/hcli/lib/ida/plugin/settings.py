@@ -1,3 +1,4 @@
+import functools
 import inspect
 import logging
 from pathlib import Path
@@ -162,6 +163,31 @@ def has_plugin_setting(plugin_name: str, key: str) -> bool:
     return key in plugin_config.settings
 
 
+@functools.lru_cache(maxsize=1024)
+def _find_plugin_directory_name(plugins_path: Path, module_filename: str) -> str | None:
+    """Find the name of the directory under the plugins directory that contains the given module, if any.
+
+    Remembered per module, since every call to get_current_plugin() walks the same frames,
+    and resolving their paths costs a few syscalls each.
+    """
+    # Compare against both the symlink-preserving and resolved forms of the
+    # plugins directory. This lets editable installs that symlink the plugin
+    # directory into $IDAUSR/plugins/ work: Python's frame `co_filename` is
+    # whatever path was used to import (the symlink), while `Path.resolve()`
+    # follows symlinks. We try every combination so either layout matches.
+    plugin_root_candidates = {plugins_path, plugins_path.resolve()}
+
+    module_path = Path(module_filename)
+    for mp in (module_path, module_path.resolve()):
+        for pp in plugin_root_candidates:
+            try:
+                module_relative_path = mp.relative_to(pp)
+            except ValueError:
+                continue
+            return module_relative_path.parts[0]
+    return None
+
+
 def get_current_plugin() -> str:
     """Get the plugin name by walking the call stack.
 
@@ -182,33 +208,13 @@ def get_current_plugin() -> str:
         raise RuntimeError("failed to get current frame")
 
     try:
-        # Compare against both the symlink-preserving and resolved forms of the
-        # plugins directory. This lets editable installs that symlink the plugin
-        # directory into $IDAUSR/plugins/ work: Python's frame `co_filename` is
-        # whatever path was used to import (the symlink), while `Path.resolve()`
-        # follows symlinks. We try every combination so either layout matches.
         plugins_path = get_plugins_directory()
-        plugin_root_candidates = {plugins_path, plugins_path.resolve()}
 
         current_frame = frame.f_back
         while current_frame is not None:
             logger.debug("inspecting frame: %s", current_frame)
             module_filename = current_frame.f_code.co_filename
-            module_path = Path(module_filename)
-            module_path_candidates = (module_path, module_path.resolve())
-
-            plugin_directory_name = None
-            for mp in module_path_candidates:
-                for pp in plugin_root_candidates:
-                    try:
-                        module_relative_path = mp.relative_to(pp)
-                    except ValueError:
-                        continue
-                    plugin_directory_name = module_relative_path.parts[0]
-                    break
-                if plugin_directory_name is not None:
-                    break
-
+            plugin_directory_name = _find_plugin_directory_name(plugins_path, module_filename)
             if plugin_directory_name is None:
                 current_frame = current_frame.f_back
                 continue
@@ -1,13 +1,25 @@
 # see also hcli.lib.util.python
+import collections
+import hashlib
+import json
 import logging
 import os
 import platform
+import re
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion, Version
+
 from hcli.env import ENV
-from hcli.lib.ida import run_py_in_current_idapython
+from hcli.lib.ida import find_current_idat_executable, get_ida_user_dir, run_py_in_current_idapython
+from hcli.lib.util.cache import get_cache_directory
+from hcli.lib.venv import resolve_user_virtual_env
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +88,11 @@ def _get_venv_root_from_python(path: str | None) -> Path | None:
     return None
 
 
+def _is_executable_file(path: str) -> bool:
+    # not a directory that happens to be named like the interpreter, and runnable by us.
+    return os.path.isfile(path) and os.access(path, os.X_OK)
+
+
 def _get_prefix_candidates(prefix: str | None, version: str, is_windows: bool) -> list[str]:
     if not prefix:
         return []
@@ -120,22 +137,28 @@ def _derive_python_exe(info: dict) -> Path:
         for candidate in _get_prefix_candidates(prefix, version, is_windows)
     ]
 
-    for candidate in prefix_candidates:
-        logger.debug("candidate: %s (exists: %s)", candidate, os.path.exists(candidate))
+    # stat each candidate once, concurrently, since on network-mounted installs the latency adds up.
+    # existing candidates keep their priority order.
+    with ThreadPoolExecutor(max_workers=max(len(prefix_candidates), 1)) as pool:
+        candidates_exist = list(pool.map(_is_executable_file, prefix_candidates))
+    existing_candidates = []
+    for candidate, exists in zip(prefix_candidates, candidates_exist):
+        logger.debug("candidate: %s (exists: %s)", candidate, exists)
+        if exists:
+            existing_candidates.append(candidate)
 
     # The preferred path: sys.prefix/sys.base_prefix identify the interpreter layout.
-    for candidate in prefix_candidates:
-        if os.path.exists(candidate):
+    # Looking for a pyvenv.cfg beside each candidate is only worth it when a venv was requested.
+    if requested_venv_root or normalized_virtual_env:
+        for candidate in existing_candidates:
             candidate_venv = _get_venv_root_from_python(candidate)
             if requested_venv_root and candidate_venv == requested_venv_root:
                 return Path(candidate)
             if normalized_virtual_env and _normalize_path(str(candidate_venv)) == normalized_virtual_env:
                 return Path(candidate)
 
-    if info["prefix"] != info["base_prefix"]:
-        for candidate in prefix_candidates:
-            if os.path.exists(candidate):
-                return Path(candidate)
+    if info["prefix"] != info["base_prefix"] and existing_candidates:
+        return Path(existing_candidates[0])
 
     # macOS can report the base framework prefix even when IDA requested a venv.
     # In that case, accept sys.executable only when it can be validated as a real venv
@@ -166,9 +189,8 @@ def _derive_python_exe(info: dict) -> Path:
         logger.debug("using IDAPYTHON_VENV_EXECUTABLE directly: %s", requested_venv_executable)
         return Path(requested_venv_executable)
 
-    for candidate in prefix_candidates:
-        if os.path.exists(candidate):
-            return Path(candidate)
+    if existing_candidates:
+        return Path(existing_candidates[0])
 
     raise PythonNotFoundError(
         "Could not detect IDA's Python executable.\n"
@@ -182,6 +204,158 @@ def _derive_python_exe(info: dict) -> Path:
     )
 
 
+# detecting IDA's Python means running idat, which takes seconds,
+# so the result is remembered (in memory and on disk) for as long as nothing that selects the interpreter changes.
+PYTHON_EXECUTABLE_CACHE_MAX_AGE = 24 * 60 * 60
+
+# fingerprint -> IDA's Python executable, for this process.
+_python_executables: dict[str, Path] = {}
+# Python executables known to have pip, for this process.
+_pip_python_executables: set[Path] = set()
+
+
+def _get_stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _get_windows_python_target_dll() -> str | None:
+    """The Python DLL selected by idapyswitch on Windows, where it's recorded in the registry rather than ida.reg."""
+    if platform.system() != "Windows":
+        return None
+
+    import winreg  # type: ignore[import-untyped]
+
+    try:
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Hex-Rays\IDA") as key:  # type: ignore[attr-defined]
+            return str(winreg.QueryValueEx(key, "Python3TargetDLL")[0])  # type: ignore[attr-defined]
+    except OSError:
+        return None
+
+
+def _derive_python_exe_from_library(library: str) -> Path | None:
+    """Derive the Python executable from the path of its shared library, as recorded by idapyswitch.
+
+    Handles the usual layouts: python3XY.dll beside python.exe (Windows), libpython3.X in <prefix>/lib
+    or <prefix>/lib/<triplet> (Linux), and Python.framework/Versions/3.X/Python (macOS).
+    """
+    if _is_windows_store_shim(library):
+        return None
+
+    directory = os.path.dirname(os.path.abspath(library))
+    name = os.path.basename(library).lower()
+    match = re.match(r"(?:lib)?python(\d)\.?(\d+)", name)
+    if match:
+        version = f"{match[1]}.{match[2]}"
+    elif name == "python" and re.fullmatch(r"\d\.\d+", os.path.basename(directory)):
+        version = os.path.basename(directory)
+    else:
+        return None
+
+    candidates = [os.path.join(directory, "python.exe")]
+    prefix = directory
+    for _ in range(3):
+        candidates.append(os.path.join(prefix, "bin", f"python{version}"))
+        prefix = os.path.dirname(prefix)
+
+    for candidate in candidates:
+        if _is_executable_file(candidate):
+            return Path(candidate)
+    return None
+
+
+def _find_python_executable_without_idat() -> Path | None:
+    """Find IDA's Python from idapyswitch's recorded selection, when nothing at IDA's startup can override it."""
+    # a virtual environment, requested via the environment or activated by idapythonrc.py,
+    # is only resolved by actually starting IDA.
+    if os.environ.get("IDAPYTHON_VENV_EXECUTABLE") or resolve_user_virtual_env() is not None:
+        return None
+    try:
+        if (get_ida_user_dir() / "idapythonrc.py").exists():
+            return None
+    except ValueError:
+        return None
+
+    # only Windows records the selection somewhere cheap to read; elsewhere it's in the binary ida.reg.
+    library = _get_windows_python_target_dll()
+    if not library:
+        return None
+    return _derive_python_exe_from_library(library)
+
+
+def _get_python_selection_fingerprint() -> str:
+    """Fingerprint everything that determines which Python interpreter IDA uses, without running IDA.
+
+    That's the IDA binary, IDA's Python selection and startup configuration (idapyswitch's choice, idapython.cfg,
+    idapythonrc.py), the virtual environment passed along to idat, and this version of hcli.
+    """
+    idat_path = find_current_idat_executable()
+    idausr = get_ida_user_dir()
+    user_venv = resolve_user_virtual_env()
+    key = [
+        str(idat_path),
+        _get_stat_key(idat_path),
+        str(idausr),
+        _get_stat_key(idausr / "ida.reg"),
+        _get_stat_key(idausr / "cfg" / "idapython.cfg"),
+        _get_stat_key(idausr / "idapythonrc.py"),
+        _get_windows_python_target_dll(),
+        str(user_venv) if user_venv is not None else None,
+        os.environ.get("IDAPYTHON_VENV_EXECUTABLE"),
+        platform.system(),
+        ENV.HCLI_VERSION,
+    ]
+    return hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+
+
+def _get_python_executable_cache_path() -> Path:
+    return get_cache_directory() / "python-exe.json"
+
+
+def _load_python_executable_cache() -> dict[str, dict]:
+    try:
+        return json.loads(_get_python_executable_cache_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _get_cached_python_executable(fingerprint: str) -> Path | None:
+    exe = _python_executables.get(fingerprint)
+    if exe is not None:
+        return exe
+
+    entry = _load_python_executable_cache().get(fingerprint)
+    if not entry or time.time() - entry["ts"] > PYTHON_EXECUTABLE_CACHE_MAX_AGE:
+        return None
+
+    exe = Path(entry["path"])
+    if not exe.exists():
+        return None
+
+    _python_executables[fingerprint] = exe
+    return exe
+
+
+def _set_cached_python_executable(fingerprint: str, exe: Path) -> None:
+    _python_executables[fingerprint] = exe
+
+    now = time.time()
+    # drop expired entries, such as those of IDA installations since updated or removed.
+    entries = {
+        key: entry
+        for key, entry in _load_python_executable_cache().items()
+        if now - entry.get("ts", 0) <= PYTHON_EXECUTABLE_CACHE_MAX_AGE
+    }
+    entries[fingerprint] = {"path": str(exe), "ts": now}
+    try:
+        _get_python_executable_cache_path().write_text(json.dumps(entries), encoding="utf-8")
+    except OSError as e:
+        logger.debug("failed to save IDA Python executable cache: %s", e)
+
+
 def find_current_python_executable() -> Path:
     """find the python executable associated with the current IDA installation"""
     # duplicate here, because we prefer access through ENV
@@ -193,27 +367,89 @@ def find_current_python_executable() -> Path:
         return Path(ENV.HCLI_CURRENT_IDA_PYTHON_EXE)
 
     try:
-        info = run_py_in_current_idapython(GET_PYTHON_INFO_PY)
-    except RuntimeError as e:
-        raise PythonNotFoundError(
-            "failed to run idat to detect IDA's Python interpreter. "
-            "If you already know the interpreter path, set HCLI_CURRENT_IDA_PYTHON_EXE=/path/to/python and retry."
-        ) from e
+        fingerprint: str | None = _get_python_selection_fingerprint()
+    except (ValueError, OSError, RuntimeError) as e:
+        # the installation can't be found; let the detection below report it.
+        logger.debug("can't fingerprint the IDA Python selection: %s", e)
+        fingerprint = None
+
+    if fingerprint is not None:
+        cached = _get_cached_python_executable(fingerprint)
+        if cached is not None:
+            logger.debug("found cached IDA Python executable: %s", cached)
+            return cached
+
+    exe_path = _find_python_executable_without_idat()
+    if exe_path is not None:
+        logger.debug("found IDA Python executable from idapyswitch's selection: %s", exe_path)
+    else:
+        try:
+            info = run_py_in_current_idapython(GET_PYTHON_INFO_PY)
+        except RuntimeError as e:
+            raise PythonNotFoundError(
+                "failed to run idat to detect IDA's Python interpreter. "
+                "If you already know the interpreter path, set HCLI_CURRENT_IDA_PYTHON_EXE=/path/to/python and retry."
+            ) from e
+
+        logger.debug("IDA Python info: %s", info)
+        exe_path = _derive_python_exe(info)
+
+    if fingerprint is not None:
+        _set_cached_python_executable(fingerprint, exe_path)
+    return exe_path
+
+
+def _get_pip_package_candidates(python_exe: Path) -> list[Path]:
+    """Where pip's package would be installed for the given Python executable, by the usual layouts."""
+    candidates = [Path(site_packages_dir) / "pip" for site_packages_dir in _site_packages_dirs.get(python_exe, [])]
+
+    if platform.system() == "Windows":
+        # <prefix>/python.exe, or <venv>/Scripts/python.exe
+        for prefix in (python_exe.parent, python_exe.parent.parent):
+            candidates.append(prefix / "Lib" / "site-packages" / "pip")
+    elif python_exe.parent.name == "bin":
+        # <prefix>/bin/python3.12, or a bin/python3 or bin/python symlink to it
+        match = re.fullmatch(r"python(\d+\.\d+)", python_exe.name) or re.fullmatch(
+            r"python(\d+\.\d+)", os.path.basename(os.path.realpath(python_exe))
+        )
+        if match:
+            candidates.append(python_exe.parent.parent / "lib" / f"python{match.group(1)}" / "site-packages" / "pip")
 
-    logger.debug("IDA Python info: %s", info)
-    return _derive_python_exe(info)
+    return candidates
 
 
 def does_current_ida_have_pip(python_exe: Path, timeout=10.0) -> bool:
-    """Check if pip is available in the given Python executable."""
+    """Check if pip is available in the given Python executable.
+
+    Looks for pip's package in the usual site-packages first, and only asks the interpreter
+    when it's not there (e.g. a distribution-specific layout).
+    Only a positive answer is remembered (for this process), so installing pip is noticed on the next check.
+    """
+    if python_exe in _pip_python_executables:
+        return True
+
+    for candidate in _get_pip_package_candidates(python_exe):
+        if (candidate / "__init__.py").is_file():
+            logger.debug("found pip: %s", candidate)
+            _pip_python_executables.add(python_exe)
+            return True
+
     try:
         process = subprocess.run(
-            [str(python_exe), "-c", "import pip"], capture_output=True, timeout=timeout, check=False
+            [str(python_exe), "-c", "import pip"],
+            capture_output=True,
+            timeout=timeout,
+            check=False,
+            env=get_pip_env(),
         )
-        return process.returncode == 0
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
         return False
 
+    if process.returncode == 0:
+        _pip_python_executables.add(python_exe)
+        return True
+    return False
+
 
 class CantInstallPackagesError(ValueError): ...
 
@@ -270,17 +506,111 @@ def merge_bundle_pip_options(user_options: PipOptions, bundle_options: PipOption
     )
 
 
-def _format_pip_error(stdout: bytes, stderr: bytes) -> str:
-    stdout_text = stdout.decode("utf-8", errors="replace").strip()
-    stderr_text = stderr.decode("utf-8", errors="replace").strip()
+# how much of pip's output is kept to explain a failed install.
+PIP_ERROR_OUTPUT_LINES = 200
+
+
+def get_pip_env() -> dict[str, str]:
+    """Environment for running pip non-interactively.
+
+    Skips pip's self version check (a network request on every cold run), never prompts,
+    and doesn't litter pip's own directory with .pyc files.
+    """
+    return {
+        **os.environ,
+        "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+        "PIP_NO_INPUT": "1",
+        "PYTHONDONTWRITEBYTECODE": "1",
+    }
+
+
+def _run_pip_install(python_exe: Path, args: list[str], packages: list[str]) -> None:
+    """Run a single `pip install` for all the given packages.
+
+    Plugins often share dependencies, so identical requirements are passed once.
+    With nothing to install, pip isn't started at all.
+    """
+    packages = list(dict.fromkeys(packages))
+    if not packages:
+        logger.debug("no packages to install")
+        return
+
+    logger.debug("pip install %s: %d requirements", " ".join(args), len(packages))
+    # pip's log can be megabytes for large installs: stream it to the debug log,
+    # and keep only its tail, where pip reports what went wrong.
+    output: collections.deque[str] = collections.deque(maxlen=PIP_ERROR_OUTPUT_LINES)
+    with subprocess.Popen(
+        [str(python_exe), "-m", "pip", "install"] + args + packages,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        encoding="utf-8",
+        errors="replace",
+        env=get_pip_env(),
+    ) as process:
+        assert process.stdout is not None
+        for line in process.stdout:
+            line = line.rstrip()
+            logger.debug("pip: %s", line)
+            output.append(line)
+
+    if process.returncode != 0:
+        logger.debug("can't install packages")
+        raise CantInstallPackagesError("\n".join(output).strip())
+
 
-    parts = []
-    if stdout_text:
-        parts.append(stdout_text)
-    if stderr_text:
-        parts.append(stderr_text)
+def _get_installed_versions(python_exe: Path) -> dict[str, Version] | None:
+    """Map the (canonical) names of the distributions installed for the given Python executable to their versions.
 
-    return "\n".join(parts) if parts else stdout_text
+    Read from the .dist-info directory names, so no Python needs to run (once the site-packages are known).
+    Returns None when that's ambiguous, such as a distribution installed at different versions.
+    """
+    site_packages_dirs = _get_site_packages_dirs(python_exe)
+    if site_packages_dirs is None:
+        return None
+
+    versions: dict[str, Version] = {}
+    for site_packages_dir in site_packages_dirs:
+        try:
+            entries = os.listdir(site_packages_dir)
+        except OSError:
+            continue
+
+        for entry in entries:
+            if not entry.endswith(".dist-info"):
+                continue
+            name, _, version = entry.removesuffix(".dist-info").rpartition("-")
+            try:
+                parsed = Version(version)
+            except InvalidVersion:
+                continue
+            key = canonicalize_name(name)
+            if versions.setdefault(key, parsed) != parsed:
+                return None
+    return versions
+
+
+def _are_requirements_installed(python_exe: Path, packages: list[str]) -> bool:
+    """Check if all the given requirements are already satisfied by installed distributions.
+
+    Only plain `name<specifier>` requirements are considered: markers and extras need
+    the target interpreter to evaluate, and URLs need pip, so those are never reported as installed.
+    """
+    try:
+        requirements = [Requirement(package) for package in packages]
+    except InvalidRequirement:
+        return False
+    if not requirements or any(r.url or r.marker or r.extras for r in requirements):
+        return False
+
+    versions = _get_installed_versions(python_exe)
+    if versions is None:
+        return False
+
+    for requirement in requirements:
+        version = versions.get(canonicalize_name(requirement.name))
+        if version is None or not requirement.specifier.contains(version, prereleases=True):
+            return False
+    return True
 
 
 def verify_pip_can_install_packages(
@@ -291,21 +621,17 @@ def verify_pip_can_install_packages(
 ):
     """Check if the given Python packages (e.g., "foo>=v1.0,<3") can be installed.
 
+    All the packages are resolved together, in one pip invocation.
+
     Raises:
         CantInstallPackagesError: if pip dry-run fails.
     """
+    if _are_requirements_installed(python_exe, packages):
+        logger.debug("requirements already installed, skipping pip dry-run")
+        return
+
     effective = _merge_no_build_isolation(pip_options, no_build_isolation)
-    process = subprocess.run(
-        [str(python_exe), "-m", "pip", "install", "--dry-run"] + effective.build_args() + packages,
-        capture_output=True,
-        check=False,
-    )
-    stdout, stderr = process.stdout, process.stderr
-    if process.returncode != 0:
-        logger.debug("can't install packages")
-        logger.debug(stdout.decode("utf-8", errors="replace"))
-        logger.debug(stderr.decode("utf-8", errors="replace"))
-        raise CantInstallPackagesError(_format_pip_error(stdout, stderr))
+    _run_pip_install(python_exe, ["--dry-run"] + effective.build_args(), packages)
 
 
 def pip_install_packages(
@@ -316,21 +642,13 @@ def pip_install_packages(
 ):
     """Install the given Python packages (e.g., "foo>=v1.0,<3").
 
+    All the packages are installed together, in one pip invocation.
+
     Raises:
         CantInstallPackagesError: if pip install fails.
     """
     effective = _merge_no_build_isolation(pip_options, no_build_isolation)
-    process = subprocess.run(
-        [str(python_exe), "-m", "pip", "install"] + effective.build_args() + packages,
-        capture_output=True,
-        check=False,
-    )
-    stdout, stderr = process.stdout, process.stderr
-    if process.returncode != 0:
-        logger.debug("can't install packages")
-        logger.debug(stdout.decode("utf-8", errors="replace"))
-        logger.debug(stderr.decode("utf-8", errors="replace"))
-        raise CantInstallPackagesError(_format_pip_error(stdout, stderr))
+    _run_pip_install(python_exe, effective.build_args(), packages)
 
 
 def _merge_no_build_isolation(pip_options: PipOptions, no_build_isolation: bool) -> PipOptions:
@@ -369,9 +687,77 @@ def detect_current_python_version() -> str:
     return version
 
 
+# Script run in a Python executable to list the directories that pip freeze reports on.
+GET_SITE_PACKAGES_PY = """
+import json
+import site
+import sysconfig
+
+paths = sysconfig.get_paths()
+dirs = [paths["purelib"], paths["platlib"]]
+if site.ENABLE_USER_SITE:
+    dirs.append(site.getusersitepackages())
+print(json.dumps(dirs))
+"""
+
+# Python executable -> its site-packages directories, for this process.
+_site_packages_dirs: dict[Path, list[str]] = {}
+# Python executable -> (site-packages fingerprint, pip freeze output), for this process.
+_pip_freezes: dict[Path, tuple[tuple, str]] = {}
+
+
+def _get_site_packages_dirs(python_exe: Path) -> list[str] | None:
+    if python_exe not in _site_packages_dirs:
+        try:
+            process = subprocess.run(
+                [str(python_exe), "-c", GET_SITE_PACKAGES_PY], capture_output=True, timeout=10, check=True
+            )
+            _site_packages_dirs[python_exe] = list(dict.fromkeys(json.loads(process.stdout)))
+        except (subprocess.SubprocessError, OSError, ValueError) as e:
+            logger.debug("failed to find site-packages of %s: %s", python_exe, e)
+            return None
+    return _site_packages_dirs[python_exe]
+
+
+def _get_site_packages_fingerprint(site_packages_dirs: list[str]) -> tuple:
+    """Summarize the installed distributions: installing, upgrading, or removing one changes this."""
+    fingerprint: list[tuple] = []
+    for site_packages_dir in site_packages_dirs:
+        try:
+            stat = os.stat(site_packages_dir)
+            with os.scandir(site_packages_dir) as it:
+                entries = sorted(
+                    (entry.name, entry.stat().st_mtime_ns)
+                    for entry in it
+                    if entry.name.endswith((".dist-info", ".egg-info", ".egg-link", ".pth"))
+                )
+        except OSError:
+            fingerprint.append((site_packages_dir, None))
+            continue
+        fingerprint.append((site_packages_dir, stat.st_mtime_ns, tuple(entries)))
+    return tuple(fingerprint)
+
+
 def pip_freeze(python_exe: Path):
-    process = subprocess.run([str(python_exe), "-m", "pip", "freeze"], capture_output=True, check=False)
+    """Run `pip freeze` in the given Python executable.
+
+    The output is remembered (for this process) until the distributions in its site-packages change.
+    """
+    site_packages_dirs = _get_site_packages_dirs(python_exe)
+    fingerprint = _get_site_packages_fingerprint(site_packages_dirs) if site_packages_dirs is not None else None
+    if fingerprint is not None and python_exe in _pip_freezes:
+        cached_fingerprint, freeze = _pip_freezes[python_exe]
+        if cached_fingerprint == fingerprint:
+            return freeze
+
+    process = subprocess.run(
+        [str(python_exe), "-m", "pip", "freeze"], capture_output=True, check=False, env=get_pip_env()
+    )
     stdout, _ = process.stdout, process.stderr
     if process.returncode != 0:
         raise subprocess.CalledProcessError(process.returncode, [str(python_exe), "-m", "pip", "freeze"])
-    return stdout.decode("utf-8", errors="replace")
+    freeze = stdout.decode("utf-8", errors="replace")
+
+    if fingerprint is not None:
+        _pip_freezes[python_exe] = (fingerprint, freeze)
+    return freeze
@@ -24,22 +24,28 @@ def _print(msg: str) -> None:
         console.print(msg)
 
 
-def _strip_idb_extension(name: str) -> str:
-    """Strip .i64 or .idb extension from filename."""
-    lower = name.lower()
-    if lower.endswith((".i64", ".idb")):
-        return name[:-4]
-    return name
+_IDB_EXTENSIONS = (".i64", ".idb")
+
+
+def _idb_stem_length(name: str) -> int:
+    """Length of *name* without a trailing .i64/.idb extension (case-insensitive)."""
+    if len(name) >= 4 and name[-4] == "." and name[-4:].lower() in _IDB_EXTENSIONS:
+        return len(name) - 4
+    return len(name)
 
 
 def _idb_names_match(ida_idb_name: str, target_name: str) -> bool:
     """Check if IDA's IDB name matches the target name.
 
     Handles the case where target is 'foo.bin' but IDA reports 'foo.bin.i64'.
+    Called for every instance on every launcher poll, so names whose stems
+    differ in length are rejected before any lowercased copies are made.
     """
-    ida_base = _strip_idb_extension(ida_idb_name).lower()
-    target_base = _strip_idb_extension(target_name).lower()
-    return ida_base == target_base
+    ida_len = _idb_stem_length(ida_idb_name)
+    target_len = _idb_stem_length(target_name)
+    if ida_len != target_len:
+        return False
+    return ida_idb_name[:ida_len].lower() == target_name[:target_len].lower()
 
 
 def resolve_and_navigate(
@@ -2,14 +2,20 @@ import json
 
 
 class StructuredMessage:
+    __slots__ = ("_formatted", "args", "kwargs", "message")
+
     def __init__(self, message, /, *args, **kwargs):
         self.message = message
         self.args = args
         self.kwargs = kwargs
+        self._formatted: str | None = None
 
     def __str__(self):
-        message = self.message % self.args
-        return "{} <structured: {}>".format(message, json.dumps({"message": message} | self.kwargs))
+        # formatted at most once, and only if a handler actually emits the record.
+        if self._formatted is None:
+            message = self.message % self.args
+            self._formatted = "{} <structured: {}>".format(message, json.dumps({"message": message, **self.kwargs}))
+        return self._formatted
 
 
 m = StructuredMessage  # optional, to improve readability
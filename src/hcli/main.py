@@ -4,20 +4,22 @@ import logging
 import os
 import platform
 import tempfile
+from typing import TYPE_CHECKING
 
 # Ensure all Python subprocesses (pip, idat scripts, etc.) use UTF-8 on Windows,
 # where the default encoding is typically a legacy codepage.
 os.environ["PYTHONUTF8"] = "1"
 
 import rich_click as click
-from rich.logging import RichHandler
 
 import hcli.lib.console
-from hcli.commands import register_commands
+from hcli.commands import LazyGroup, register_commands
 from hcli.env import ENV
 from hcli.lib.console import console, stderr_console
 from hcli.lib.extensions import get_extensions
-from hcli.lib.update.version import BackgroundUpdateChecker, is_binary
+
+if TYPE_CHECKING:
+    from hcli.lib.update.version import BackgroundUpdateChecker
 
 # Configure rich-click styling
 click.rich_click.USE_RICH_MARKUP = True
@@ -135,9 +137,14 @@ def get_help_text():
     return base_help
 
 
-class MainGroup(click.RichGroup):
+class MainGroup(LazyGroup):
     """Custom Rich Click Group with global exception handling."""
 
+    def format_help_text(self, ctx, formatter):
+        """Build the help text only when it's shown, since the status section reads the config and probes IDA."""
+        self.help = get_help_text()
+        super().format_help_text(ctx, formatter)
+
     def main(self, *args, **kwargs):
         """Override main to add global exception handling."""
         try:
@@ -200,7 +207,7 @@ def handle_command_completion(_ctx, _result, **_kwargs):
         console.print(update_msg, markup=True)
 
 
-@click.group(help=get_help_text(), cls=MainGroup, result_callback=handle_command_completion)
+@click.group(cls=MainGroup, result_callback=handle_command_completion)
 @click.version_option(version=f"{ENV.HCLI_VERSION}{ENV.HCLI_VERSION_EXTRA}", package_name="ida-hcli")
 @click.option("--quiet", "-q", is_flag=True, help="Run without prompting the user")
 @click.option("--auth", "-a", help="Force authentication type (interactive|key)", default=None)
@@ -213,6 +220,8 @@ def cli(_ctx, quiet, auth, auth_credentials, disable_updates: bool):
     # fix #190: stale stdout/err handles due to click pytest integration
     hcli.lib.console._sync_console_streams()
 
+    from hcli.lib.update.version import BackgroundUpdateChecker, is_binary
+
     if is_binary() and not (disable_updates or ENV.HCLI_DISABLE_UPDATES):
         global update_checker
 
@@ -228,6 +237,8 @@ def cli(_ctx, quiet, auth, auth_credentials, disable_updates: bool):
     _ctx.obj["auth_credentials"] = auth_credentials
 
     if ENV.HCLI_DEBUG:
+        from rich.logging import RichHandler
+
         handler = RichHandler(show_time=False, show_path=False, rich_tracebacks=True, console=stderr_console)
         logging.basicConfig(level=logging.DEBUG, format="%(message)s", datefmt="[%X]", handlers=[handler])
 
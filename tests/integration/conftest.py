@@ -3,10 +3,17 @@ Shared fixtures and utilities for integration tests.
 """
 
 import re
+import shutil
 
 import pexpect
 import pytest
 
+# found once per session, and shared by the fixtures below.
+UV_PATH = shutil.which("uv")
+
+# ANSI escape sequences and cursor position reports
+ESCAPE_SEQUENCE_RE = re.compile(r"\x1b\[[0-9;]*[a-zA-Z]|;[0-9]+R")
+
 
 class FilteredOutput:
     """Filter terminal escape sequences from pexpect output."""
@@ -15,9 +22,7 @@ class FilteredOutput:
         self.target = target
 
     def write(self, data):
-        # Filter out ANSI escape sequences and cursor position reports
-        filtered = re.sub(r"\x1b\[[0-9;]*[a-zA-Z]", "", data)
-        filtered = re.sub(r";[0-9]+R", "", filtered)
+        filtered = ESCAPE_SEQUENCE_RE.sub("", data)
         if filtered.strip():
             self.target.write(filtered)
             self.target.flush()
@@ -112,23 +117,16 @@ def cli_tester():
 # Utility functions for test setup
 def check_dependencies():
     """Check if required dependencies are available."""
-    try:
-        import pexpect
-
-        pexpect.spawn("uv --version", timeout=2).expect(pexpect.EOF)
-        return True
-    except (ImportError, Exception):
-        return False
+    # pexpect is imported by this module, so only uv can be missing
+    return UV_PATH is not None
 
 
 @pytest.fixture(scope="module")
 def check_uv_available():
     """Ensure uv is available for running commands."""
-    try:
-        pexpect.spawn("uv --version", timeout=2).expect(pexpect.EOF)
-        return True
-    except Exception:
+    if UV_PATH is None:
         pytest.skip("uv not available for integration tests")
+    return True
 
 
 @pytest.fixture(autouse=True)
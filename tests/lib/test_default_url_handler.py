@@ -8,6 +8,7 @@ import pytest
 
 from hcli.lib.ida.handler.default_url_handler import DefaultURLHandler
 from hcli.lib.ida.ipc import IDAInstance
+from hcli.lib.ida.resolve import _idb_names_match
 
 
 class TestMatches:
@@ -137,3 +138,20 @@ class TestNamedIdb:
         handler.handle(uri, urlparse(uri), False, 120.0, False)
 
         mock_launcher.find_idb_file.assert_called_once_with("test.i64", "malwares")
+
+
+class TestIdbNameMatching:
+    @pytest.mark.parametrize(
+        ("ida_name", "target", "expected"),
+        [
+            ("foo.bin.i64", "foo.bin", True),
+            ("FOO.I64", "foo.idb", True),
+            ("foo.i64", "foo", True),
+            ("foo.i64", "fo", False),
+            ("foo.i64", "foo.bin", False),
+            ("i64", "i64", True),
+            ("xi64", "x", False),
+        ],
+    )
+    def test_idb_names_match(self, ida_name, target, expected):
+        assert _idb_names_match(ida_name, target) is expected
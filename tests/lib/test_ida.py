@@ -10,6 +10,7 @@ import pytest
 
 from hcli.lib.ida import (
     IdaProduct,
+    _find_ida_installs_in_directory,
     _is_ida_install_dir_name,
     _prepare_headless_ida_user_dir,
     accept_eula,
@@ -28,6 +29,7 @@ from hcli.lib.ida import (
     parse_version_from_dir_name,
     parse_version_from_ida_pro_py,
     parse_version_from_windows_registry,
+    run_py_in_current_idapython,
     select_default_ida_instance,
 )
 from hcli.lib.ida.version import normalize_ida_binary_version, parse_version_from_ida_binary
@@ -342,6 +344,19 @@ def test_ida_install_dir_name_detection_rejects_non_installer_names(name):
     assert not _is_ida_install_dir_name(name)
 
 
+def test_find_ida_installs_in_directory(monkeypatch, tmp_path):
+    monkeypatch.setattr("hcli.lib.ida.get_os", lambda: "linux")
+    assert _find_ida_installs_in_directory(tmp_path / "missing") == []
+
+    (tmp_path / "ida-pro-9.2").mkdir()
+    (tmp_path / "ida-pro-9.2" / "ida").write_bytes(b"")
+    (tmp_path / "ida-pro-9.3").mkdir()
+    (tmp_path / "unrelated").mkdir()
+    (tmp_path / "ida-pro-9.4").write_bytes(b"")
+
+    assert _find_ida_installs_in_directory(tmp_path) == [tmp_path / "ida-pro-9.2"]
+
+
 @pytest.mark.parametrize(
     ("os_name", "filename"),
     [
@@ -450,3 +465,24 @@ def test_prepare_headless_ida_user_dir_copies_only_required_files(tmp_path):
     assert not (target_dir / "ida-config.json").exists()
     assert not (target_dir / "plugins").exists()
     assert not (target_dir / "mcp").exists()
+
+
+def test_run_py_in_current_idapython_runs_each_script_once(monkeypatch, tmp_path):
+    idat = tmp_path / "idat"
+    idat.write_bytes(b"")
+    calls = []
+
+    def run_ida_batch_script(idat_path, src, env=None):
+        calls.append(src)
+        return {"script": src}
+
+    monkeypatch.setattr("hcli.lib.ida.find_current_idat_executable", lambda: idat)
+    monkeypatch.setattr("hcli.lib.ida.get_ida_user_dir", lambda: tmp_path / "missing-idausr")
+    monkeypatch.setattr("hcli.lib.ida._run_ida_batch_script", run_ida_batch_script)
+    monkeypatch.setattr("hcli.lib.ida._idapython_results", {})
+
+    assert run_py_in_current_idapython("a") == {"script": "a"}
+    run_py_in_current_idapython("a")["script"] = "changed"
+    assert run_py_in_current_idapython("a") == {"script": "a"}
+    assert run_py_in_current_idapython("b") == {"script": "b"}
+    assert calls == ["a", "b"]
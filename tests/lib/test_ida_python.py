@@ -1,17 +1,24 @@
+import json
 import os
 import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 
+import hcli.lib.ida.python
 from hcli.lib.ida import find_current_ida_install_directory, get_ida_user_dir
 from hcli.lib.ida.python import (
     CantInstallPackagesError,
     PipOptions,
+    PythonNotFoundError,
     _derive_python_exe,
+    _derive_python_exe_from_library,
     does_current_ida_have_pip,
     find_current_python_executable,
     merge_bundle_pip_options,
+    pip_freeze,
+    pip_install_packages,
     verify_pip_can_install_packages,
 )
 
@@ -125,6 +132,36 @@ def test_derive_python_exe_honors_validated_virtualenv_executable_when_prefix_is
     assert _derive_python_exe(info) == venv_python
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX interpreter layout")
+def test_derive_python_exe_prefers_candidates_in_order(tmp_path):
+    base = tmp_path / "base"
+    (base / "bin" / "python3.12").mkdir(parents=True)
+    for name in ("python", "python3"):
+        (base / "bin" / name).write_text("", encoding="utf-8")
+        (base / "bin" / name).chmod(0o755)
+
+    info = {
+        "frozen": False,
+        "prefix": str(base),
+        "base_prefix": str(base),
+        "executable": None,
+        "virtual_env": None,
+        "idapython_venv_executable": None,
+        "version_major": 3,
+        "version_minor": 12,
+    }
+
+    assert _derive_python_exe(info) == base / "bin" / "python3"
+
+    # not executable
+    (base / "bin" / "python3").chmod(0o644)
+    assert _derive_python_exe(info) == base / "bin" / "python"
+
+    (base / "bin" / "python").unlink()
+    with pytest.raises(PythonNotFoundError):
+        _derive_python_exe(info)
+
+
 def _create_venv_with_ida_python(venv_dir: Path) -> None:
     """Build the venv using IDA's own Python so the venv is one IDA could plausibly use.
 
@@ -223,6 +260,96 @@ def test_find_current_python_executable_honors_idapythonrc(tmp_path, monkeypatch
     _assert_detected_venv_python(result, venv_dir)
 
 
+def test_find_current_python_executable_cached_until_selection_changes(tmp_path, monkeypatch):
+    prefix = tmp_path / "prefix"
+    (prefix / "bin").mkdir(parents=True)
+    python_exe = prefix / "bin" / "python3.11"
+    python_exe.write_bytes(b"")
+    python_exe.chmod(0o755)
+    (tmp_path / "idat").write_bytes(b"")
+    (tmp_path / "idausr").mkdir()
+
+    calls = []
+
+    def run_py_in_current_idapython(src):
+        calls.append(src)
+        return {
+            "prefix": str(prefix),
+            "base_prefix": str(prefix),
+            "executable": str(tmp_path / "idat"),
+            "version_major": 3,
+            "version_minor": 11,
+        }
+
+    monkeypatch.setenv("HCLI_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("HCLI_CURRENT_IDA_PYTHON_EXE", raising=False)
+    monkeypatch.setattr(hcli.lib.ida.python, "run_py_in_current_idapython", run_py_in_current_idapython)
+    monkeypatch.setattr(hcli.lib.ida.python, "find_current_idat_executable", lambda: tmp_path / "idat")
+    monkeypatch.setattr(hcli.lib.ida.python, "get_ida_user_dir", lambda: tmp_path / "idausr")
+    monkeypatch.setattr(hcli.lib.ida.python, "_python_executables", {})
+
+    assert find_current_python_executable() == python_exe
+    assert find_current_python_executable() == python_exe
+    assert len(calls) == 1
+
+    # remembered across processes, too.
+    monkeypatch.setattr(hcli.lib.ida.python, "_python_executables", {})
+    assert find_current_python_executable() == python_exe
+    assert len(calls) == 1
+
+    # selecting another Python (such as with idapyswitch) updates ida.reg.
+    (tmp_path / "idausr" / "ida.reg").write_bytes(b"")
+    assert find_current_python_executable() == python_exe
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize(
+    ("library", "exe"),
+    [
+        ("Python311/python311.dll", "Python311/python.exe"),
+        ("usr/lib/x86_64-linux-gnu/libpython3.11.so.1.0", "usr/bin/python3.11"),
+        ("pyenv/3.12.1/lib/libpython3.12.so", "pyenv/3.12.1/bin/python3.12"),
+        ("Python.framework/Versions/3.13/Python", "Python.framework/Versions/3.13/bin/python3.13"),
+    ],
+)
+def test_derive_python_exe_from_library(tmp_path, library, exe):
+    (tmp_path / exe).parent.mkdir(parents=True)
+    (tmp_path / exe).write_bytes(b"")
+    (tmp_path / exe).chmod(0o755)
+
+    assert _derive_python_exe_from_library(str(tmp_path / library)) == tmp_path / exe
+    assert _derive_python_exe_from_library(str(tmp_path / "elsewhere" / "python311.dll")) is None
+
+
+def test_find_current_python_executable_skips_idat_for_recorded_selection(tmp_path, monkeypatch):
+    (tmp_path / "Python311").mkdir()
+    (tmp_path / "Python311" / "python.exe").write_bytes(b"")
+    (tmp_path / "Python311" / "python.exe").chmod(0o755)
+    (tmp_path / "idausr").mkdir()
+
+    def run_py_in_current_idapython(src):
+        raise AssertionError("idat should not be needed")
+
+    monkeypatch.setenv("HCLI_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("HCLI_CURRENT_IDA_PYTHON_EXE", raising=False)
+    monkeypatch.delenv("IDAPYTHON_VENV_EXECUTABLE", raising=False)
+    monkeypatch.delenv("VIRTUAL_ENV", raising=False)
+    monkeypatch.setattr(hcli.lib.ida.python, "run_py_in_current_idapython", run_py_in_current_idapython)
+    monkeypatch.setattr(hcli.lib.ida.python, "find_current_idat_executable", lambda: tmp_path / "idat")
+    monkeypatch.setattr(hcli.lib.ida.python, "get_ida_user_dir", lambda: tmp_path / "idausr")
+    monkeypatch.setattr(
+        hcli.lib.ida.python, "_get_windows_python_target_dll", lambda: str(tmp_path / "Python311" / "python311.dll")
+    )
+    monkeypatch.setattr(hcli.lib.ida.python, "_python_executables", {})
+
+    assert find_current_python_executable() == tmp_path / "Python311" / "python.exe"
+
+    # but idapythonrc.py may activate a virtual environment, which only IDA can tell.
+    (tmp_path / "idausr" / "idapythonrc.py").write_text("", encoding="utf-8")
+    with pytest.raises(AssertionError):
+        find_current_python_executable()
+
+
 @pytest.mark.skipif(not has_idat(), reason="Skip when idat not present (Free/Home)")
 def test_verify_pip_can_install_packages():
     python_exe = find_current_python_executable()
@@ -258,6 +385,118 @@ def test_verify_pip_can_install_packages():
         verify_pip_can_install_packages(python_exe, ["flare-capa==v1.2.0", "flare-capa<=v1.0.0"])
 
 
+def fake_pip(monkeypatch, code: str) -> list[list[str]]:
+    """Run `code` in place of each pip subprocess, recording the pip command lines."""
+    calls = []
+    popen = subprocess.Popen
+
+    def fake_popen(args, **kwargs):
+        if args[1:3] != ["-m", "pip"]:
+            return popen(args, **kwargs)
+
+        # pip runs without its version check, prompts, or .pyc writes
+        assert kwargs["env"]["PIP_DISABLE_PIP_VERSION_CHECK"] == "1"
+        assert kwargs["env"]["PIP_NO_INPUT"] == "1"
+        calls.append(args)
+        return popen([sys.executable, "-c", code], **kwargs)
+
+    monkeypatch.setattr(subprocess, "Popen", fake_popen)
+    return calls
+
+
+def test_pip_install_packages_runs_one_batched_pip(tmp_path, monkeypatch):
+    calls = fake_pip(monkeypatch, "print('Successfully installed')")
+    python_exe = tmp_path / "python"
+
+    pip_install_packages(python_exe, ["foo>=1", "bar", "foo>=1"])
+    verify_pip_can_install_packages(python_exe, ["foo>=1", "foo>=1"], no_build_isolation=True)
+    pip_install_packages(python_exe, [])
+
+    assert calls == [
+        [str(python_exe), "-m", "pip", "install", "foo>=1", "bar"],
+        [str(python_exe), "-m", "pip", "install", "--dry-run", "--no-build-isolation", "foo>=1"],
+    ]
+
+
+def test_pip_install_packages_reports_tail_of_output(tmp_path, monkeypatch):
+    fake_pip(
+        monkeypatch,
+        "import sys\n"
+        "for i in range(1000): print(f'Collecting dep{i}')\n"
+        "print('ERROR: No matching distribution found for foo', file=sys.stderr)\n"
+        "sys.exit(1)\n",
+    )
+
+    with pytest.raises(CantInstallPackagesError) as excinfo:
+        pip_install_packages(tmp_path / "python", ["foo"])
+
+    message = str(excinfo.value)
+    assert message.endswith("ERROR: No matching distribution found for foo")
+    assert "Collecting dep999" in message
+    assert "Collecting dep0\n" not in message
+
+
+def test_installed_requirements_skip_pip_dry_run(tmp_path, monkeypatch):
+    calls = fake_pip(monkeypatch, "print('Would install')")
+    python_exe = tmp_path / "python"
+    site_packages = tmp_path / "site-packages"
+    (site_packages / "foo_bar-1.2.0.dist-info").mkdir(parents=True)
+    (site_packages / "baz-2.0rc1.dist-info").mkdir()
+    monkeypatch.setattr(hcli.lib.ida.python, "_site_packages_dirs", {python_exe: [str(site_packages)]})
+
+    verify_pip_can_install_packages(python_exe, ["Foo-Bar>=1,<2", "baz"])
+    assert calls == []
+
+    verify_pip_can_install_packages(python_exe, ["foo-bar>=1.3"])
+    verify_pip_can_install_packages(python_exe, ["qux"])
+    verify_pip_can_install_packages(python_exe, ["foo-bar[extra]"])
+    verify_pip_can_install_packages(python_exe, ["foo-bar; python_version >= '3'"])
+    assert len(calls) == 4
+
+
+def test_pip_freeze_cached_until_site_packages_change(tmp_path, monkeypatch):
+    site_packages = tmp_path / "site-packages"
+    site_packages.mkdir()
+    calls = []
+
+    def run(args, **kwargs):
+        calls.append(args)
+        if args[1] == "-c":
+            return subprocess.CompletedProcess(args, 0, json.dumps([str(site_packages)]).encode(), b"")
+        return subprocess.CompletedProcess(args, 0, f"freeze{len(calls)}".encode(), b"")
+
+    monkeypatch.setattr(subprocess, "run", run)
+    monkeypatch.setattr(hcli.lib.ida.python, "_site_packages_dirs", {})
+    monkeypatch.setattr(hcli.lib.ida.python, "_pip_freezes", {})
+    python_exe = tmp_path / "python"
+
+    assert pip_freeze(python_exe) == "freeze2"
+    assert pip_freeze(python_exe) == "freeze2"
+    assert len(calls) == 2
+
+    (site_packages / "foo-1.0.dist-info").mkdir()
+    assert pip_freeze(python_exe) == "freeze3"
+    assert pip_freeze(python_exe) == "freeze3"
+    assert len(calls) == 3
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX interpreter layout")
+def test_pip_package_found_without_running_python(tmp_path, monkeypatch):
+    def run(args, **kwargs):
+        raise AssertionError("python should not be started")
+
+    monkeypatch.setattr(subprocess, "run", run)
+    monkeypatch.setattr(hcli.lib.ida.python, "_pip_python_executables", set())
+    (tmp_path / "bin").mkdir()
+    (tmp_path / "bin" / "python3.12").write_bytes(b"")
+    (tmp_path / "bin" / "python3").symlink_to("python3.12")
+    pip_dir = tmp_path / "lib" / "python3.12" / "site-packages" / "pip"
+    pip_dir.mkdir(parents=True)
+    (pip_dir / "__init__.py").write_text("", encoding="utf-8")
+
+    assert does_current_ida_have_pip(tmp_path / "bin" / "python3")
+
+
 def test_pip_options_default_builds_empty_args():
     opts = PipOptions()
     assert opts.build_args() == []
@@ -0,0 +1,300 @@
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from hcli.lib.ida.ipc import AnalysisResult, IDAInstance, IDAIPCClient
+from hcli.lib.ida.launcher import (
+    IDALauncher,
+    IDALaunchError,
+    IDAStartupTimeout,
+    LaunchConfig,
+    _find_idb_in_tree,
+    _LaunchEventWatcher,
+    _load_ready_estimate,
+    _record_ready_time,
+    _spawn_detached,
+)
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="inotify wakeup is Linux-only")
+def test_socket_watcher_wakes_on_matching_socket(tmp_path):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    def create_socket():
+        time.sleep(0.1)
+        (tmp_path / "unrelated").write_text("", encoding="utf-8")
+        sock.bind(str(tmp_path / "ida_ipc_12345"))
+
+    with _LaunchEventWatcher(directory=str(tmp_path)) as watcher:
+        thread = threading.Thread(target=create_socket)
+        thread.start()
+        start = time.monotonic()
+        watcher.wait(10.0)
+        elapsed = time.monotonic() - start
+        thread.join()
+
+    sock.close()
+    assert elapsed < 5.0
+
+
+def test_socket_watcher_times_out_without_events(tmp_path):
+    with _LaunchEventWatcher(directory=str(tmp_path)) as watcher:
+        start = time.monotonic()
+        watcher.wait(0.1)
+        assert time.monotonic() - start >= 0.1
+
+
+@pytest.mark.skipif(sys.platform not in ("linux", "win32"), reason="process wakeup needs pidfd or a process handle")
+def test_watcher_wakes_when_process_exits():
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.1)"])
+    try:
+        with _LaunchEventWatcher(process, watch_sockets=False) as watcher:
+            start = time.monotonic()
+            watcher.wait(10.0)
+            elapsed = time.monotonic() - start
+    finally:
+        process.wait()
+
+    assert elapsed < 5.0
+
+
+@pytest.fixture
+def memory_config(monkeypatch):
+    from hcli.lib.config import config_store
+
+    data: dict = {}
+    monkeypatch.setattr(config_store, "_data", data)
+    monkeypatch.setattr(config_store, "_save_config", lambda: None)
+    return data
+
+
+def test_legacy_search_paths_migrated_once(memory_config):
+    memory_config["idb.search-paths"] = ["/a", "/b"]
+
+    launcher = IDALauncher()
+
+    assert launcher._get_sources() == {"source-1": "/a", "source-2": "/b"}
+    assert "idb.search-paths" not in memory_config
+
+
+def test_sources_cached_until_refresh(memory_config):
+    memory_config["idb.sources"] = {"one": "/a"}
+    launcher = IDALauncher()
+    assert launcher._get_sources() == {"one": "/a"}
+
+    memory_config["idb.sources"] = {"two": "/b"}
+    assert launcher._get_sources() == {"one": "/a"}
+
+    launcher.refresh_sources()
+    assert launcher._get_sources() == {"two": "/b"}
+
+
+def test_find_idb_in_tree_prunes_and_bounds_depth(tmp_path):
+    (tmp_path / ".git" / "objects").mkdir(parents=True)
+    (tmp_path / ".git" / "objects" / "sample.i64").write_bytes(b"")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "sample.i64").write_bytes(b"")
+    assert _find_idb_in_tree(str(tmp_path), "sample.i64", max_depth=6) is None
+
+    deep = tmp_path / "a" / "b" / "c"
+    deep.mkdir(parents=True)
+    (deep / "sample.i64").write_bytes(b"")
+    assert _find_idb_in_tree(str(tmp_path), "sample.i64", max_depth=2) is None
+    assert _find_idb_in_tree(str(tmp_path), "sample.i64", max_depth=3) == deep / "sample.i64"
+
+
+def test_find_idb_in_tree_ignores_directories_with_matching_name(tmp_path):
+    (tmp_path / "sample.i64").mkdir()
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "sample.i64").write_bytes(b"")
+
+    assert _find_idb_in_tree(str(tmp_path), "sample.i64", max_depth=6) == tmp_path / "sub" / "sample.i64"
+
+
+def test_find_idb_in_tree_missing_root(tmp_path):
+    assert _find_idb_in_tree(str(tmp_path / "missing"), "sample.i64", max_depth=6) is None
+
+
+def test_wait_for_idb_instance_queries_concurrently(monkeypatch):
+    instances = [IDAInstance(pid=pid, socket_path=f"/tmp/ida_ipc_{pid}") for pid in (1, 2, 3)]
+    idb_names = {1: "other.i64", 2: None, 3: "sample.i64"}
+
+    def query_instance(socket_path):
+        pid = int(socket_path.rsplit("_", 1)[1])
+        time.sleep(0.2)
+        name = idb_names[pid]
+        return IDAInstance(pid=pid, socket_path=socket_path, idb_name=name, has_idb=name is not None)
+
+    monkeypatch.setattr(IDAIPCClient, "discover_instances", staticmethod(lambda: instances))
+    monkeypatch.setattr(IDAIPCClient, "query_instance", staticmethod(query_instance))
+
+    start = time.monotonic()
+    info = IDALauncher()._wait_for_idb_instance("sample", timeout=10.0)
+
+    assert info.pid == 3
+    assert time.monotonic() - start < 0.5
+
+
+def test_wait_for_launched_instance_polls_predicted_socket(monkeypatch):
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+    launcher = IDALauncher()
+    expected = launcher._get_expected_socket_path(process.pid)
+
+    def discover_instances():
+        raise AssertionError("discovery should not be needed")
+
+    monkeypatch.setattr(IDAIPCClient, "discover_instances", staticmethod(discover_instances))
+    monkeypatch.setattr(launcher, "_socket_exists", lambda path: path == expected)
+    monkeypatch.setattr(IDAIPCClient, "ping", staticmethod(lambda path: path == expected))
+    monkeypatch.setattr(
+        IDAIPCClient,
+        "query_instance",
+        staticmethod(lambda path: IDAInstance(pid=process.pid, socket_path=path, idb_name="sample.i64", has_idb=True)),
+    )
+
+    try:
+        info = launcher._wait_for_launched_instance(process, "sample.i64", timeout=10.0)
+    finally:
+        process.kill()
+        process.wait()
+
+    assert info.socket_path == expected
+
+
+def test_wait_for_launched_instance_discovers_after_clean_exit(monkeypatch):
+    # a launcher that hands off to IDA and returns.
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    instance = IDAInstance(pid=1, socket_path="/tmp/ida_ipc_1")
+
+    monkeypatch.setattr(IDAIPCClient, "discover_instances", staticmethod(lambda: [instance]))
+    monkeypatch.setattr(
+        IDAIPCClient,
+        "query_instance",
+        staticmethod(lambda path: IDAInstance(pid=1, socket_path=path, idb_name="sample.i64", has_idb=True)),
+    )
+
+    info = IDALauncher()._wait_for_launched_instance(process, "sample.i64", timeout=10.0)
+
+    assert info.socket_path == "/tmp/ida_ipc_1"
+
+
+def test_wait_for_launched_instance_fails_on_error_exit(monkeypatch):
+    process = subprocess.Popen([sys.executable, "-c", "import sys; sys.exit(3)"])
+    process.wait()
+    monkeypatch.setattr(IDAIPCClient, "discover_instances", staticmethod(list))
+
+    with pytest.raises(IDALaunchError) as excinfo:
+        IDALauncher()._wait_for_launched_instance(process, "sample.i64", timeout=10.0)
+
+    assert excinfo.value.exit_code == 3
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="sessions are POSIX-only")
+def test_spawn_detached_reports_exit_code():
+    process = _spawn_detached(
+        [sys.executable, "-c", "import os, sys; print('noise'); sys.exit(os.getsid(0) == os.getpid() and 3)"]
+    )
+
+    deadline = time.monotonic() + 10.0
+    while process.poll() is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # runs in its own session, and its output is discarded
+    assert process.returncode == 3
+
+
+@pytest.mark.skipif(sys.platform == "darwin", reason="macOS launches .app bundles via 'open -a'")
+def test_build_launch_command_resolves_binary_once(monkeypatch, tmp_path):
+    launcher = IDALauncher()
+    calls = []
+
+    def find_ida_binary():
+        calls.append(1)
+        return tmp_path / "ida"
+
+    monkeypatch.setattr(launcher, "_find_ida_binary", find_ida_binary)
+
+    assert launcher._build_launch_command(Path("/x/a.i64")) == [str(tmp_path / "ida"), str(Path("/x/a.i64"))]
+    assert launcher._build_launch_command(Path("/x/b.i64")) == [str(tmp_path / "ida"), str(Path("/x/b.i64"))]
+    assert len(calls) == 1
+
+
+def test_ready_time_estimate_tracks_launches(memory_config):
+    assert _load_ready_estimate("/opt/ida/ida") is None
+
+    _record_ready_time("/opt/ida/ida", 4.0)
+    assert _load_ready_estimate("/opt/ida/ida") == (4.0, 0.0)
+
+    _record_ready_time("/opt/ida/ida", 2.0)
+    estimate = _load_ready_estimate("/opt/ida/ida")
+    assert estimate is not None
+    mean, stddev = estimate
+    assert mean == pytest.approx(3.4)
+    assert stddev > 0.0
+    assert _load_ready_estimate("/opt/other/ida") is None
+
+
+def test_ready_time_estimate_capped_at_timeout(memory_config):
+    _record_ready_time("/opt/ida/ida", 500.0)
+    assert _load_ready_estimate("/opt/ida/ida", 30.0) == (30.0, 0.0)
+
+    _record_ready_time("/opt/ida/ida", 500.0, 30.0)
+    assert _load_ready_estimate("/opt/ida/ida") == (30.0, 0.0)
+
+
+def test_poll_wait_clamped_to_timeout(monkeypatch):
+    monkeypatch.setattr(IDAIPCClient, "query_instance", staticmethod(lambda path: None))
+    launcher = IDALauncher(LaunchConfig())
+
+    start = time.monotonic()
+    with pytest.raises(IDAStartupTimeout):
+        launcher._wait_for_idb_loaded(None, "/tmp/ida_ipc_0", 0.2, iter([60.0]))  # type: ignore[arg-type]
+    assert time.monotonic() - start < 5
+
+
+def test_poll_intervals_without_estimate_backs_off():
+    launcher = IDALauncher(LaunchConfig(initial_poll_interval=0.1, max_poll_interval=0.2, backoff_multiplier=1.5))
+    intervals = launcher._poll_intervals()
+
+    assert [round(next(intervals), 3) for _ in range(4)] == [0.1, 0.15, 0.2, 0.2]
+
+
+def test_poll_intervals_sleep_until_expected_ready():
+    launcher = IDALauncher(LaunchConfig(initial_poll_interval=0.1))
+    intervals = launcher._poll_intervals((time.monotonic() + 3.0, 0.0))
+
+    first = next(intervals)
+    assert 2.0 < first <= 2.5
+
+
+def test_wait_for_analysis_fails_fast_when_process_exits(monkeypatch):
+    process = subprocess.Popen([sys.executable, "-c", "import sys; sys.exit(7)"])
+    monkeypatch.setattr(
+        IDAIPCClient,
+        "is_analysis_complete",
+        staticmethod(lambda path: AnalysisResult(success=False, status="ok")),
+    )
+
+    try:
+        with pytest.raises(IDALaunchError) as excinfo:
+            IDALauncher(LaunchConfig(analysis_poll_interval=0.05))._wait_for_analysis("/tmp/ida_ipc_0", process)
+    finally:
+        process.wait()
+
+    assert excinfo.value.exit_code == 7
+
+
+def test_wait_for_analysis_without_process(monkeypatch):
+    results = iter([AnalysisResult(success=False, status="ok"), AnalysisResult(success=True, status="ok")])
+    monkeypatch.setattr(IDAIPCClient, "is_analysis_complete", staticmethod(lambda path: next(results)))
+    messages: list[str] = []
+
+    IDALauncher(LaunchConfig(analysis_poll_interval=0.01))._wait_for_analysis("/tmp/ida_ipc_0", None, messages.append)
+
+    assert messages[-1].startswith("Analysis complete")
@@ -13,3 +13,16 @@ def test_python_m_hcli_runs_cli():
     )
     assert result.returncode == 0, result.stderr
     assert "version" in (result.stdout + result.stderr).lower()
+
+
+def test_commands_imported_on_demand():
+    code = (
+        "import sys\n"
+        "from hcli.main import cli\n"
+        "assert 'hcli.commands.download' not in sys.modules\n"
+        "assert 'download' in cli.list_commands(None)\n"
+        "assert cli.get_command(None, 'download').name == 'download'\n"
+        "assert 'hcli.commands.download' in sys.modules\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=False)
+    assert result.returncode == 0, result.stderr
@@ -1,4 +1,7 @@
+import io
 import json
+import zipfile
+from pathlib import Path
 
 import pytest
 from fixtures import PLUGINS_DIR
@@ -8,11 +11,20 @@ from hcli.lib.ida.plugin import (
     PluginMetadata,
     PluginSettingDescriptor,
     URLs,
+    _open_plugin_archive,
+    _plugin_archive_member,
+    get_metadata_from_plugin_archive,
+    get_metadatas_with_paths_from_plugin_archive,
     is_binary_plugin_archive,
     is_ida_version_compatible,
     is_plugin_archive,
     is_source_plugin_archive,
+    parse_ida_version,
+    parse_ida_version_spec,
     parse_plugin_version,
+    parse_plugin_version_spec,
+    split_plugin_version_spec,
+    validate_path,
 )
 
 
@@ -34,6 +46,173 @@ def test_binary_plugin_archive():
     assert is_binary_plugin_archive(buf, "zydisinfo")
 
 
+def test_plugin_archive_opened_once(monkeypatch):
+    buf = (PLUGINS_DIR / "zydisinfo" / "zydisinfo-v1.0.0.zip").read_bytes()
+    opened = []
+
+    class CountingZipFile(zipfile.ZipFile):
+        def __init__(self, *args, **kwargs):
+            opened.append(1)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(zipfile, "ZipFile", CountingZipFile)
+
+    with _open_plugin_archive(buf) as archive:
+        assert is_plugin_archive(archive, "zydisinfo")
+        assert is_binary_plugin_archive(archive, "zydisinfo")
+        _, metadata = get_metadata_from_plugin_archive(archive, "zydisinfo")
+        assert metadata.plugin.name == "zydisinfo"
+        assert len(opened) == 1
+        assert archive.plugin_archive_verdicts == {"zydisinfo": True}
+
+    assert archive.zip_file.fp is None
+
+
+def test_plugin_archive_validated_once(monkeypatch):
+    import hcli.lib.ida.plugin
+
+    buf = (PLUGINS_DIR / "plugin1" / "plugin1-v1.0.0.zip").read_bytes()
+    check = hcli.lib.ida.plugin._check_metadata_in_plugin_archive
+    calls = []
+
+    def counting_check(*args):
+        calls.append(1)
+        return check(*args)
+
+    monkeypatch.setattr(hcli.lib.ida.plugin, "_check_metadata_in_plugin_archive", counting_check)
+
+    with _open_plugin_archive(buf) as archive:
+        assert is_source_plugin_archive(archive, "plugin1")
+        assert not is_binary_plugin_archive(archive, "plugin1")
+        assert is_plugin_archive(archive, "plugin1")
+    assert len(calls) == 1
+
+
+def test_plugin_archive_metadata_parsed_once():
+    plugin_path = PLUGINS_DIR / "plugin1" / "plugin1-v1.0.0.zip"
+    buf = plugin_path.read_bytes()
+
+    with _open_plugin_archive(buf) as archive:
+        _, first = get_metadata_from_plugin_archive(archive, "plugin1")
+        assert is_source_plugin_archive(archive, "plugin1")
+        _, second = get_metadata_from_plugin_archive(archive, "plugin1")
+
+    assert first is second
+    # nothing is remembered across archives, even for the same bytes.
+    assert get_metadata_from_plugin_archive(buf, "plugin1")[1] is not first
+
+
+def test_plugin_archive_lookup_stops_at_first_match():
+    doc = json.loads((PLUGINS_DIR / "plugin1" / "src-v1" / "ida-plugin.json").read_text())
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zip_file:
+        for name in ("first", "second"):
+            doc["plugin"]["name"] = name
+            zip_file.writestr(f"{name}/ida-plugin.json", json.dumps(doc))
+
+    with _open_plugin_archive(buf.getvalue()) as archive:
+        path, _ = get_metadata_from_plugin_archive(archive, "first")
+        assert path.as_posix() == "first/ida-plugin.json"
+        assert len(archive.metadatas) == 1
+
+        assert [metadata.plugin.name for _, metadata in get_metadatas_with_paths_from_plugin_archive(archive)] == [
+            "first",
+            "second",
+        ]
+        assert archive.parsed_all_metadatas
+        assert archive.metadatas_by_name["second"][0].as_posix() == "second/ida-plugin.json"
+        with pytest.raises(ValueError):
+            get_metadata_from_plugin_archive(archive, "third")
+
+
+def test_validate_native_entry_points_per_platform():
+    doc = json.loads((PLUGINS_DIR / "plugin1" / "src-v1" / "ida-plugin.json").read_text())
+    doc["plugin"]["entryPoint"] = "native"
+    doc["plugin"]["platforms"] = ["linux-x86_64", "windows-x86_64"]
+
+    def make_archive(*entry_points):
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zip_file:
+            zip_file.writestr("plugin1/ida-plugin.json", json.dumps(doc))
+            for entry_point in entry_points:
+                zip_file.writestr(f"plugin1/{entry_point}", b"")
+        return buf.getvalue()
+
+    assert is_plugin_archive(make_archive("native.so", "native.dll"), "plugin1")
+    assert not is_plugin_archive(make_archive("native.so"), "plugin1")
+    assert not is_plugin_archive(make_archive(), "plugin1")
+
+
+def test_is_plugin_archive_rejects_non_archives():
+    assert not is_plugin_archive(b"not a zip", "plugin1")
+    assert not is_source_plugin_archive(b"not a zip", "plugin1")
+    assert not is_binary_plugin_archive(b"not a zip", "plugin1")
+
+    buf = (PLUGINS_DIR / "plugin1" / "plugin1-v1.0.0.zip").read_bytes()
+    assert not is_plugin_archive(buf, "other")
+
+
+def test_archive_predicates_reject_corrupt_archives():
+    buf = (PLUGINS_DIR / "plugin1" / "plugin1-v1.0.0.zip").read_bytes()
+
+    corrupted = [buf[:length] for length in range(0, len(buf), 7)]
+    for offset in range(len(buf)):
+        for value in (0x00, 0xFF, 0x80):
+            corrupted.append(buf[:offset] + bytes([value]) + buf[offset + 1 :])
+
+    for data in corrupted:
+        # whatever zipfile raises for a damaged archive, these answer rather than raise.
+        is_plugin_archive(data, "plugin1")
+        is_source_plugin_archive(data, "plugin1")
+        is_binary_plugin_archive(data, "plugin1")
+
+
+def test_archive_predicates_propagate_bugs(monkeypatch):
+    import hcli.lib.ida.plugin
+
+    buf = (PLUGINS_DIR / "plugin1" / "plugin1-v1.0.0.zip").read_bytes()
+
+    def broken(*args):
+        raise AttributeError("bug")
+
+    monkeypatch.setattr(hcli.lib.ida.plugin, "_find_metadata_in_plugin_archive", broken)
+
+    # only a damaged archive means "not a plugin archive"; a bug in the checks isn't hidden as one.
+    for predicate in (is_plugin_archive, is_source_plugin_archive, is_binary_plugin_archive):
+        with pytest.raises(AttributeError):
+            predicate(buf, "plugin1")
+
+
+@pytest.mark.parametrize("plugin_root", ["", "plugin1", "a/b"])
+@pytest.mark.parametrize("relative_path", ["main.py", "src/main.py", "./main.py", "src//main.py", "src/./logo.png"])
+def test_plugin_archive_member_matches_path_join(plugin_root, relative_path):
+    expected = (Path(plugin_root or ".") / Path(relative_path)).as_posix()
+    assert _plugin_archive_member(plugin_root, relative_path) == expected
+
+
+@pytest.mark.parametrize(
+    ("path", "ok"),
+    [
+        ("", True),
+        ("main.py", True),
+        ("src/main.py", True),
+        ("src/...py", True),
+        ("/etc/passwd", False),
+        ("\\windows\\x.dll", False),
+        ("../main.py", False),
+        ("src/../../main.py", False),
+        ("src\\..\\main.py", False),
+        ("srç/main.py", False),
+    ],
+)
+def test_validate_path(path, ok):
+    if ok:
+        validate_path(path, "entry point")
+    else:
+        with pytest.raises(ValueError):
+            validate_path(path, "entry point")
+
+
 def test_is_ida_version_compatible():
     # Test exact version matches
     assert is_ida_version_compatible("9.0", ["9.0"])
@@ -47,6 +226,10 @@ def test_is_ida_version_compatible():
     assert not is_ida_version_compatible("8.5", ["9.0", "9.1"])
     assert not is_ida_version_compatible("9.0sp1", ["9.0", "9.1"])  # sp1 not in list
 
+    # any iterable of versions, not only (unhashable) lists
+    assert is_ida_version_compatible("9.1", frozenset({"9.0", "9.1"}))
+    assert is_ida_version_compatible("9.1", (v for v in ["9.0", "9.1"]))
+
 
 def test_parse_plugin_version():
     """Test version parsing with leading zeros - they should be normalized."""
@@ -66,6 +249,40 @@ def test_parse_plugin_version():
     _ = IDAMetadataDescriptor.model_validate_json(json.dumps(doc))
 
 
+def test_parse_plugin_version_spec():
+    spec = parse_plugin_version_spec(">=1.2")
+    assert parse_plugin_version("1.2") in spec
+    assert parse_plugin_version("1.1.9") not in spec
+    assert parse_plugin_version_spec(">=1.2") is spec
+
+
+@pytest.mark.parametrize(
+    ("spec", "expected"),
+    [
+        ("plugin1", ("plugin1", "")),
+        ("plugin1==1.0.0", ("plugin1", "1.0.0")),
+        ("plugin1>=1.0", ("plugin1", "1.0")),
+        ("plugin1~=2", ("plugin1", "2")),
+    ],
+)
+def test_split_plugin_version_spec(spec, expected):
+    assert split_plugin_version_spec(spec) == expected
+
+
+@pytest.mark.parametrize("spec", ["plugin1>1.0.0", "plugin1=", "plugin1==notaversion"])
+def test_split_plugin_version_spec_invalid(spec):
+    with pytest.raises(ValueError):
+        split_plugin_version_spec(spec)
+
+
+def test_parse_ida_version_normalization():
+    assert str(parse_ida_version("9")) == "9.0.0"
+    assert str(parse_ida_version("9.1")) == "9.1.0"
+    assert str(parse_ida_version("9.0sp1")) == "9.0.1"
+    assert parse_ida_version("9.0sp1") in parse_ida_version_spec(">=9.0sp1,<9.1")
+    assert parse_ida_version("9.0") not in parse_ida_version_spec(">=9.0sp1")
+
+
 def test_parse_ida_versions():
     metadata_path = PLUGINS_DIR / "plugin1" / "src-v1" / "ida-plugin.json"
 
@@ -94,6 +311,11 @@ def test_parse_ida_versions():
     assert "8.5" not in m.plugin.ida_versions
     assert "9.2" not in m.plugin.ida_versions
 
+    # the same spec again: same expansion, but not a shared list
+    m2 = IDAMetadataDescriptor.model_validate_json(json.dumps(doc))
+    assert m2.plugin.ida_versions == m.plugin.ida_versions
+    assert m2.plugin.ida_versions is not m.plugin.ida_versions
+
 
 def test_unexpected_keys_in_plugin_metadata():
     metadata_path = PLUGINS_DIR / "plugin1" / "src-v1" / "ida-plugin.json"
@@ -112,6 +334,30 @@ def test_unexpected_keys_in_plugin_metadata():
     assert m.plugin.__pydantic_extra__["anotherBadKey"] == 123
 
 
+@pytest.mark.parametrize(
+    ("name", "ok"),
+    [
+        ("my-plugin", True),
+        ("my_plugin2", True),
+        ("", False),
+        ("my plugin", False),
+        ("my-plügin", False),
+        ("my-plugin\n", False),
+        ("-my-plugin", False),
+        ("my-plugin_", False),
+    ],
+)
+def test_plugin_metadata_name_validation(name, ok):
+    doc = json.loads((PLUGINS_DIR / "plugin1" / "src-v1" / "ida-plugin.json").read_text())
+    doc["plugin"]["name"] = name
+
+    if ok:
+        assert IDAMetadataDescriptor.model_validate_json(json.dumps(doc)).plugin.name == name
+    else:
+        with pytest.raises(ValueError):
+            IDAMetadataDescriptor.model_validate_json(json.dumps(doc))
+
+
 def test_plugin_metadata_model_dump_uses_aliases():
     """Verify model_dump() returns JSON-aliased keys, not Python attribute names.
 
@@ -287,3 +533,99 @@ def test_setting_secret_not_allowed_for_boolean():
             name="Test Setting",
             secret=True,
         )
+
+
+def test_http_get_with_cache_revalidates_cached_response(tmp_path, monkeypatch):
+    import httpx
+
+    import hcli.lib.ida.plugin.repo
+    from hcli.lib.ida.plugin.repo import _get_http_cache_paths, http_get_with_cache
+
+    monkeypatch.setenv("HCLI_CACHE_DIR", str(tmp_path))
+    url = "https://example.com/plugin-repository.json"
+    requests = []
+
+    def handler(request):
+        etag = request.headers.get("If-None-Match")
+        requests.append({"If-None-Match": etag} if etag else {})
+        if etag == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=b"index", headers={"ETag": '"v1"'})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(hcli.lib.ida.plugin.repo, "_get_http_client", lambda: client)
+
+    for _ in range(2):
+        assert http_get_with_cache(url) == b"index"
+    assert requests == [{}, {"If-None-Match": '"v1"'}]
+
+    # a body that doesn't match its validators isn't trusted.
+    body_path, _ = _get_http_cache_paths(url)
+    body_path.write_bytes(b"other")
+    assert http_get_with_cache(url) == b"index"
+    assert requests[-1] == {}
+    assert list(body_path.parent.glob("*.tmp")) == []
+
+
+def test_fetch_plugin_archive_is_not_cached(tmp_path, monkeypatch):
+    import hashlib
+
+    import httpx
+
+    import hcli.lib.ida.plugin.repo
+    from hcli.lib.ida.plugin.repo import fetch_plugin_archive
+
+    monkeypatch.setenv("HCLI_CACHE_DIR", str(tmp_path))
+    requests = []
+
+    def handler(request):
+        requests.append(request.headers.get("If-None-Match"))
+        return httpx.Response(200, content=b"archive", headers={"ETag": '"v1"'})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(hcli.lib.ida.plugin.repo, "_get_http_client", lambda: client)
+
+    for _ in range(2):
+        h = hashlib.sha256()
+        assert fetch_plugin_archive("https://example.com/plugin.zip", h) == b"archive"
+        assert h.hexdigest() == hashlib.sha256(b"archive").hexdigest()
+    assert requests == [None, None]
+    assert not (tmp_path / "http-cache").exists() or list((tmp_path / "http-cache").iterdir()) == []
+
+
+def test_json_file_repo_round_trip():
+    from hcli.lib.ida.plugin.repo.file import JSONFilePluginRepo
+    from hcli.lib.ida.plugin.repo.fs import FileSystemPluginRepo
+
+    repo = JSONFilePluginRepo.from_repo(FileSystemPluginRepo(PLUGINS_DIR))
+    doc = repo.to_json()
+
+    assert '"idaVersions"' in doc
+    assert doc == json.dumps(json.loads(doc), sort_keys=True, indent=4)
+    assert JSONFilePluginRepo.from_json(doc).to_json() == doc
+    assert JSONFilePluginRepo.from_bytes(repo.to_bytes()).to_json() == doc
+
+
+def test_fetch_plugin_archives_fetches_each_url_once(tmp_path, monkeypatch):
+    import httpx
+
+    import hcli.lib.ida.plugin.repo
+    from hcli.lib.ida.plugin.repo import fetch_plugin_archives
+
+    monkeypatch.setenv("HCLI_CACHE_DIR", str(tmp_path))
+    requested = []
+
+    def handler(request):
+        requested.append(str(request.url))
+        return httpx.Response(200, content=request.url.path.encode())
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(hcli.lib.ida.plugin.repo, "_get_http_client", lambda: client)
+
+    (tmp_path / "local.zip").write_bytes(b"local")
+    urls = ["https://example.com/a.zip", (tmp_path / "local.zip").as_uri(), "https://example.com/b.zip"]
+    archives = fetch_plugin_archives([*urls, urls[0]])
+
+    assert list(archives) == urls
+    assert archives == {urls[0]: b"/a.zip", urls[1]: b"local", urls[2]: b"/b.zip"}
+    assert sorted(requested) == ["https://example.com/a.zip", "https://example.com/b.zip"]
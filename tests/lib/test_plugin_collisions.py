@@ -151,12 +151,299 @@ def test_index_normalizes_hosts_during_indexing(tmp_path):
     assert set(plugin.versions) == {"1.0.0", "2.0.0"}
 
 
+def test_index_hashes_archive_once(tmp_path, monkeypatch):
+    import hashlib
+
+    src = PLUGINS_DIR / "plugin1" / "plugin1-v1.0.0.zip"
+    z = tmp_path / "multi.zip"
+    with zipfile.ZipFile(src, "r") as src_zip, zipfile.ZipFile(z, "w") as dst:
+        for name in ("alpha", "beta"):
+            for item in src_zip.infolist():
+                data = src_zip.read(item.filename)
+                if item.filename.endswith("ida-plugin.json"):
+                    metadata = json.loads(data)
+                    metadata["plugin"]["name"] = name
+                    data = json.dumps(metadata).encode("utf-8")
+                dst.writestr(f"{name}/{item.filename}", data)
+
+    buf = z.read_bytes()
+    expected = hashlib.sha256(buf).hexdigest()
+
+    calls = []
+    real_sha256 = hashlib.sha256
+
+    def sha256(*args):
+        calls.append(1)
+        return real_sha256(*args)
+
+    monkeypatch.setattr(hashlib, "sha256", sha256)
+
+    index = PluginArchiveIndex()
+    index.index_plugin_archive(buf, z.absolute().as_uri())
+
+    plugins = index.get_plugins()
+    assert [plugin.name for plugin in plugins] == ["alpha", "beta"]
+    assert {plugin.versions["1.0.0"][0].sha256 for plugin in plugins} == {expected}
+    assert len(calls) == 1
+
+
+def test_index_builds_plugins_on_demand(tmp_path):
+    src = PLUGINS_DIR / "plugin1" / "plugin1-v1.0.0.zip"
+    index = PluginArchiveIndex()
+    for name in ("alpha", "beta"):
+        z = make_plugin_zip(src, tmp_path / f"{name}.zip", new_name=name)
+        index.index_plugin_archive(z.read_bytes(), z.absolute().as_uri())
+
+    (alpha,) = index.get_plugins_named("ALPHA")
+    assert alpha.name == "alpha"
+    assert index.get_plugins_named("missing") == []
+    assert [id_[0] for id_ in index._plugins] == ["alpha"]
+
+    plugins = index.get_plugins()
+    assert [plugin.name for plugin in plugins] == ["alpha", "beta"]
+    assert plugins[0] is alpha
+    assert index.get_plugins() is plugins
+
+    # indexing another version rebuilds that plugin only
+    z = make_plugin_zip(src, tmp_path / "alpha-2.zip", new_name="alpha", new_version="2.0.0")
+    index.index_plugin_archive(z.read_bytes(), z.absolute().as_uri())
+    plugins_after = index.get_plugins()
+    assert plugins_after is not plugins
+    assert set(plugins_after[0].versions) == {"1.0.0", "2.0.0"}
+    assert plugins_after[1] is plugins[1]
+
+
+def test_index_shares_identical_specs(tmp_path):
+    index = build_index_with_colliding_plugins(tmp_path)
+
+    ((_, *spec_a),) = index.index[("shared", "https://github.com/org-a/shared")]
+    ((_, *spec_b),) = index.index[("shared", "https://github.com/org-b/shared")]
+    assert spec_a[0] is spec_b[0]
+    assert spec_a[1] is spec_b[1]
+
+
+def test_filesystem_repo_indexes_with_precomputed_hashes(tmp_path):
+    import hashlib
+
+    from hcli.lib.ida.plugin.repo.fs import FileSystemPluginRepo
+
+    repo_dir = _build_colliding_repo_dir(tmp_path)
+    plugins = FileSystemPluginRepo(repo_dir).get_plugins()
+
+    assert [plugin.host for plugin in plugins] == [
+        "https://github.com/org-a/shared",
+        "https://github.com/org-b/shared",
+    ]
+    for plugin, zip_name in zip(plugins, ("shared-a.zip", "shared-b.zip")):
+        (location,) = [location for locations in plugin.versions.values() for location in locations]
+        assert location.url == (repo_dir / zip_name).absolute().as_uri()
+        assert location.sha256 == hashlib.sha256((repo_dir / zip_name).read_bytes()).hexdigest()
+
+
+def test_filesystem_repo_bounds_read_ahead(tmp_path, monkeypatch):
+    import os
+
+    import hcli.lib.ida.plugin.repo.fs
+    from hcli.lib.ida.plugin.repo.fs import FileSystemPluginRepo
+
+    for i in range(10):
+        (tmp_path / f"{i}.zip").write_bytes(b"")
+
+    indexed: list[str] = []
+    read_ahead: list[int] = []
+    read = hcli.lib.ida.plugin.repo.fs._read_plugin_archive
+
+    def counting_read(path):
+        # how far this read is ahead of the archive being indexed.
+        read_ahead.append(int(path.stem) - len(indexed))
+        return read(path)
+
+    monkeypatch.setattr(hcli.lib.ida.plugin.repo.fs, "_read_plugin_archive", counting_read)
+    monkeypatch.setattr(PluginArchiveIndex, "index_plugin_archive", lambda self, buf, url, sha256: indexed.append(url))
+    monkeypatch.setattr(os, "walk", lambda path: [(str(tmp_path), [], [f"{i}.zip" for i in range(10)])])
+
+    repo = FileSystemPluginRepo(tmp_path)
+    repo.READ_WORKERS = 2
+    repo.get_plugins()
+
+    assert len(indexed) == 10
+    assert max(read_ahead) <= 2
+
+
+def test_index_get_plugin_by_name_builds_only_the_match(tmp_path):
+    index = build_index_with_colliding_plugins(tmp_path)
+
+    plugin = index.get_plugin_by_name("Shared", host="https://GitHub.com/org-b/shared/")
+    assert plugin.host == "https://github.com/org-b/shared"
+    assert list(index._plugins) == [("shared", "https://github.com/org-b/shared")]
+
+    with pytest.raises(AmbiguousPluginReferenceError):
+        index.get_plugin_by_name("shared")
+    with pytest.raises(KeyError):
+        index.get_plugin_by_name("shared", host="https://github.com/org-c/shared")
+
+
+def test_find_plugin_from_spec_picks_highest_matching_version(tmp_path):
+    from hcli.lib.ida.plugin.repo.file import JSONFilePluginRepo
+
+    src = PLUGINS_DIR / "plugin1" / "plugin1-v1.0.0.zip"
+    index = PluginArchiveIndex()
+    for version in ("1.0.0", "1.10.0", "1.9.0", "2.0.0"):
+        z = make_plugin_zip(src, tmp_path / f"alpha-{version}.zip", new_name="alpha", new_version=version)
+        index.index_plugin_archive(z.read_bytes(), z.absolute().as_uri())
+    repo = JSONFilePluginRepo(index.get_plugins())
+
+    assert repo.find_plugin_from_spec("alpha").metadata.plugin.version == "2.0.0"
+    assert repo.find_plugin_from_spec("alpha<=1.99").metadata.plugin.version == "1.10.0"
+    assert repo.find_plugin_from_spec("alpha==1.9.0").metadata.plugin.version == "1.9.0"
+    assert repo.find_plugin_from_spec("alpha>=1.1.0,<1.10.0").metadata.plugin.version == "1.9.0"
+    assert repo.find_plugin_from_spec("alpha!=2.0.0").metadata.plugin.version == "1.10.0"
+    with pytest.raises(KeyError):
+        repo.find_plugin_from_spec("alpha>=3.0")
+    with pytest.raises(KeyError):
+        repo.find_plugin_from_spec("alpha==1.5.0")
+
+
+def test_find_plugin_from_spec_keeps_order_of_equal_versions(tmp_path):
+    from hcli.lib.ida.plugin.repo import Plugin
+    from hcli.lib.ida.plugin.repo.file import JSONFilePluginRepo
+
+    src = PLUGINS_DIR / "plugin1" / "plugin1-v1.0.0.zip"
+    index = PluginArchiveIndex()
+    for version in ("1.1.0+build0", "1.1.0", "1.0.0"):
+        z = make_plugin_zip(src, tmp_path / f"alpha-{version}.zip", new_name="alpha", new_version=version)
+        index.index_plugin_archive(z.read_bytes(), z.absolute().as_uri())
+    (plugin,) = index.get_plugins()
+
+    # versions differing only in build metadata have equal precedence, so the first one listed wins.
+    for order in (["1.1.0+build0", "1.1.0", "1.0.0"], ["1.0.0", "1.1.0", "1.1.0+build0"]):
+        versions = {version: plugin.versions[version] for version in order}
+        repo = JSONFilePluginRepo([Plugin(name=plugin.name, host=plugin.host, versions=versions)])
+        expected = next(version for version in order if version != "1.0.0")
+        assert repo.find_plugin_from_spec("alpha").metadata.plugin.version == expected
+        assert repo.find_plugin_from_spec("alpha>=1.1.0").metadata.plugin.version == expected
+
+
+@pytest.mark.parametrize(
+    ("spec", "expected"),
+    [
+        (">=1.0.0", ("1.0.0", None)),
+        ("<2.0.0", (None, "2.0.0")),
+        ("==1.2.3", ("1.2.3", "1.2.3")),
+        (">1.0.0,>=1.5.0,<3.0.0,<=2.0.0", ("1.5.0", "2.0.0")),
+        ("!=1.0.0", (None, None)),
+    ],
+)
+def test_version_spec_bounds(spec, expected):
+    from hcli.lib.ida.plugin import parse_plugin_version_spec
+    from hcli.lib.ida.plugin.repo import _get_version_spec_bounds
+
+    lower, upper = _get_version_spec_bounds(parse_plugin_version_spec(spec))
+    assert (str(lower) if lower else None, str(upper) if upper else None) == expected
+
+
+def test_index_plugins_match_validated_models(tmp_path):
+    from hcli.lib.ida.plugin.repo import Plugin, PluginArchiveLocation
+
+    index = build_index_with_colliding_plugins(tmp_path)
+    for plugin in index.get_plugins():
+        validated = Plugin(
+            name=plugin.name,
+            host=plugin.host,
+            versions={
+                version: [
+                    PluginArchiveLocation(url=location.url, sha256=location.sha256, metadata=location.metadata)
+                    for location in locations
+                ]
+                for version, locations in plugin.versions.items()
+            },
+        )
+        assert plugin == validated
+        assert type(plugin.versions) is dict
+
+
+def test_index_opens_archive_once(tmp_path, monkeypatch):
+    src = PLUGINS_DIR / "plugin1" / "plugin1-v1.0.0.zip"
+    z = tmp_path / "multi.zip"
+    with zipfile.ZipFile(src, "r") as src_zip, zipfile.ZipFile(z, "w") as dst:
+        for name in ("alpha", "beta", "gamma"):
+            for item in src_zip.infolist():
+                data = src_zip.read(item.filename)
+                if item.filename.endswith("ida-plugin.json"):
+                    metadata = json.loads(data)
+                    metadata["plugin"]["name"] = name
+                    data = json.dumps(metadata).encode("utf-8")
+                dst.writestr(f"{name}/{item.filename}", data)
+    buf = z.read_bytes()
+
+    opened = []
+
+    class CountingZipFile(zipfile.ZipFile):
+        def __init__(self, *args, **kwargs):
+            opened.append(1)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(zipfile, "ZipFile", CountingZipFile)
+
+    index = PluginArchiveIndex()
+    index.index_plugin_archive(buf, z.absolute().as_uri())
+
+    assert [plugin.name for plugin in index.get_plugins()] == ["alpha", "beta", "gamma"]
+    assert len(opened) == 1
+
+
+def test_index_parses_identical_archives_once(tmp_path, monkeypatch):
+    src = PLUGINS_DIR / "plugin1" / "plugin1-v1.0.0.zip"
+    z = make_plugin_zip(src, tmp_path / "alpha.zip", new_name="alpha")
+
+    opened = []
+
+    class CountingZipFile(zipfile.ZipFile):
+        def __init__(self, *args, **kwargs):
+            opened.append(1)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(zipfile, "ZipFile", CountingZipFile)
+
+    index = PluginArchiveIndex()
+    # distinct buffers with the same contents, like a release's and its tag's source archive.
+    index.index_plugin_archive(z.read_bytes(), "https://example.com/release.zip")
+    index.index_plugin_archive(z.read_bytes(), "https://example.com/tag.zip")
+
+    (plugin,) = index.get_plugins()
+    assert [location.url for location in plugin.versions["1.0.0"]] == [
+        "https://example.com/release.zip",
+        "https://example.com/tag.zip",
+    ]
+    assert len(opened) == 1
+
+
 def test_get_plugin_by_name_not_found(tmp_path):
     index = build_index_with_colliding_plugins(tmp_path)
     with pytest.raises(KeyError):
         get_plugin_by_name(index.get_plugins(), "does-not-exist")
 
 
+def test_repo_get_plugin_by_name_reuses_name_index(tmp_path):
+    from hcli.lib.ida.plugin.repo.file import JSONFilePluginRepo
+
+    repo = JSONFilePluginRepo(build_index_with_colliding_plugins(tmp_path).get_plugins())
+
+    by_name = repo.get_plugins_by_name()
+    assert [plugin.host for plugin in by_name["shared"]] == [
+        "https://github.com/org-a/shared",
+        "https://github.com/org-b/shared",
+    ]
+    assert repo.get_plugins_by_name() is by_name
+
+    with pytest.raises(AmbiguousPluginReferenceError):
+        repo.get_plugin_by_name("Shared")
+    with pytest.raises(KeyError):
+        repo.get_plugin_by_name("does-not-exist")
+    plugin = repo.get_plugin_by_name("SHARED", host="https://github.com/org-b/shared/")
+    assert plugin.host == "https://github.com/org-b/shared"
+
+
 def test_get_plugin_by_name_is_case_insensitive(tmp_path):
     src = PLUGINS_DIR / "plugin1" / "plugin1-v1.0.0.zip"
     z = make_plugin_zip(src, tmp_path / "Foo.zip", new_name="Foo")
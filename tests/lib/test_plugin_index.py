@@ -1,15 +1,41 @@
+import json
 import os
 import shutil
 import tempfile
+import threading
+import time
+from pathlib import Path
 
+import httpx
 import pytest
+from fixtures import PLUGINS_DIR
+from test_plugin_collisions import make_plugin_zip
 
+import hcli.lib.ida.plugin.repo.github
+from hcli.lib.ida.plugin import MappedPluginArchive
+from hcli.lib.ida.plugin.repo import PluginArchiveIndex
 from hcli.lib.ida.plugin.repo.github import (
+    SOURCE_ARCHIVE_FILENAME,
+    GitHubCommit,
     GitHubGraphQLClient,
+    GithubPluginRepo,
+    GitHubRelease,
+    GitHubReleaseAsset,
+    GitHubReleases,
+    GitHubTag,
+    _open_with_retry,
+    _read_archive_metadatas,
     get_release_asset,
     get_release_metadata,
+    get_releases_metadata_cache,
+    get_releases_metadata_etags,
     get_source_archive,
+    get_source_archive_cache_directory,
     parse_repository,
+    set_releases_metadata_cache,
+    set_releases_metadata_etags,
+    set_source_archive_cache,
+    warm_releases_metadata_cache,
 )
 from hcli.lib.util.cache import get_cache_directory
 
@@ -44,6 +70,13 @@ def test_github_client_get_releases():
     assert "v1.2.0" in tags
 
 
+@pytest.mark.parametrize("value", ["owner", "owner/repo/extra", "a/b/"])
+def test_parse_repository_rejects_invalid_format(value: str):
+    assert parse_repository("owner/repo") == ("owner", "repo")
+    with pytest.raises(ValueError):
+        parse_repository(value)
+
+
 def test_get_cache_directory_invalid_path_keys(temp_hcli_cache_dir):
     with pytest.raises(ValueError):
         get_cache_directory("")
@@ -132,3 +165,458 @@ def test_get_release_asset(temp_hcli_cache_dir):
     asset = release.assets[0]
     buf = get_release_asset(owner, repo, "v1.2.0", asset)
     assert len(buf) == 696320
+
+
+def cache_source_archive(owner: str, repo: str, commit_hash: str, buf: bytes) -> Path:
+    set_source_archive_cache(owner, repo, commit_hash, buf)
+    return get_source_archive_cache_directory(owner, repo, commit_hash) / SOURCE_ARCHIVE_FILENAME
+
+
+def make_offline_github_repo(monkeypatch, repos: list[tuple[str, str]]) -> GithubPluginRepo:
+    # don't search GitHub for candidate repos or warm the releases cache.
+    monkeypatch.setattr(GithubPluginRepo, "_get_repos", lambda self: repos)
+    monkeypatch.setattr(hcli.lib.ida.plugin.repo.github, "warm_releases_metadata_cache", lambda client, repos: None)
+    return GithubPluginRepo("token")
+
+
+def test_github_get_plugins_downloads_concurrently(temp_hcli_cache_dir, tmp_path, monkeypatch):
+    src = PLUGINS_DIR / "plugin1" / "plugin1-v1.0.0.zip"
+    bufs = {}
+    for version in ("1.0.0", "2.0.0"):
+        z = make_plugin_zip(
+            src,
+            tmp_path / f"alpha-{version}.zip",
+            new_name="alpha",
+            new_version=version,
+            new_repository="https://github.com/org/alpha",
+        )
+        bufs[f"https://example.com/alpha-{version}.zip"] = z.read_bytes()
+
+    releases = GitHubReleases(
+        default_branch=GitHubCommit(commit_hash="0" * 40, committed_date="2025-10-01", zipball_url=""),
+        releases=[],
+        tags=[
+            GitHubTag(tag_name=f"v{i}", commit_hash=str(i) * 40, zipball_url=url, committed_date="2025-10-01")
+            for i, url in enumerate(bufs)
+        ],
+    )
+    monkeypatch.setattr(hcli.lib.ida.plugin.repo.github, "get_releases_metadata", lambda client, o, r: releases)
+
+    # both downloads must be in flight at the same time to get past the barrier.
+    barrier = threading.Barrier(len(bufs), timeout=10)
+
+    def get_source_archive_path(owner, repo, commit_hash, zip_url):
+        barrier.wait()
+        return cache_source_archive(owner, repo, commit_hash, bufs[zip_url])
+
+    monkeypatch.setattr(hcli.lib.ida.plugin.repo.github, "get_source_archive_path", get_source_archive_path)
+
+    plugins = make_offline_github_repo(monkeypatch, [("org", "alpha")]).get_plugins()
+
+    assert [plugin.name for plugin in plugins] == ["alpha"]
+    assert list(plugins[0].versions) == ["1.0.0", "2.0.0"]
+
+
+def test_github_get_plugins_fetches_shared_source_archive_once(temp_hcli_cache_dir, tmp_path, monkeypatch):
+    z = make_plugin_zip(
+        PLUGINS_DIR / "plugin1" / "plugin1-v1.0.0.zip",
+        tmp_path / "alpha.zip",
+        new_name="alpha",
+        new_version="1.0.0",
+        new_repository="https://github.com/org/alpha",
+    )
+
+    # the release and its tag are the same commit, under different zipball URLs.
+    releases = GitHubReleases(
+        default_branch=GitHubCommit(commit_hash="0" * 40, committed_date="2025-10-01", zipball_url=""),
+        releases=[
+            GitHubRelease(
+                name="v1",
+                tag_name="v1",
+                commit_hash="1" * 40,
+                created_at="2025-10-01",
+                published_at="2025-10-01",
+                is_prerelease=False,
+                is_draft=False,
+                url="https://github.com/org/alpha/releases/tag/v1",
+                zipball_url="https://example.com/release.zip",
+                assets=[],
+            )
+        ],
+        tags=[
+            GitHubTag(
+                tag_name="v1",
+                commit_hash="1" * 40,
+                zipball_url="https://example.com/tag.zip",
+                committed_date="2025-10-01",
+            )
+        ],
+    )
+    monkeypatch.setattr(hcli.lib.ida.plugin.repo.github, "get_releases_metadata", lambda client, o, r: releases)
+
+    fetched = []
+
+    def get_source_archive_path(owner, repo, commit_hash, zip_url):
+        fetched.append(zip_url)
+        return cache_source_archive(owner, repo, commit_hash, z.read_bytes())
+
+    monkeypatch.setattr(hcli.lib.ida.plugin.repo.github, "get_source_archive_path", get_source_archive_path)
+
+    plugins = make_offline_github_repo(monkeypatch, [("org", "alpha")]).get_plugins()
+
+    assert fetched == ["https://example.com/release.zip"]
+    assert [location.url for location in plugins[0].versions["1.0.0"]] == [
+        "https://example.com/release.zip",
+        "https://example.com/tag.zip",
+    ]
+
+
+def test_github_get_plugins_cancels_pending_fetches_on_interrupt(temp_hcli_cache_dir, tmp_path, monkeypatch):
+    z = make_plugin_zip(
+        PLUGINS_DIR / "plugin1" / "plugin1-v1.0.0.zip",
+        tmp_path / "alpha.zip",
+        new_name="alpha",
+        new_version="1.0.0",
+        new_repository="https://github.com/org/alpha",
+    )
+    releases = GitHubReleases(
+        default_branch=GitHubCommit(commit_hash="0" * 40, committed_date="2025-10-01", zipball_url=""),
+        releases=[],
+        tags=[
+            GitHubTag(
+                tag_name=f"v{i}",
+                commit_hash=str(i) * 40,
+                zipball_url=f"https://example.com/{i}.zip",
+                committed_date="2025-10-01",
+            )
+            for i in range(3)
+        ],
+    )
+    monkeypatch.setattr(hcli.lib.ida.plugin.repo.github, "get_releases_metadata", lambda client, o, r: releases)
+    monkeypatch.setattr(hcli.lib.ida.plugin.repo.github, "DOWNLOAD_WORKERS", 1)
+
+    # the second download hangs, and the third is still queued behind it when the first is indexed.
+    hung = threading.Event()
+    fetched = []
+
+    def get_source_archive_path(owner, repo, commit_hash, zip_url):
+        fetched.append(zip_url)
+        if zip_url.endswith("/1.zip"):
+            hung.wait(timeout=10)
+        return cache_source_archive(owner, repo, commit_hash, z.read_bytes())
+
+    def interrupt(*args):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(hcli.lib.ida.plugin.repo.github, "get_source_archive_path", get_source_archive_path)
+    monkeypatch.setattr(hcli.lib.ida.plugin.repo.github._ArchiveMetadataCache, "set", interrupt)
+
+    start = time.monotonic()
+    try:
+        with pytest.raises(KeyboardInterrupt):
+            make_offline_github_repo(monkeypatch, [("org", "alpha")]).get_plugins()
+        assert time.monotonic() - start < 5
+    finally:
+        hung.set()
+
+    assert "https://example.com/2.zip" not in fetched
+
+
+def test_releases_metadata_cache_round_trip(temp_hcli_cache_dir):
+    releases = GitHubReleases.model_validate(
+        {
+            "default_branch": {"commit_hash": "a" * 40, "committed_date": "2025-10-01", "zipball_url": "z"},
+            "releases": [
+                {
+                    "name": "v1",
+                    "tag_name": "v1",
+                    "commit_hash": "b" * 40,
+                    "created_at": "2025-10-01",
+                    "published_at": "2025-10-01",
+                    "is_prerelease": False,
+                    "is_draft": False,
+                    "url": "u",
+                    "zipball_url": "z1",
+                    "assets": [{"name": "a.zip", "contentType": "application/zip", "size": 1, "downloadUrl": "d"}],
+                }
+            ],
+            "tags": [],
+        }
+    )
+    set_releases_metadata_cache("org", "alpha", releases)
+
+    cached = get_releases_metadata_cache("org", "alpha")
+    assert cached == releases
+    assert isinstance(cached.releases[0].assets[0], GitHubReleaseAsset)
+
+
+def test_releases_metadata_cache_reuses_models_until_rewritten(temp_hcli_cache_dir):
+    def make_releases(tag_name: str) -> GitHubReleases:
+        return GitHubReleases(
+            default_branch=GitHubCommit(commit_hash="a" * 40, committed_date="2025-10-01", zipball_url="z"),
+            releases=[],
+            tags=[GitHubTag(tag_name=tag_name, commit_hash="b" * 40, zipball_url="z1", committed_date="2025-10-01")],
+        )
+
+    set_releases_metadata_cache("org", "beta", make_releases("v1"))
+    first = get_releases_metadata_cache("org", "beta")
+    assert get_releases_metadata_cache("org", "beta") is first
+
+    set_releases_metadata_cache("org", "beta", make_releases("v10"))
+    assert get_releases_metadata_cache("org", "beta").tags[0].tag_name == "v10"
+
+
+def test_releases_metadata_cache_skips_validation_only_when_trusted(temp_hcli_cache_dir, monkeypatch):
+    releases = GitHubReleases(
+        default_branch=GitHubCommit(commit_hash="a" * 40, committed_date="2025-10-01", zipball_url="z"),
+        releases=[],
+        tags=[GitHubTag(tag_name="v1", commit_hash="b" * 40, zipball_url="z1", committed_date="2025-10-01")],
+    )
+    set_releases_metadata_cache("org", "alpha", releases)
+
+    validated = []
+    real_model_validate_json = GitHubReleases.model_validate_json
+
+    def model_validate_json(buf):
+        validated.append(buf)
+        return real_model_validate_json(buf)
+
+    monkeypatch.setattr(GitHubReleases, "model_validate_json", model_validate_json)
+
+    assert get_releases_metadata_cache("org", "alpha") == releases
+    assert not validated
+
+    # a cache written by another version (no sentinel) is validated.
+    (get_cache_directory("org", "alpha") / "releases.version").unlink()
+    hcli.lib.ida.plugin.repo.github._load_releases_metadata_cache.cache_clear()
+    assert get_releases_metadata_cache("org", "alpha") == releases
+    assert len(validated) == 1
+
+
+def mock_github_transport(monkeypatch, handler) -> None:
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(hcli.lib.ida.plugin.repo.github, "_get_github_http_client", lambda: client)
+
+
+def test_github_requests_share_one_client():
+    get_client = hcli.lib.ida.plugin.repo.github._get_github_http_client
+    assert get_client() is get_client()
+
+
+def test_open_with_retry_closes_streamed_response(monkeypatch):
+    mock_github_transport(monkeypatch, lambda request: httpx.Response(200, content=request.url.path.encode()))
+
+    with _open_with_retry("GET", "https://example.com/one") as first:
+        assert first.read() == b"/one"
+    with _open_with_retry("GET", "https://example.com/two") as second:
+        assert second.read() == b"/two"
+
+    assert first.is_closed
+    assert second.is_closed
+
+
+def make_expired_releases_cache(owner: str, repo: str, etags: dict[str, str]) -> GitHubReleases:
+    releases = GitHubReleases(
+        default_branch=GitHubCommit(commit_hash="0" * 40, committed_date="2025-10-01", zipball_url=""),
+        releases=[],
+        tags=[],
+    )
+    set_releases_metadata_cache(owner, repo, releases)
+    set_releases_metadata_etags(owner, repo, etags)
+    os.utime(get_cache_directory(owner, repo) / "releases.json", (0, time.time() - 2 * 24 * 60 * 60))
+    return releases
+
+
+def test_expired_releases_cache_renewed_when_unchanged(temp_hcli_cache_dir, monkeypatch):
+    releases = make_expired_releases_cache("org", "alpha", {"releases": '"r1"', "tags": '"t1"'})
+    with pytest.raises(KeyError):
+        get_releases_metadata_cache("org", "alpha")
+
+    requests = []
+
+    def handler(request):
+        requests.append((request.url.path, request.headers.get("If-None-Match")))
+        return httpx.Response(304, headers={"ETag": request.headers["If-None-Match"]})
+
+    mock_github_transport(monkeypatch, handler)
+    client = GitHubGraphQLClient("token")
+    monkeypatch.setattr(client, "get_many_releases", None)
+
+    warm_releases_metadata_cache(client, [("org", "alpha")])
+
+    assert requests == [("/repos/org/alpha/releases", '"r1"'), ("/repos/org/alpha/tags", '"t1"')]
+    assert get_releases_metadata_cache("org", "alpha") == releases
+
+
+def test_expired_releases_cache_refetched_when_changed(temp_hcli_cache_dir, monkeypatch):
+    make_expired_releases_cache("org", "alpha", {"releases": '"r1"', "tags": '"t1"'})
+
+    def handler(request):
+        if request.url.path.endswith("/tags"):
+            return httpx.Response(304, headers={"ETag": '"t1"'})
+        return httpx.Response(200, content=b"[]", headers={"ETag": '"r2"'})
+
+    mock_github_transport(monkeypatch, handler)
+    client = GitHubGraphQLClient("token")
+    fetched = GitHubReleases(
+        default_branch=GitHubCommit(commit_hash="1" * 40, committed_date="2025-10-02", zipball_url=""),
+        releases=[],
+        tags=[],
+    )
+    monkeypatch.setattr(client, "get_many_releases", lambda repos: dict.fromkeys(repos, fetched))
+
+    warm_releases_metadata_cache(client, [("org", "alpha")])
+
+    assert get_releases_metadata_cache("org", "alpha") == fetched
+    assert get_releases_metadata_etags("org", "alpha") == {"releases": '"r2"', "tags": '"t1"'}
+
+
+def test_graphql_query_round_trips_json(monkeypatch):
+    requests = []
+
+    def handler(request):
+        requests.append(json.loads(request.content))
+        return httpx.Response(
+            200,
+            content=b'{"data": {"repo0": {"name": "t\\u00ebst"}}, "errors": [{"type": "NOT_FOUND", "message": "gone"}]}',
+        )
+
+    mock_github_transport(monkeypatch, handler)
+
+    data = GitHubGraphQLClient("token").query("query { x }", {"first": 1})
+
+    assert requests == [{"query": "query { x }", "variables": {"first": 1}}]
+    assert data == {"repo0": {"name": "tëst"}}
+
+
+def test_get_source_archive_streams_into_cache(temp_hcli_cache_dir, monkeypatch):
+    buf = os.urandom(3 * 1024 * 1024 + 17)
+    mock_github_transport(monkeypatch, lambda request: httpx.Response(200, content=buf))
+
+    archive = get_source_archive("org", "alpha", "c" * 40, "https://example.com/source.zip")
+    assert isinstance(archive, MappedPluginArchive)
+    assert archive[:] == buf
+
+    cache_dir = get_cache_directory("org", "alpha", "source-archives", "c" * 40)
+    assert [p.name for p in cache_dir.iterdir()] == ["source.zip"]
+
+    # now served from the cache
+    monkeypatch.setattr(hcli.lib.ida.plugin.repo.github, "_get_github_http_client", None)
+    assert get_source_archive("org", "alpha", "c" * 40, "https://example.com/source.zip")[:] == buf
+
+
+def test_interrupted_download_leaves_no_cache_entry(temp_hcli_cache_dir, monkeypatch):
+    class BrokenStream(httpx.SyncByteStream):
+        def __iter__(self):
+            yield os.urandom(2 * 1024 * 1024)
+            raise httpx.ReadError("connection reset")
+
+    mock_github_transport(monkeypatch, lambda request: httpx.Response(200, stream=BrokenStream()))
+
+    with pytest.raises(httpx.ReadError):
+        get_source_archive("org", "alpha", "d" * 40, "https://example.com/source.zip")
+
+    assert not list(get_cache_directory("org", "alpha", "source-archives", "d" * 40).iterdir())
+
+
+def test_oversized_source_archive_is_abandoned_while_streaming(temp_hcli_cache_dir, monkeypatch):
+    monkeypatch.setattr(hcli.lib.ida.plugin.repo.github, "MAX_DOWNLOAD_SIZE", 2 * 1024 * 1024)
+    sent = []
+
+    class EndlessStream(httpx.SyncByteStream):
+        def __iter__(self):
+            while True:
+                sent.append(1)
+                yield bytes(1024 * 1024)
+
+    mock_github_transport(monkeypatch, lambda request: httpx.Response(200, stream=EndlessStream()))
+
+    with pytest.raises(ValueError):
+        get_source_archive("org", "alpha", "e" * 40, "https://example.com/source.zip")
+
+    assert len(sent) == 3
+    assert not list(get_cache_directory("org", "alpha", "source-archives", "e" * 40).iterdir())
+
+
+def test_index_plugin_archive_reads_mapped_archive(tmp_path):
+    src = PLUGINS_DIR / "plugin1" / "plugin1-v1.0.0.zip"
+    z = make_plugin_zip(src, tmp_path / "alpha.zip", new_name="alpha")
+
+    from_bytes = PluginArchiveIndex()
+    from_bytes.index_plugin_archive(z.read_bytes(), "https://example.com/alpha.zip")
+    from_map = PluginArchiveIndex()
+    with MappedPluginArchive.open(z) as archive:
+        from_map.index_plugin_archive(archive, "https://example.com/alpha.zip")
+
+    assert from_map.get_plugins() == from_bytes.get_plugins()
+
+
+def test_read_archive_metadatas_in_worker_process(tmp_path):
+    src = PLUGINS_DIR / "plugin1" / "plugin1-v1.0.0.zip"
+    z = make_plugin_zip(src, tmp_path / "alpha.zip", new_name="alpha")
+    expected = PluginArchiveIndex().get_archive_metadatas(z.read_bytes())
+
+    # archives are sent by path, and mapped by the worker.
+    with hcli.lib.ida.plugin.repo.github._get_archive_parse_pool() as pool:
+        sha256, metadatas = pool.submit(_read_archive_metadatas, z).result()
+
+    assert sha256 == expected[0]
+    assert [(path, md.model_dump(mode="json")) for path, md in metadatas] == [
+        (path, md.model_dump(mode="json")) for path, md in expected[1]
+    ]
+
+
+def test_github_get_plugins_reuses_persisted_archive_metadata(temp_hcli_cache_dir, tmp_path, monkeypatch):
+    src = PLUGINS_DIR / "plugin1" / "plugin1-v1.0.0.zip"
+    z = make_plugin_zip(src, tmp_path / "alpha.zip", new_name="alpha", new_repository="https://github.com/org/alpha")
+    releases = GitHubReleases(
+        default_branch=GitHubCommit(commit_hash="0" * 40, committed_date="2025-10-01", zipball_url=""),
+        releases=[],
+        tags=[
+            GitHubTag(
+                tag_name="v1", commit_hash="1" * 40, zipball_url="https://example.com/v1", committed_date="2025-10-01"
+            )
+        ],
+    )
+    monkeypatch.setattr(hcli.lib.ida.plugin.repo.github, "get_releases_metadata", lambda client, o, r: releases)
+    mock_github_transport(monkeypatch, lambda request: httpx.Response(200, content=z.read_bytes()))
+
+    first = make_offline_github_repo(monkeypatch, [("org", "alpha")]).get_plugins()
+    assert [plugin.name for plugin in first] == ["alpha"]
+
+    # later runs don't read the archive at all.
+    def fail(*args):
+        raise AssertionError("archive should not be read again")
+
+    monkeypatch.setattr(hcli.lib.ida.plugin.repo, "_open_plugin_archive", fail)
+    monkeypatch.setattr(hcli.lib.ida.plugin.repo.github, "get_source_archive_path", fail)
+
+    # compared as serialized, since ida_versions are only put in order when serialized.
+    second = make_offline_github_repo(monkeypatch, [("org", "alpha")]).get_plugins()
+    assert [plugin.model_dump(mode="json") for plugin in second] == [plugin.model_dump(mode="json") for plugin in first]
+
+    # but a changed archive is parsed again.
+    archive_path = get_cache_directory("org", "alpha", "source-archives", "1" * 40) / "source.zip"
+    os.utime(archive_path, ns=(0, 0))
+    with pytest.raises(AssertionError):
+        make_offline_github_repo(monkeypatch, [("org", "alpha")]).get_plugins()
+
+
+def test_get_many_releases_passes_repositories_as_variables(monkeypatch):
+    client = GitHubGraphQLClient("token")
+    queries = []
+
+    def query(text, variables):
+        queries.append((text, variables))
+        return {}
+
+    monkeypatch.setattr(client, "query", query)
+
+    client.get_many_releases([("org", "alpha"), ("org", 'be"ta')])
+    client.get_many_releases([("other", "gamma"), ("other", "delta")])
+
+    (first_text, first_variables), (second_text, second_variables) = queries
+    assert first_text is second_text
+    assert "alpha" not in first_text
+    assert first_variables == {"first": 10, "owner0": "org", "name0": "alpha", "owner1": "org", "name1": 'be"ta'}
+    assert second_variables["name1"] == "delta"
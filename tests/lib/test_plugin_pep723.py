@@ -38,6 +38,10 @@ def test_parse_pep723_metadata():
     dependencies = parse_pep723_metadata(python_content)
     assert dependencies == ["packaging>=25.0", "rich>=13.0.0"]
 
+    # no metadata block
+    assert parse_pep723_metadata("import ida_idaapi\n\ndef PLUGIN_ENTRY():\n    return None\n") == []
+    assert parse_pep723_metadata("# /// script\n# dependencies = []\n") == []
+
 
 def test_source_plugin_archive_v4_inline_dependencies():
     """Test that plugin v4 with inline dependencies is recognized as source plugin."""
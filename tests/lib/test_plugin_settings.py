@@ -12,6 +12,8 @@ from fixtures import (
     temp_env_var,
 )
 
+from hcli.lib.ida.plugin.settings import _find_plugin_directory_name
+
 logger = logging.getLogger(__name__)
 
 
@@ -152,3 +154,19 @@ def test_plugin_with_falsy_default_installs_noninteractive(virtual_ida_environme
         assert "enabled" in p.stdout and "false (default)" in p.stdout
 
         _ = run_hcli(f"plugin --repo {PLUGINS_DIR.absolute()} uninstall plugin1")
+
+
+def test_find_plugin_directory_name_through_symlinks(tmp_path):
+    real_plugins = tmp_path / "real-plugins"
+    real_plugins.mkdir()
+    (tmp_path / "idausr").mkdir()
+    plugins = tmp_path / "idausr" / "plugins"
+    plugins.symlink_to(real_plugins, target_is_directory=True)
+    source = tmp_path / "src" / "myplugin"
+    source.mkdir(parents=True)
+    (real_plugins / "myplugin").symlink_to(source, target_is_directory=True)
+
+    # imported through the plugins directory, or its resolved form
+    assert _find_plugin_directory_name(plugins, str(plugins / "myplugin" / "main.py")) == "myplugin"
+    assert _find_plugin_directory_name(plugins, str(real_plugins / "myplugin" / "main.py")) == "myplugin"
+    assert _find_plugin_directory_name(plugins, str(tmp_path / "elsewhere.py")) is None